@@ -0,0 +1,87 @@
+"""
+Batched vs per-tool company analysis: prompt tokens and simulated wall time.
+
+No network: a fake structured LLM sleeps for a fixed request overhead plus a
+per-output-token cost, which is how a hosted model behaves to first order.
+Output tokens of one call are generated serially, so big batches save input
+tokens but can get slower than the parallel per-tool fan-out.
+
+    python -m benchmarks.bench_batched_analysis
+"""
+from __future__ import annotations
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Nothing is sent anywhere; the clients just need a key to construct.
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("FIRECRAWL_API_KEY", "bench-key")
+
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+NUM_TOOLS = 4
+CONTENT_CHARS = 2500
+REQUEST_OVERHEAD_S = 0.4
+OUTPUT_TOKENS_PER_TOOL = 350
+SECONDS_PER_OUTPUT_TOKEN = 0.002
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+class SimulatedLLM:
+    def __init__(self) -> None:
+        self.input_tokens = 0
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        outer = self
+
+        class _Structured:
+            def invoke(self, messages):
+                outer.calls += 1
+                outer.input_tokens += sum(estimate_tokens(m.content) for m in messages)
+                fields = schema.model_fields
+                if "analyses" in fields:
+                    named = fields["analyses"].annotation.__args__[0]
+                    prompt = messages[-1].content
+                    names = [
+                        line.split(": ", 1)[1].rstrip(" =")
+                        for line in prompt.splitlines()
+                        if line.startswith("=== Tool ")
+                    ]
+                    output_s = len(names) * OUTPUT_TOKENS_PER_TOOL * SECONDS_PER_OUTPUT_TOKEN
+                    time.sleep(REQUEST_OVERHEAD_S + output_s)
+                    return schema(analyses=[named(company_name=n, description=n) for n in names])
+                time.sleep(REQUEST_OVERHEAD_S + OUTPUT_TOKENS_PER_TOOL * SECONDS_PER_OUTPUT_TOKEN)
+                return schema(description="single")
+
+        return _Structured()
+
+
+def run(batch_size: int) -> tuple[int, int, float]:
+    wf = DeveloperToolsWorkflow()
+    wf.llm = SimulatedLLM()
+    wf.analysis_batch_size = batch_size
+    items = [(f"Tool{i}", ("lorem ipsum " * 400)[:CONTENT_CHARS]) for i in range(NUM_TOOLS)]
+    chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+        list(executor.map(wf._analyze_companies_batch, chunks))
+    elapsed = time.perf_counter() - start
+    return wf.llm.calls, wf.llm.input_tokens, elapsed
+
+
+def main() -> None:
+    print(f"{NUM_TOOLS} tools, {CONTENT_CHARS} chars each")
+    print(f"{'batch':>5} {'calls':>5} {'input tok':>10} {'wall s':>7}")
+    for batch_size in (1, 2, 4):
+        calls, tokens, elapsed = run(batch_size)
+        print(f"{batch_size:>5} {calls:>5} {tokens:>10} {elapsed:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Career deep mode: sequential graph vs knowledge extraction fanned out beside
+tool extraction + research.
+
+No network: every LLM/Firecrawl-bound step is replaced by a fixed sleep taken
+from rough production timings, so only the graph topology decides wall time.
+
+    python -m benchmarks.bench_career_fanout
+"""
+from __future__ import annotations
+
+import os
+import time
+
+# Nothing is sent anywhere; the clients just need a key to construct.
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("FIRECRAWL_API_KEY", "bench-key")
+
+from langgraph.graph import END, StateGraph
+
+from src.advanced_agent.topics.career.job_search.workflow import JobSearchWorkflow
+from src.advanced_agent.topics.knowledge_extraction import KnowledgeExtractionResult
+
+COLLECT_S = 0.4
+EXTRACT_TOOLS_S = 0.3
+RESEARCH_S = 0.8
+EXTRACT_KNOWLEDGE_S = 0.6
+ANALYZE_S = 0.4
+RUNS = 3
+
+
+class SimulatedCareerWorkflow(JobSearchWorkflow):
+    def _collect_articles_step(self, state):
+        time.sleep(COLLECT_S)
+        return {"aggregated_markdown": "articles", "sources": []}
+
+    def _extract_tools_step(self, state):
+        time.sleep(EXTRACT_TOOLS_S)
+        return {"extracted_tools": ["LinkedIn"]}
+
+    def _research_step(self, state):
+        time.sleep(RESEARCH_S)
+        return {"companies": [self.info_cls(name="LinkedIn", description="", website="")]}
+
+    def _extract_knowledge_step(self, state):
+        time.sleep(EXTRACT_KNOWLEDGE_S)
+        return {"knowledge": KnowledgeExtractionResult()}
+
+    def _analyze_step(self, state):
+        time.sleep(ANALYZE_S)
+        return {}
+
+
+class SequentialCareerWorkflow(SimulatedCareerWorkflow):
+    """The pre-fan-out topology: every step waits for the previous one."""
+
+    def _build_workflow(self):
+        graph = StateGraph(self.state_cls)
+        steps = [
+            ("interpret_query", self._interpret_query_step),
+            ("collect_articles", self._collect_articles_step),
+            ("extract_tools", self._extract_tools_step),
+            ("research", self._research_step),
+            ("extract_knowledge", self._extract_knowledge_step),
+            ("analyze", self._analyze_step),
+            ("generate_analysis", self._generate_analysis_step),
+        ]
+        for name, fn in steps:
+            graph.add_node(name, fn)
+        graph.set_entry_point(steps[0][0])
+        for (a, _), (b, _) in zip(steps, steps[1:]):
+            graph.add_edge(a, b)
+        graph.add_edge(steps[-1][0], END)
+        return graph.compile()
+
+
+def best_of(wf_cls) -> float:
+    wf = wf_cls()
+    best = float("inf")
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        wf.run("best remote job boards", fast_mode=False)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    sequential = best_of(SequentialCareerWorkflow)
+    fanout = best_of(SimulatedCareerWorkflow)
+    print(f"{'graph':>10} {'wall s':>7}")
+    print(f"{'sequential':>10} {sequential:>7.2f}")
+    print(f"{'fan-out':>10} {fanout:>7.2f}")
+    print(f"saved {sequential - fanout:.2f}s ({(1 - fanout / sequential) * 100:.0f}%)")
+
+
+if __name__ == "__main__":
+    main()
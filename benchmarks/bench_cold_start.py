@@ -0,0 +1,59 @@
+"""
+Server cold start: lazy workflow registry vs building every topic up front.
+
+Each scenario runs in a fresh interpreter, so module imports are included
+and nothing is shared between runs. "eager" reproduces the old startup:
+every LLM provider package imported and all workflows built at import time.
+
+    python -m benchmarks.bench_cold_start
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+RUNS = 3
+
+SCENARIO = r"""
+import json, os, resource, time
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("FIRECRAWL_API_KEY", "bench-key")
+start = time.perf_counter()
+from src.advanced_agent.api import deps
+imported = time.perf_counter() - start
+mode = os.environ["BENCH_MODE"]
+if mode == "eager":
+    import langchain_anthropic, langchain_deepseek, langchain_google_genai
+    for key in deps.TOPIC_KEYS:
+        deps.TOPIC_WORKFLOWS[key]
+elif mode == "first_request":
+    deps.TOPIC_WORKFLOWS["developer_tools"]
+ready = time.perf_counter() - start
+rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+print(json.dumps({"import": imported, "ready": ready, "rss_mb": rss_mb,
+                  "built": len(deps.TOPIC_WORKFLOWS.built_keys())}))
+"""
+
+
+def run(mode: str) -> dict:
+    env = dict(os.environ, BENCH_MODE=mode)
+    results = []
+    for _ in range(RUNS):
+        out = subprocess.run(
+            [sys.executable, "-c", SCENARIO], env=env, capture_output=True, text=True, check=True
+        ).stdout
+        results.append(json.loads(out.strip().splitlines()[-1]))
+    return min(results, key=lambda r: r["ready"])
+
+
+def main() -> None:
+    print(f"{'mode':>13} {'import s':>8} {'ready s':>7} {'max RSS MB':>10} {'built':>5}")
+    for mode in ("eager", "lazy", "first_request"):
+        r = run(mode)
+        print(f"{mode:>13} {r['import']:>8.2f} {r['ready']:>7.2f} {r['rss_mb']:>10.0f} {r['built']:>5}")
+
+
+if __name__ == "__main__":
+    main()
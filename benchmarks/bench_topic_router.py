@@ -0,0 +1,174 @@
+"""
+Local topic classifier: accuracy, coverage and latency vs the LLM router.
+
+Labeled queries below are hand-written and do not appear in the topic
+descriptions. The LLM router is not called; its cost is modelled as a fixed
+latency plus the size of its system prompt, so the table shows what each
+confidence threshold saves and how accurate the locally-routed share is.
+
+The second table replays half of the queries as if the LLM had routed them
+(the route log) and evaluates on the other half.
+
+    python -m benchmarks.bench_topic_router
+"""
+from __future__ import annotations
+
+import os
+import statistics
+import time
+
+# Nothing is sent anywhere; the clients just need a key to construct.
+os.environ.setdefault("OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("FIRECRAWL_API_KEY", "bench-key")
+
+from src.advanced_agent.api.topic_classifier import LocalTopicClassifier
+from src.advanced_agent.topics.registry import TOPIC_CONFIGS
+
+LLM_ROUTER_LATENCY_S = 0.9
+THRESHOLDS = (0.5, 0.6, 0.7, 0.75, 0.8, 0.9)
+
+LABELED_QUERIES = [
+    ("Best Python IDE for data science", "developer_tools"),
+    ("Neovim vs Emacs for a Rust developer", "developer_tools"),
+    ("Good debugger for Node.js apps", "developer_tools"),
+    ("Which Git client should I use on Windows?", "developer_tools"),
+    ("HubSpot vs Pipedrive for a small sales team", "saas"),
+    ("Best helpdesk software for a 20-person support team", "saas"),
+    ("Alternatives to Workday for HR", "saas"),
+    ("Twilio vs Vonage for SMS", "api"),
+    ("Best geocoding API for a delivery app", "api"),
+    ("Which email sending API has the best deliverability?", "api"),
+    ("Claude vs GPT-4 for customer support bots", "ai_ml"),
+    ("Best MLOps platform for model monitoring", "ai_ml"),
+    ("Pinecone vs Weaviate vs Qdrant", "ai_ml"),
+    ("Okta alternatives for a startup", "security"),
+    ("Best SAST tool for a Java codebase", "security"),
+    ("How to pick a WAF for my web app", "security"),
+    ("Azure vs AWS for enterprise workloads", "cloud"),
+    ("Cheapest way to host a Docker container", "cloud"),
+    ("Vercel vs Netlify vs Render", "cloud"),
+    ("MongoDB vs PostgreSQL for a social app", "database"),
+    ("Best time series database for IoT metrics", "database"),
+    ("ClickHouse vs Druid for analytics", "database"),
+    ("Apps like Meetup for finding local groups", "consumer_and_social"),
+    ("Best dating apps in 2025", "consumer_and_social"),
+    ("Instagram alternatives for photographers", "consumer_and_social"),
+    ("Best website builder for a small restaurant", "content_and_website"),
+    ("Ghost vs WordPress for a newsletter blog", "content_and_website"),
+    ("Wix alternatives", "content_and_website"),
+    ("Canva vs Adobe Express", "design"),
+    ("Best prototyping tool for UX designers", "design"),
+    ("Figma alternatives that work offline", "design"),
+    ("Best platform to sell handmade goods online", "e_commerce"),
+    ("BigCommerce vs Shopify Plus", "e_commerce"),
+    ("Checkout tools for a small online store", "e_commerce"),
+    ("OneDrive vs iCloud for family photo backup", "file_storage"),
+    ("Secure file sharing for a law firm", "file_storage"),
+    ("Best cloud backup for a small office", "file_storage"),
+    ("Discord vs Slack for an open source community", "messaging"),
+    ("Most private messaging app", "messaging"),
+    ("Zoom alternatives for team calls", "messaging"),
+    ("Todoist vs TickTick", "productivity"),
+    ("Best note taking app for students", "productivity"),
+    ("Calendar apps for scheduling across time zones", "productivity"),
+    ("Lyft vs Uber for airport rides", "transportation"),
+    ("Best bike sharing apps in Paris", "transportation"),
+    ("Car rental apps for road trips", "transportation"),
+    ("Tools to make my resume pass ATS filters", "resume_tools"),
+    ("Best resume builder for software engineers", "resume_tools"),
+    ("Resume Worded vs Teal", "resume_tools"),
+    ("Where to find remote frontend jobs?", "job_search"),
+    ("Indeed vs Glassdoor for job hunting", "job_search"),
+    ("Job boards for startups hiring engineers", "job_search"),
+    ("Best online courses to learn Kubernetes", "learning_platform"),
+    ("Coursera vs Udemy for machine learning", "learning_platform"),
+    ("Roadmap to become a data engineer", "learning_platform"),
+    ("NeetCode vs AlgoExpert", "coding_interview"),
+    ("How to practice dynamic programming problems for interviews", "coding_interview"),
+    ("Best sites for mock coding interviews", "coding_interview"),
+    ("Grokking the system design interview alternatives", "system_design"),
+    ("How to prepare for a senior system design interview at Google", "system_design"),
+    ("Mock system design interview platforms with feedback", "system_design"),
+    ("How do I answer tell me about a time you failed?", "behavioral_interview"),
+    ("Apps for practicing behavioral interviews with AI", "behavioral_interview"),
+    ("Career coaching for engineering managers", "behavioral_interview"),
+    ("How should I design a URL shortener that handles 50k requests per second?", "architecture_design"),
+    ("Microservices vs monolith for an early-stage startup", "architecture_design"),
+    ("How to architect an event-driven order processing system with Kafka", "architecture_design"),
+    ("Best way to shard a database for a multi-tenant SaaS", "architecture_design"),
+    ("How do I reduce technical debt in a large Java monolith?", "code_quality"),
+    ("ESLint vs Biome for a TypeScript project", "code_quality"),
+    ("How to enforce consistent code style across teams", "code_quality"),
+    ("How to write integration tests for a Django REST API", "testing"),
+    ("Playwright vs Cypress for end-to-end tests", "testing"),
+    ("How much unit test coverage is enough?", "testing"),
+    ("How to run effective sprint retrospectives", "agile"),
+    ("Jira vs Linear for a Scrum team", "agile"),
+    ("How to estimate story points", "agile"),
+    ("Jenkins vs CircleCI", "cicd"),
+    ("How to set up blue-green deployments in my pipeline", "cicd"),
+    ("Speed up slow GitHub Actions builds", "cicd"),
+]
+
+
+def llm_prompt_tokens() -> int:
+    topic_list_text = "\n".join(
+        f"- {cfg.label} (domain: {cfg.domain}): {cfg.description}" for cfg in TOPIC_CONFIGS.values()
+    )
+    # Topic list plus ~2.4k chars of rules/examples, chars/4 per token.
+    return (len(topic_list_text) + 2400) // 4
+
+
+def report(classifier: LocalTopicClassifier, queries) -> None:
+    predictions = []
+    timings = []
+    for query, expected in queries:
+        start = time.perf_counter()
+        prediction = classifier.predict(query)
+        timings.append(time.perf_counter() - start)
+        predictions.append((prediction, expected))
+
+    accuracy = sum(p.key == e for p, e in predictions) / len(predictions)
+    timings_us = sorted(t * 1e6 for t in timings)
+    print(
+        f"{len(queries)} queries, top-1 accuracy {accuracy:.0%}, "
+        f"latency median {statistics.median(timings_us):.0f}us p95 {timings_us[int(0.95 * len(timings_us))]:.0f}us"
+    )
+    print(f"{'thresh':>6} {'local':>6} {'local acc':>9} {'LLM calls':>9} {'mean route s':>12}")
+    for threshold in THRESHOLDS:
+        local = [(p, e) for p, e in predictions if p.confidence >= threshold]
+        local_accuracy = sum(p.key == e for p, e in local) / max(len(local), 1)
+        llm_share = 1 - len(local) / len(predictions)
+        print(
+            f"{threshold:>6.2f} {len(local) / len(predictions):>6.0%} {local_accuracy:>9.0%} "
+            f"{llm_share:>9.0%} {llm_share * LLM_ROUTER_LATENCY_S:>12.2f}"
+        )
+
+
+def main() -> None:
+    print(f"LLM router: ~{llm_prompt_tokens()} prompt tokens, ~{LLM_ROUTER_LATENCY_S}s per query")
+
+    classifier = LocalTopicClassifier(TOPIC_CONFIGS, log_path=None)
+    start = time.perf_counter()
+    classifier.fit()
+    print(f"fit: {time.perf_counter() - start:.2f}s")
+    print("\n-- descriptions only --")
+    report(classifier, LABELED_QUERIES)
+
+    logged, held_out = LABELED_QUERIES[::2], LABELED_QUERIES[1::2]
+    routes = [(q, k) for q, k in logged]
+
+    class LoggedClassifier(LocalTopicClassifier):
+        def training_examples(self):
+            return super().training_examples() + routes
+
+    with_log = LoggedClassifier(TOPIC_CONFIGS, log_path=None)
+    with_log.fit()
+    print("\n-- held-out half, descriptions only --")
+    report(classifier, held_out)
+    print("\n-- held-out half, descriptions + route log of the other half --")
+    report(with_log, held_out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+# src/api/data/messages_zh.py
+# Generated by `python -m src.advanced_agent.api.message_catalog --write`;
+# entries can be edited by hand. {0}, {1}, ... are the interpolated values.
+from typing import Dict
+
+MESSAGES_ZH: Dict[str, str] = {
+    "AI & ML Platforms": "AI 与机器学习平台",
+    "API Platforms": "API 平台",
+    "Agile Tools": "敏捷工具",
+    "Analysis error for {0}: {1}": "{0} 分析出错：{1}",
+    "Analyzing {0} tools in {1} batched LLM call(s).": "正在通过 {1} 次批量 LLM 调用分析 {0} 个工具。",
+    "Architecture Design Suggestions": "架构设计建议",
+    "Batched analysis missed {0}/{1} tools; analyzing them one by one.": "批量分析遗漏了 {0}/{1} 个工具，正在逐个分析。",
+    "Behavioral Interview & Coaching Tools": "行为面试与辅导工具",
+    "Building final markdown report for software engineering topic...": "正在生成软件工程主题的最终 Markdown 报告...",
+    "CICD Tools": "CI/CD 工具",
+    "Checking: {0}": "正在检查：{0}",
+    "Cloud & Infrastructure": "云与基础设施",
+    "Code Quality Suggestions": "代码质量建议",
+    "Coding Interview Platforms": "编程面试平台",
+    "Collected {0} sources for career research.": "已为职业研究收集 {0} 个来源。",
+    "Collected {0} sources for tools research.": "已为工具研究收集 {0} 个来源。",
+    "Collecting multi-pass articles for software engineering topic... {0}": "正在为软件工程主题进行多轮文章收集... {0}",
+    "Consumer & Social Apps": "消费与社交应用",
+    "Content & Website Platforms": "内容与网站平台",
+    "Databases & Data Platforms": "数据库与数据平台",
+    "Design & Creative Tools": "设计与创意工具",
+    "Developer Tools": "开发者工具",
+    "Done checking: {0}": "检查完成：{0}",
+    "E-Commerce & Fintech / Payments": "电子商务与金融科技 / 支付",
+    "Entity resolution merged {0} ({1} redundant research job(s) avoided).": "实体解析合并了 {0}（避免了 {1} 个重复研究任务）。",
+    "Error generating structured recommendation: {0}": "生成结构化推荐时出错：{0}",
+    "Error while researching {0}: {1}": "研究 {0} 时出错：{1}",
+    "Extracted career platforms/resources: {0}": "已提取职业平台/资源：{0}",
+    "Extracted tools/platforms: {0}": "已提取工具/平台：{0}",
+    "Extraction error: {0}": "提取出错：{0}",
+    "Fast mode: single search for articles: {0}": "快速模式：单次搜索文章：{0}",
+    "Fast mode: skipping global knowledge extraction to save latency.": "快速模式：跳过全局知识提取以减少延迟。",
+    "Fast mode: skipping knowledge extraction.": "快速模式：跳过知识提取。",
+    "Fast mode: skipping summarization step.": "快速模式：跳过摘要步骤。",
+    "File Storage & Sync": "文件存储与同步",
+    "Finding articles/resources about: {0}": "正在查找相关文章/资源：{0}",
+    "Finding comparison articles/resources about: {0}": "正在查找对比文章/资源：{0}",
+    "Generating career action plan and recommendations": "正在生成职业行动计划和建议",
+    "Generating software engineering recommendation from resources + knowledge...": "正在根据资源和知识生成软件工程建议...",
+    "Interpreting query: {0}": "正在理解查询：{0}",
+    "Job Search Platforms & Market Analysis": "求职平台与市场分析",
+    "Knowledge extraction done: {0} entities, {1} relationships, {2} pros, {3} cons, {4} risks, {5} timeline items.": "知识提取完成：{0} 个实体、{1} 个关系、{2} 个优点、{3} 个缺点、{4} 个风险、{5} 个时间线条目。",
+    "Known site for {0} did not scrape ({1}); searching again.": "{0} 的已知网站抓取失败（{1}），正在重新搜索。",
+    "Learning Platforms & Skill Roadmaps": "学习平台与技能路线图",
+    "Messaging & Communication": "消息与通讯",
+    "Multi-pass search [pass {0}/{1}, n={2}]: {3}": "多轮搜索 [第 {0}/{1} 轮，n={2}]：{3}",
+    "Multi-pass search returned no content, falling back to single search.": "多轮搜索未返回内容，改用单次搜索。",
+    "Multi-pass search: yield target met after {0} pass(es), skipping {1} remaining.": "多轮搜索：{0} 轮后已达到收集目标，跳过剩余 {1} 轮。",
+    "Multi-pass yield curve: {0}": "多轮搜索收益曲线：{0}",
+    "No URL for {0}, skipping.": "{0} 没有 URL，已跳过。",
+    "No aggregated article content; doing fallback search to extract tool names.": "没有汇总的文章内容，正在进行备用搜索以提取工具名称。",
+    "No aggregated content available; skipping knowledge extraction.": "没有可用的汇总内容，跳过知识提取。",
+    "No aggregated content to extract platforms from; returning empty list.": "没有可用于提取平台的汇总内容，返回空列表。",
+    "No aggregated markdown available; skipping summarization.": "没有可用的汇总 Markdown，跳过摘要。",
+    "No aggregated markdown; skipping knowledge extraction.": "没有汇总 Markdown，跳过知识提取。",
+    "No companies found; skipping structured recommendation.": "未找到公司，跳过结构化推荐。",
+    "No content (markdown/scrape) for {0}, skipping analysis.": "{0} 没有内容（Markdown/抓取结果），跳过分析。",
+    "No platforms/resources extracted from content.": "未从内容中提取到平台/资源。",
+    "No tool names extracted from content.": "未从内容中提取到工具名称。",
+    "No web results for {0}": "{0} 没有网页搜索结果",
+    "Pass {0} yield: {1} results, +{2} new domains ({3} unique), +{4} chars": "第 {0} 轮收益：{1} 条结果，新增 {2} 个域名（共 {3} 个），新增 {4} 个字符",
+    "Primary choice from recommendation: {0}": "推荐的首选：{0}",
+    "Productivity & Organization": "效率与组织工具",
+    "Resume Optimization & ATS Tools": "简历优化与 ATS 工具",
+    "Running knowledge extraction...": "正在进行知识提取...",
+    "SaaS Products": "SaaS 产品",
+    "Security & Identity": "安全与身份认证",
+    "Still no content found to extract tool names from.": "仍未找到可提取工具名称的内容。",
+    "Sub-page crawl failed for {0}: {1}": "{0} 的子页面抓取失败：{1}",
+    "Successfully generated CareerActionPlan": "已成功生成职业行动计划",
+    "Summarization failed for {0}: {1}": "{0} 摘要失败：{1}",
+    "Summarized {0}/{1} resources into {2} key points.": "已将 {0}/{1} 个资源总结为 {2} 个要点。",
+    "Summarizing aggregated content into keywords / key points...": "正在将汇总内容总结为关键词/要点...",
+    "Summarizing {0} resources in parallel (max {1} at a time)...": "正在并行总结 {0} 个资源（最多同时 {1} 个）...",
+    "System Design Interview Platforms": "系统设计面试平台",
+    "Testing": "测试",
+    "Transportation & Mobility": "交通与出行",
+    "Triage failed ({0}); keeping extraction order.": "筛选失败（{0}），保持提取顺序。",
+    "error while researching {0}: {1}": "研究 {0} 时出错：{1}",
+    "multi-pass search error in pass {0}: {1}": "多轮搜索第 {0} 轮出错：{1}",
+    "multi-pass search pass {0}: no web results": "多轮搜索第 {0} 轮：没有网页结果",
+    "no content (markdown/scrape) for {0}, skipping analysis": "{0} 没有内容（Markdown/抓取结果），跳过分析",
+    "researching: {0}": "正在研究：{0}",
+    "{0} 🔬 Researching specific tools/products: {1}": "{0} 🔬 正在研究具体工具/产品：{1}",
+    "⏳ All {0} research slots for this topic are busy; waiting for one to free up...": "⏳ 该主题的 {0} 个研究名额均已占用，正在等待空闲...",
+    "⏳ Research queue is busy, you are number {0} in line...": "⏳ 研究队列繁忙，您目前排在第 {0} 位...",
+    "♻️ Reusing stored profile for {0} ({1}, {2}h old)": "♻️ 复用 {0} 的已存档案（{1}，{2} 小时前）",
+    "♻️ Served cached result from {0} min ago (add fresh=1 to recompute).": "♻️ 已使用 {0} 分钟前的缓存结果（添加 fresh=1 可重新研究）。",
+    "♻️ Served cached result from {0} min ago (add fresh=1 to recompute). ↪ {1}": "♻️ 已使用 {0} 分钟前的缓存结果（添加 fresh=1 可重新研究）。 ↪ {1}",
+    "⚠️ No extracted names found, falling back to direct search.": "⚠️ 未提取到名称，改为直接搜索。",
+    "⚠️ No extracted tools found, falling back to direct search": "⚠️ 未提取到工具，改为直接搜索",
+    "⚠️ The server is busy with this topic, please try again in a few minutes.": "⚠️ 服务器正忙于处理该主题，请几分钟后再试。",
+    "⚠️ The server is busy, please try again in a few minutes.": "⚠️ 服务器繁忙，请几分钟后再试。",
+    "⚡ Fast mode: quicker answer with lighter analysis.": "⚡ 快速模式：分析更轻量，回答更快。",
+    "❌ Error generating CareerActionPlan: {0}": "❌ 生成职业行动计划时出错：{0}",
+    "❌ Fallback recommendation error: {0}": "❌ 备用推荐出错：{0}",
+    "🎯 Starting career workflow for query: {0}": "🎯 开始职业研究流程，查询：{0}",
+    "📄 Read {0} page(s) for {1}": "📄 已读取 {1} 的 {0} 页面",
+    "🔍 Starting tool/product research for query: {0}": "🔍 开始工具/产品研究，查询：{0}",
+    "🔗 Known official site for {0}: {1}": "🔗 {0} 的已知官网：{1}",
+    "🔬 Researching specific resources: {0}": "🔬 正在研究具体资源：{0}",
+    "🔬 Researching: {0}": "🔬 正在研究：{0}",
+    "🧠 Deep Thinking: multi-pass research and knowledge extraction enabled.": "🧠 深度思考：已启用多轮研究与知识提取。",
+}
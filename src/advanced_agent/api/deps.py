@@ -1,5 +1,8 @@
 # src/api/deps.py
-from typing import Tuple
+import os
+import threading
+from collections import Counter
+from typing import List, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import SystemMessage, HumanMessage
@@ -10,8 +13,10 @@ from ..topics.registry import (
     get_topic_labels,
     TOPIC_CONFIGS,
 )
+from ..history.store import list_history
+from .topic_classifier import LocalTopicClassifier
 
-# Build workflows & topic metadata once at import time
+# Topic metadata at import time; each workflow is built on first use.
 TOPIC_WORKFLOWS = build_workflows()
 TOPIC_LABELS = get_topic_labels()
 TOPIC_DESCRIPTIONS = get_topic_descriptions()
@@ -20,12 +25,92 @@ TOPIC_KEYS = list(TOPIC_CONFIGS.keys())
 # LLM used for classification (small, deterministic)
 topic_classifier_llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0)
 
+# Local router tried first; the LLM is only asked when it is unsure.
+TOPIC_CLASSIFIER = LocalTopicClassifier(TOPIC_CONFIGS)
 
-def classify_topic_with_llm(query: str) -> Tuple[str, str, str]:
+# How many of the most-asked topics to build in the background at startup.
+PREWARM_TOPIC_COUNT = int(os.getenv("TOPIC_PREWARM_COUNT", "3"))
+
+
+def popular_topic_keys(n: int, history_limit: int = 200) -> List[str]:
     """
-    Returns (key, label)
-    - key: internal name (e.g. 'database')
-    - label: user-facing display (e.g. 'Databases & Data Platforms')
+    The n topics asked most often in recent history; the chat fallback topic
+    (developer_tools) when there is no usable history yet.
+    """
+    if n <= 0:
+        return []
+    label_to_key = {label: key for key, label in TOPIC_LABELS.items()}
+    counts = Counter(
+        label_to_key[e["topic"]]
+        for e in list_history(limit=history_limit)
+        if e.get("topic") in label_to_key
+    )
+    return [key for key, _ in counts.most_common(n)] or ["developer_tools"]
+
+
+def prewarm(n: int = PREWARM_TOPIC_COUNT) -> threading.Thread:
+    """
+    Fit the local topic classifier and build the n most popular workflows in
+    a daemon thread, so the first chats don't pay for them.
+    """
+
+    def _warm() -> None:
+        try:
+            TOPIC_CLASSIFIER.predict("warm up")
+        except Exception as e:
+            print(f"[TopicClassifier] warm-up failed: {e}")
+        TOPIC_WORKFLOWS.prewarm(popular_topic_keys(n), background=False)
+
+    thread = threading.Thread(target=_warm, name="startup-prewarm", daemon=True)
+    thread.start()
+    return thread
+
+
+def _topic_tuple(key: str) -> Tuple[str, str, str]:
+    cfg = TOPIC_CONFIGS[key]
+    return key, cfg.label, cfg.domain
+
+
+def _apply_routing_rules(query: str, key: str) -> str:
+    """
+    Safety net: fix the common misroute of real architecture questions to
+    System Design Interview Platforms.
+    """
+    normalized_query = query.lower()
+
+    looks_like_real_arch_question = any(
+        kw in normalized_query
+        for kw in [
+            "rps", "requests per second", "throughput", "latency",
+            "eventual consistency", "strong consistency",
+            "microservice", "micro-services", "event-driven",
+            "message queue", "kafka", "rabbitmq",
+            "load balancer", "sharding", "replication",
+        ]
+    )
+    looks_like_interview_prep = any(
+        kw in normalized_query
+        for kw in [
+            "interview", "interviews", "mock interview", "mock system design",
+            "prep", "preparation", "practice platform", "practice site",
+            "course", "bootcamp", "coaching",
+        ]
+    )
+
+    if (
+        key == "system_design"
+        and looks_like_real_arch_question
+        and not looks_like_interview_prep
+    ):
+        # Force route to architecture design if semantics clearly match
+        return "architecture_design"
+    return key
+
+
+def _llm_topic_key(query: str) -> Optional[str]:
+    """
+    Ask the LLM router for a category label; returns the matching topic key,
+    or None if the answer matches no label. Raises on API errors.
     """
     topic_list_text = "\n".join(
         f"- {cfg.label} (domain: {cfg.domain}): {cfg.description}"
@@ -77,54 +162,64 @@ def classify_topic_with_llm(query: str) -> Tuple[str, str, str]:
         HumanMessage(content=f"User query: {query}"),
     ]
 
-    try:
-        response = topic_classifier_llm.invoke(messages)
-        label = response.content.strip()
-
-        # --- Safety net: fix common misroute for architecture vs interview prep ---
-        normalized_query = query.lower()
-        normalized_label = label.lower()
-
-        looks_like_real_arch_question = any(
-            kw in normalized_query
-            for kw in [
-                "rps", "requests per second", "throughput", "latency",
-                "eventual consistency", "strong consistency",
-                "microservice", "micro-services", "event-driven",
-                "message queue", "kafka", "rabbitmq",
-                "load balancer", "sharding", "replication",
-            ]
-        )
-        looks_like_interview_prep = any(
-            kw in normalized_query
-            for kw in [
-                "interview", "interviews", "mock interview", "mock system design",
-                "prep", "preparation", "practice platform", "practice site",
-                "course", "bootcamp", "coaching",
-            ]
-        )
+    response = topic_classifier_llm.invoke(messages)
+    label = response.content.strip()
 
-        if (
-            normalized_label == "system design interview platforms"
-            and looks_like_real_arch_question
-            and not looks_like_interview_prep
-        ):
-            # Force route to architecture design if semantics clearly match
-            arch_cfg = TOPIC_CONFIGS["architecture_design"]
-            return "architecture_design", arch_cfg.label, arch_cfg.domain
+    # Find which config matches this label
+    for key, cfg in TOPIC_CONFIGS.items():
+        if cfg.label.lower() == label.lower():
+            return key
+    return None
 
-        # Find which config matches this label
-        for key, cfg in TOPIC_CONFIGS.items():
-            if cfg.label.lower() == label.lower():
-                return key, cfg.label, cfg.domain
 
+def classify_topic_with_llm(query: str) -> Tuple[str, str, str]:
+    """
+    Returns (key, label, domain)
+    - key: internal name (e.g. 'database')
+    - label: user-facing display (e.g. 'Databases & Data Platforms')
+    - domain: e.g. 'tools', 'career', 'software_engineering'
+    """
+    try:
+        key = _llm_topic_key(query)
+    except Exception as e:
+        print("Topic classification error:", e)
+        key = None
+
+    if key is None:
         # fallback — shouldn't happen
-        default_key = next(iter(TOPIC_CONFIGS.keys()))
-        default_cfg = TOPIC_CONFIGS[default_key]
-        return default_key, default_cfg.label, default_cfg.domain
+        key = next(iter(TOPIC_CONFIGS.keys()))
+    return _topic_tuple(_apply_routing_rules(query, key))
+
 
+def classify_topic(query: str) -> Tuple[str, str, str]:
+    """
+    Same contract as classify_topic_with_llm, but routed locally when the
+    local classifier is confident. Queries the LLM has to decide are logged
+    so the local model learns them on its next fit.
+    """
+    prediction = TOPIC_CLASSIFIER.predict_if_ready(query)
+    if prediction is None:
+        # Still fitting (cold start): the LLM is faster than waiting for it.
+        print("[TopicClassifier] not fitted yet, asking LLM")
+    elif TOPIC_CLASSIFIER.is_confident(prediction):
+        print(f"[TopicClassifier] local: {prediction.key} ({prediction.confidence:.2f})")
+        return _topic_tuple(_apply_routing_rules(query, prediction.key))
+    else:
+        print(
+            f"[TopicClassifier] unsure ({prediction.key} {prediction.confidence:.2f} / "
+            f"{prediction.runner_up} {prediction.runner_up_confidence:.2f}), asking LLM"
+        )
+    try:
+        key = _llm_topic_key(query)
     except Exception as e:
         print("Topic classification error:", e)
-        default_key = next(iter(TOPIC_CONFIGS.keys()))
-        default_cfg = TOPIC_CONFIGS[default_key]
-        return default_key, default_cfg.label, default_cfg.domain
\ No newline at end of file
+        key = None
+
+    if key is None:
+        # The local guess beats an arbitrary default.
+        fallback = prediction.key if prediction is not None else next(iter(TOPIC_CONFIGS.keys()))
+        return _topic_tuple(_apply_routing_rules(query, fallback))
+
+    key = _apply_routing_rules(query, key)
+    TOPIC_CLASSIFIER.record(query, key)
+    return _topic_tuple(key)
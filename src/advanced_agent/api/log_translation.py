@@ -0,0 +1,193 @@
+# src/api/log_translation.py
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, List, Optional, Tuple
+
+from .sse import STREAM_PUT_TIMEOUT_S
+from .translate import translate_batch
+
+# Log lines arriving within this window are translated in one LLM call.
+LOG_TRANSLATION_INTERVAL_S = float(os.getenv("LOG_TRANSLATION_INTERVAL_S", "0.5"))
+# Upper bound on lines per translation call.
+LOG_TRANSLATION_MAX_BATCH = int(os.getenv("LOG_TRANSLATION_MAX_BATCH", "20"))
+# close() waits this long for pending translations, then sends the rest as-is.
+LOG_TRANSLATION_CLOSE_TIMEOUT_S = float(os.getenv("LOG_TRANSLATION_CLOSE_TIMEOUT_S", "5"))
+
+TranslateBatch = Callable[[List[str], str], List[str]]
+
+
+class TranslatedLogChannel:
+    """
+    Ordered outbox in front of an SSE channel that translates log lines off
+    the workflow thread.
+
+    put_log() and put() only append to a queue and return; one background
+    thread drains it in order, turning each run of consecutive log lines
+    (up to `max_batch`, gathered for up to `interval_s`) into a single
+    `translate` call. Other events wait behind the logs queued before them,
+    so the client sees exactly the order the run produced. close() flushes
+    and then closes the underlying channel; if a translation call hangs, it
+    gives up after `close_timeout_s` and sends the remaining lines untranslated,
+    so the worker calling close() is never held indefinitely.
+
+    With `target_lang=None` everything is passed straight through.
+    """
+
+    def __init__(
+        self,
+        channel: Any,
+        target_lang: Optional[str],
+        translate: Optional[TranslateBatch] = None,
+        interval_s: float = LOG_TRANSLATION_INTERVAL_S,
+        max_batch: int = LOG_TRANSLATION_MAX_BATCH,
+        close_timeout_s: float = LOG_TRANSLATION_CLOSE_TIMEOUT_S,
+    ) -> None:
+        self.channel = channel
+        self.target_lang = target_lang
+        self.translate = translate or translate_batch
+        self.interval_s = interval_s
+        self.max_batch = max(1, max_batch)
+        self.close_timeout_s = close_timeout_s
+
+        # (is_log, payload_or_message, put_timeout)
+        self._items: Deque[Tuple[bool, Any, Optional[float]]] = deque()
+        self._cond = threading.Condition()
+        self._closing = False
+        self._thread: Optional[threading.Thread] = None
+        # The batch the drain thread has taken but not yet sent, and whether
+        # close() has taken over sending. Both guarded by _send_lock.
+        self._send_lock = threading.Lock()
+        self._in_flight: List[Tuple[bool, Any, Optional[float]]] = []
+        self._abandoned = False
+
+        # metrics
+        self.batches = 0
+        self.translated = 0
+
+    @property
+    def disconnected(self) -> bool:
+        return self.channel.disconnected
+
+    # ---------- producer side ----------
+
+    def _enqueue(self, item: Tuple[bool, Any, Optional[float]]) -> None:
+        with self._cond:
+            if self._closing:
+                return
+            self._items.append(item)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._drain, name="log-translation", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+
+    def put_log(self, message: str) -> None:
+        """Queue a log line for translation; never blocks."""
+        if self.target_lang is None:
+            self.channel.put({"type": "log", "message": message})
+            return
+        self._enqueue((True, message, None))
+
+    def put(self, payload: Any, timeout: Optional[float] = STREAM_PUT_TIMEOUT_S) -> bool:
+        """Queue an event as-is, behind any pending log lines."""
+        if self.target_lang is None:
+            return self.channel.put(payload, timeout=timeout)
+        self._enqueue((False, payload, timeout))
+        return not self.disconnected
+
+    def close(self) -> None:
+        with self._cond:
+            self._closing = True
+            thread = self._thread
+            self._cond.notify()
+        if thread is not None:
+            thread.join(timeout=self.close_timeout_s)
+            if thread.is_alive():
+                self._send_rest_untranslated()
+        self.channel.close()
+
+    def _send_rest_untranslated(self) -> None:
+        """
+        The drain thread is stuck (usually in a translation call): take over
+        and send its batch and everything still queued, in order, as-is.
+        """
+        # Lock order is _cond, then _send_lock (as in _drain).
+        with self._cond, self._send_lock:
+            self._abandoned = True
+            rest = self._in_flight + list(self._items)
+            self._items.clear()
+            self._in_flight = []
+        # The drain thread checks _abandoned before sending anything, so these
+        # are the only sends from here on.
+        print(f"[Translate] log translation timed out; sending {len(rest)} event(s) untranslated")
+        if not self.disconnected:
+            self._send(rest, [message for is_log, message, _ in rest if is_log])
+
+    # ---------- background drain ----------
+
+    def _take_batch(self) -> List[Tuple[bool, Any, Optional[float]]]:
+        """
+        Called with the lock held and at least one item queued. A leading log
+        line waits up to `interval_s` for company, then every consecutive log
+        line (up to max_batch) is taken; anything else is taken alone.
+        """
+        if self._items[0][0]:
+            deadline = time.monotonic() + self.interval_s
+            # Stop gathering once a non-log event is queued: nothing after it
+            # can join this batch.
+            while not self._closing and len(self._items) < self.max_batch and self._items[-1][0]:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._cond.wait(remaining):
+                    break
+            batch = []
+            while self._items and self._items[0][0] and len(batch) < self.max_batch:
+                batch.append(self._items.popleft())
+            return batch
+        return [self._items.popleft()]
+
+    def _send(self, batch: List[Tuple[bool, Any, Optional[float]]], messages: List[str]) -> None:
+        """Send `batch` in order, log lines taken from `messages`."""
+        lines = iter(messages)
+        for is_log, payload, timeout in batch:
+            if is_log:
+                self.channel.put({"type": "log", "message": next(lines, payload)})
+            else:
+                self.channel.put(payload, timeout=timeout)
+
+    def _drain(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._items or self._closing)
+                if not self._items:
+                    return
+                batch = self._take_batch()
+                with self._send_lock:
+                    if self._abandoned:
+                        return
+                    self._in_flight = batch
+
+            if self.disconnected:
+                continue
+
+            messages = [message for is_log, message, _ in batch if is_log]
+            if messages:
+                try:
+                    translated = self.translate(messages, self.target_lang)
+                    self.batches += 1
+                    self.translated += len(messages)
+                except Exception as e:
+                    print(f"[Translate] log batch failed, sending originals: {e}")
+                    translated = messages
+                messages = translated
+
+            with self._send_lock:
+                if self._abandoned:
+                    # close() gave up waiting and already sent this batch as-is.
+                    return
+                self._send(batch, messages)
+                self._in_flight = []
@@ -0,0 +1,284 @@
+# src/api/message_catalog.py
+"""
+Bilingual catalog for the fixed strings users see: log templates and topic
+labels.
+
+Log lines are matched against English templates ("🔬 Researching: {0}") and
+rendered from the checked-in Chinese table (api/data/messages_zh.py) without
+an LLM call; only free-form text falls back to the translator.
+
+Regenerate the table after adding or changing log messages:
+
+    python -m src.advanced_agent.api.message_catalog           # list missing entries
+    python -m src.advanced_agent.api.message_catalog --write   # LLM-translate them and rewrite the table
+"""
+from __future__ import annotations
+
+import ast
+import json
+import re
+import sys
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Pattern, Tuple
+
+from .data.messages_zh import MESSAGES_ZH
+
+PACKAGE_DIR = Path(__file__).resolve().parents[1]
+TABLE_PATH = Path(__file__).resolve().parent / "data" / "messages_zh.py"
+
+# Calls whose first argument is a user-visible log line.
+LOG_CALLS = ("_log", "put_log")
+
+_PLACEHOLDER_RE = re.compile(r"\{(\d+)\}")
+
+
+# ---------------------------------------------------------------------------
+# Template extraction (used to build the table)
+# ---------------------------------------------------------------------------
+
+def _templates_from_node(node: ast.AST) -> List[str]:
+    """
+    String literal -> itself; f-string -> template with {0}, {1}, ... for each
+    interpolated value; `a if cond else b` -> both branches.
+    """
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return [node.value.replace("{", "{{").replace("}", "}}")]
+    if isinstance(node, ast.JoinedStr):
+        parts: List[str] = []
+        index = 0
+        for value in node.values:
+            if isinstance(value, ast.Constant):
+                parts.append(str(value.value).replace("{", "{{").replace("}", "}}"))
+            else:
+                parts.append("{%d}" % index)
+                index += 1
+        return ["".join(parts)]
+    if isinstance(node, ast.IfExp):
+        return _templates_from_node(node.body) + _templates_from_node(node.orelse)
+    return []
+
+
+def _literal_text(template: str) -> str:
+    return _PLACEHOLDER_RE.sub("", template)
+
+
+def extract_log_templates(root: Path = PACKAGE_DIR) -> List[str]:
+    """
+    Every `_log(...)` / `put_log(...)` message under `root`, as templates.
+    Messages that are only placeholders carry nothing to translate and are
+    skipped.
+    """
+    templates = set()
+    for path in sorted(root.rglob("*.py")):
+        try:
+            tree = ast.parse(path.read_text(encoding="utf-8"))
+        except (SyntaxError, UnicodeDecodeError):
+            continue
+        for node in ast.walk(tree):
+            if (
+                isinstance(node, ast.Call)
+                and isinstance(node.func, ast.Attribute)
+                and node.func.attr in LOG_CALLS
+                and node.args
+            ):
+                for template in _templates_from_node(node.args[0]):
+                    if re.search(r"[A-Za-z]", _literal_text(template)):
+                        templates.add(template)
+    return sorted(templates)
+
+
+def catalog_sources() -> List[str]:
+    """All English strings the table should cover: log templates + topic labels."""
+    from ..topics.registry import TOPIC_CONFIGS
+
+    labels = {cfg.label for cfg in TOPIC_CONFIGS.values()}
+    return sorted(set(extract_log_templates()) | labels)
+
+
+# ---------------------------------------------------------------------------
+# Lookup
+# ---------------------------------------------------------------------------
+
+def _compile(template: str) -> Pattern[str]:
+    pattern = []
+    pos = 0
+    for match in _PLACEHOLDER_RE.finditer(template):
+        pattern.append(re.escape(template[pos:match.start()].replace("{{", "{").replace("}}", "}")))
+        pattern.append(f"(?P<p{match.group(1)}>.*?)")
+        pos = match.end()
+    pattern.append(re.escape(template[pos:].replace("{{", "{").replace("}}", "}")))
+    return re.compile("".join(pattern) + r"\Z", re.DOTALL)
+
+
+class MessageCatalog:
+    """
+    English -> target-language lookup over a table of templates.
+
+    Strings without placeholders are exact dict hits; templates are tried
+    longest literal text first so "Collected {0} sources for tools research."
+    wins over a shorter, looser template. Interpolated values that are
+    themselves catalog entries (e.g. a topic label) are translated too.
+    """
+
+    def __init__(self, tables: Dict[str, Dict[str, str]]) -> None:
+        self._exact: Dict[str, Dict[str, str]] = {}
+        self._patterns: Dict[str, List[Tuple[Pattern[str], str]]] = {}
+        for lang, table in tables.items():
+            exact: Dict[str, str] = {}
+            templates: List[Tuple[str, str]] = []
+            for source, target in table.items():
+                if _PLACEHOLDER_RE.search(source):
+                    templates.append((source, target))
+                else:
+                    exact[source.replace("{{", "{").replace("}}", "}")] = target.replace("{{", "{").replace("}}", "}")
+            templates.sort(key=lambda item: -len(_literal_text(item[0])))
+            patterns = [(_compile(source), target) for source, target in templates]
+            self._exact[lang] = exact
+            self._patterns[lang] = patterns
+
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def languages(self) -> List[str]:
+        return sorted(self._exact)
+
+    def lookup(self, text: str, target_lang: str) -> Optional[str]:
+        exact = self._exact.get(target_lang)
+        if exact is None:
+            return None
+        stripped = text.strip()
+        if stripped in exact:
+            return exact[stripped]
+        for pattern, target in self._patterns[target_lang]:
+            match = pattern.match(stripped)
+            if match is None:
+                continue
+            values = {
+                name[1:]: exact.get(value.strip(), value)
+                for name, value in match.groupdict().items()
+            }
+            return _PLACEHOLDER_RE.sub(
+                lambda m: values.get(m.group(1), m.group(0)),
+                target.replace("{{", "\x00").replace("}}", "\x01"),
+            ).replace("\x00", "{").replace("\x01", "}")
+        return None
+
+    def _count(self, hits: int, misses: int) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def translate(
+        self,
+        text: str,
+        target_lang: str,
+        fallback: Callable[[str, str], str],
+    ) -> str:
+        """Catalog hit, else `fallback(text, target_lang)` (the LLM translator)."""
+        found = self.lookup(text, target_lang)
+        self._count(found is not None, found is None)
+        return found if found is not None else fallback(text, target_lang)
+
+    def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        fallback: Callable[[List[str], str], List[str]],
+    ) -> List[str]:
+        """
+        Same order as `texts`; only the lines the catalog cannot render are
+        sent to `fallback` (one batched call).
+        """
+        results: List[Optional[str]] = [self.lookup(t, target_lang) for t in texts]
+        missing = [i for i, r in enumerate(results) if r is None]
+        self._count(len(texts) - len(missing), len(missing))
+        if missing:
+            translated = fallback([texts[i] for i in missing], target_lang)
+            for i, text in zip(missing, translated):
+                results[i] = text
+        return [r if r is not None else t for r, t in zip(results, texts)]
+
+    def metrics(self) -> Dict[str, object]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "languages": self.languages(),
+                "entries": {lang: len(self._exact[lang]) + len(self._patterns[lang]) for lang in self._exact},
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+            }
+
+
+MESSAGE_CATALOG = MessageCatalog({"Chinese": MESSAGES_ZH})
+
+
+# ---------------------------------------------------------------------------
+# Table generation
+# ---------------------------------------------------------------------------
+
+def _render_table(table: Dict[str, str]) -> str:
+    lines = [
+        "# src/api/data/messages_zh.py",
+        "# Generated by `python -m src.advanced_agent.api.message_catalog --write`;",
+        "# entries can be edited by hand. {0}, {1}, ... are the interpolated values.",
+        "from typing import Dict",
+        "",
+        "MESSAGES_ZH: Dict[str, str] = {",
+    ]
+    for source in sorted(table):
+        lines.append(f"    {json.dumps(source, ensure_ascii=False)}: {json.dumps(table[source], ensure_ascii=False)},")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def _placeholders(text: str) -> List[str]:
+    return sorted(set(_PLACEHOLDER_RE.findall(text)))
+
+
+def build_table(
+    existing: Dict[str, str],
+    sources: Iterable[str],
+    translate: Optional[Callable[[List[str], str], List[str]]] = None,
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Returns (table, missing): entries for every current source, reusing
+    existing translations; with `translate`, missing ones are filled in
+    (translations that lose a placeholder are rejected).
+    """
+    sources = list(sources)
+    table = {s: existing[s] for s in sources if s in existing}
+    missing = [s for s in sources if s not in table]
+    if translate is not None and missing:
+        for source, target in zip(missing, translate(missing, "Chinese")):
+            if _placeholders(source) == _placeholders(target):
+                table[source] = target
+            else:
+                print(f"[Catalog] placeholder mismatch, skipped: {source!r} -> {target!r}")
+        missing = [s for s in sources if s not in table]
+    return table, missing
+
+
+def main(argv: List[str]) -> int:
+    write = "--write" in argv
+    translate = None
+    if write:
+        from .translate import translate_batch
+
+        translate = translate_batch
+    table, missing = build_table(MESSAGES_ZH, catalog_sources(), translate)
+    stale = sorted(set(MESSAGES_ZH) - set(table))
+    for source in missing:
+        print(f"missing: {source!r}")
+    for source in stale:
+        print(f"stale:   {source!r}")
+    if write:
+        TABLE_PATH.write_text(_render_table(table), encoding="utf-8")
+        print(f"[Catalog] wrote {len(table)} entries to {TABLE_PATH}")
+    return 1 if missing and not write else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -23,3 +23,21 @@ class ChatResponse(BaseModel):
     download_url: Optional[str] = None
     topic_used: Optional[str] = None
     logs: List[str] = []
+
+
+class ResearchRequest(BaseModel):
+    message: str
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+    mode: str = "fast"
+    # Skip the finished-run cache and an identical run already in progress.
+    fresh: bool = False
+
+
+class ResearchJobResponse(BaseModel):
+    job_id: str
+    status: str
+    events_url: str
+    result_url: str
+    # True when an identical run was already in progress and this joined it.
+    joined: bool = False
@@ -0,0 +1,198 @@
+# src/api/research_jobs.py
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from .sse import HEARTBEAT_INTERVAL_S, sse_data
+
+# Events kept per job for replay; a client resuming from before the oldest
+# kept event gets everything still buffered.
+JOB_EVENT_BUFFER_MAX = int(os.getenv("RESEARCH_JOB_EVENT_BUFFER", "1000"))
+# How long a finished job (and its events) can still be fetched.
+JOB_TTL_SECONDS = float(os.getenv("RESEARCH_JOB_TTL_S", str(60 * 60)))
+
+JobKey = Tuple[str, str, str]
+
+
+class ResearchJobRun:
+    """
+    One research run decoupled from any HTTP connection.
+
+    The worker writes events with put()/close() exactly as it would to an
+    SSEChannel, but never blocks: events go into a bounded, numbered buffer.
+    Any number of clients can stream them with events(), starting after the
+    last id they saw (the SSE `Last-Event-ID`), and the run keeps going when
+    all of them disconnect.
+    """
+
+    def __init__(self, key: Optional[JobKey] = None, buffer_max: int = JOB_EVENT_BUFFER_MAX) -> None:
+        self.id = uuid.uuid4().hex
+        self.key = key
+        self.created_at = time.time()
+        self.finished_at: Optional[float] = None
+        self.topic: Optional[Dict[str, Any]] = None
+        self.final: Optional[Dict[str, Any]] = None
+        # Runs are not tied to a connection; kept for the SSEChannel interface.
+        self.disconnected = False
+
+        self._events: Deque[Tuple[int, Any]] = deque(maxlen=max(1, buffer_max))
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._listeners: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def done(self) -> bool:
+        return self.finished_at is not None
+
+    @property
+    def status(self) -> str:
+        if not self.done:
+            return "running"
+        return "completed" if self.final is not None else "failed"
+
+    # ---------- producer side (worker thread) ----------
+
+    def put(self, payload: Any, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            if self.done:
+                return False
+            self._events.append((self._next_id, payload))
+            self._next_id += 1
+            if isinstance(payload, dict):
+                if payload.get("type") == "topic":
+                    self.topic = payload
+                elif payload.get("type") == "final":
+                    self.final = payload
+        self._wake()
+        return True
+
+    def put_nowait(self, payload: Any) -> None:
+        self.put(payload)
+
+    def close(self) -> None:
+        with self._lock:
+            if self.done:
+                return
+            self.finished_at = time.time()
+        self._wake()
+
+    def _wake(self) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+        for loop, event in listeners:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # loop closed; its stream is gone
+                pass
+
+    # ---------- consumer side ----------
+
+    def events_after(self, last_event_id: int = 0) -> List[Tuple[int, Any]]:
+        with self._lock:
+            return [(i, p) for i, p in self._events if i > last_event_id]
+
+    async def events(
+        self,
+        last_event_id: int = 0,
+        heartbeat_s: float = HEARTBEAT_INTERVAL_S,
+    ) -> AsyncIterator[str]:
+        """
+        Replay buffered events after `last_event_id`, then follow the run live
+        until it finishes.
+        """
+        wakeup = asyncio.Event()
+        listener = (asyncio.get_running_loop(), wakeup)
+        with self._lock:
+            self._listeners.add(listener)
+        try:
+            while True:
+                wakeup.clear()
+                done = self.done
+                for event_id, payload in self.events_after(last_event_id):
+                    last_event_id = event_id
+                    yield sse_data(payload, event_id=event_id)
+                if done:
+                    break
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+        finally:
+            with self._lock:
+                self._listeners.discard(listener)
+
+    def summary(self) -> Dict[str, Any]:
+        with self._lock:
+            last_event_id = self._next_id - 1
+        return {
+            "job_id": self.id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "finished_at": self.finished_at,
+            "topic": self.topic,
+            "last_event_id": last_event_id,
+            "final": self.final,
+        }
+
+
+class ResearchJobStore:
+    """
+    In-memory jobs by id, with TTL for finished ones. A second request for the
+    same (query, mode, model) while one is running joins that run.
+    """
+
+    def __init__(self, ttl_seconds: float = JOB_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._jobs: Dict[str, ResearchJobRun] = {}
+        self._running: Dict[JobKey, ResearchJobRun] = {}
+        self._lock = threading.Lock()
+
+    def _expire(self) -> None:
+        now = time.time()
+        for job_id, job in list(self._jobs.items()):
+            if job.done and now - job.finished_at > self.ttl_seconds:
+                del self._jobs[job_id]
+        for key, job in list(self._running.items()):
+            if job.done:
+                del self._running[key]
+
+    def get(self, job_id: str) -> Optional[ResearchJobRun]:
+        with self._lock:
+            self._expire()
+            return self._jobs.get(job_id)
+
+    def get_or_create(self, key: Optional[JobKey]) -> Tuple[ResearchJobRun, bool]:
+        """
+        Returns (job, created). With key=None a new job is always created.
+        """
+        with self._lock:
+            self._expire()
+            if key is not None:
+                running = self._running.get(key)
+                if running is not None:
+                    return running, False
+            job = ResearchJobRun(key)
+            self._jobs[job.id] = job
+            if key is not None:
+                self._running[key] = job
+            return job, True
+
+    def discard(self, job: ResearchJobRun) -> None:
+        with self._lock:
+            self._jobs.pop(job.id, None)
+            if job.key is not None and self._running.get(job.key) is job:
+                del self._running[job.key]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._jobs)
+
+
+RESEARCH_JOBS = ResearchJobStore()
@@ -0,0 +1,134 @@
+# src/api/result_cache.py
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from ..query_canon import DEFAULT_SIMILARITY_THRESHOLD, QuerySimilarityIndex, canonicalize_query
+
+# How long a finished research run can be replayed before it is recomputed.
+RUN_CACHE_TTL_SECONDS = 6 * 60 * 60
+RUN_CACHE_MAX_ENTRIES = 256
+
+RunCacheKey = Tuple[str, str, str, str]
+
+
+def make_run_key(topic_key: str, query: str, mode: str, model: str) -> RunCacheKey:
+    return (topic_key, canonicalize_query(query), (mode or "fast").lower(), model)
+
+
+@dataclass
+class CachedRun:
+    """
+    Everything needed to replay a finished run without touching the workflow:
+    the final workflow state, the rendered layout, the written files and the
+    exact `final` SSE payload that was sent the first time.
+    """
+
+    key: RunCacheKey
+    state: Any
+    layout: Any
+    file_paths: Dict[str, str]
+    final_payload: Dict[str, Any]
+    # original user query, for hit attribution ("served for a similar question")
+    query: str = ""
+    created_at: float = field(default_factory=time.time)
+
+    def age_seconds(self) -> float:
+        return time.time() - self.created_at
+
+    def files_exist(self) -> bool:
+        return all(Path(p).exists() for p in self.file_paths.values() if p)
+
+
+class RunResultCache:
+    """
+    Thread-safe in-memory cache of finished research runs with TTL.
+
+    Lookups first try the exact canonical key, then the most similar canonical
+    query asked under the same (topic, mode, model).
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = RUN_CACHE_TTL_SECONDS,
+        max_entries: int = RUN_CACHE_MAX_ENTRIES,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.similarity_threshold = similarity_threshold
+        self._entries: Dict[RunCacheKey, CachedRun] = {}
+        self._indexes: Dict[Tuple[str, str, str], QuerySimilarityIndex[RunCacheKey]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _group(key: RunCacheKey) -> Tuple[str, str, str]:
+        topic_key, _, mode, model = key
+        return topic_key, mode, model
+
+    def _remove(self, key: RunCacheKey) -> None:
+        self._entries.pop(key, None)
+        index = self._indexes.get(self._group(key))
+        if index is not None:
+            index.remove(key[1])
+
+    def get(self, key: RunCacheKey) -> Optional[CachedRun]:
+        with self._lock:
+            index = self._indexes.get(self._group(key))
+            match = index.lookup(key[1]) if index is not None else None
+            if match is None:
+                return None
+            _, matched_key, score = match
+            entry = self._entries.get(matched_key)
+            if entry is None:
+                return None
+            # Expired, or the user deleted the generated files: recompute.
+            if entry.age_seconds() > self.ttl_seconds or not entry.files_exist():
+                self._remove(matched_key)
+                return None
+
+        attribution = "exact" if matched_key == key else f"similar {score:.2f}"
+        print(f"[RunCache] hit ({attribution}): {key[1]!r} -> {entry.query or matched_key[1]!r}")
+        return entry
+
+    def put(self, entry: CachedRun) -> None:
+        with self._lock:
+            self._entries[entry.key] = entry
+            group = self._group(entry.key)
+            if group not in self._indexes:
+                self._indexes[group] = QuerySimilarityIndex(self.similarity_threshold)
+            self._indexes[group].add(entry.key[1], entry.key)
+            if len(self._entries) > self.max_entries:
+                oldest = min(self._entries.values(), key=lambda e: e.created_at)
+                self._remove(oldest.key)
+
+    def invalidate(
+        self,
+        topic_key: Optional[str] = None,
+        query: Optional[str] = None,
+    ) -> int:
+        """
+        Drop matching entries (all entries if no filter is given).
+        Returns the number of removed entries.
+        """
+        norm = canonicalize_query(query) if query else None
+        with self._lock:
+            doomed = [
+                k
+                for k in self._entries
+                if (topic_key is None or k[0] == topic_key)
+                and (norm is None or k[1] == norm)
+            ]
+            for k in doomed:
+                self._remove(k)
+            return len(doomed)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+RUN_CACHE = RunResultCache()
@@ -0,0 +1,20 @@
+# src/api/routes/cache.py
+from typing import Optional
+from fastapi import APIRouter, Query
+from ..result_cache import RUN_CACHE
+
+router = APIRouter()
+
+
+@router.post("/cache/clear")
+def clear_cache(
+        topic: Optional[str] = Query(None),
+        query: Optional[str] = Query(None),
+):
+    """
+    Invalidate cached research runs.
+    - no params: drop everything
+    - topic / query: drop only matching entries (query is normalized first)
+    """
+    removed = RUN_CACHE.invalidate(topic_key=topic, query=query)
+    return {"ok": True, "removed": removed}
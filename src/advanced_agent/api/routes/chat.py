@@ -1,22 +1,30 @@
 # src/api/routes/chat.py
+import asyncio
 import os
-import json
 import re
 import threading
 import unicodedata
 from datetime import datetime
 from typing import Optional
-from queue import Queue
 import uuid
+from ...cancellation import CancelToken, RunCancelled
 from ...history.store import HistoryEntry, add_history_entry
 from fastapi import APIRouter, Query
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from ...saving import format_result_text, generate_document_and_slides, LanguageCode, generate_all_files_for_layout
-from ..deps import TOPIC_WORKFLOWS, classify_topic_with_llm
-from ..translate import is_chinese, translate_text
+from ..deps import TOPIC_WORKFLOWS, classify_topic
+from ..result_cache import RUN_CACHE, CachedRun, make_run_key
+from ..scheduler import RESEARCH_SCHEDULER, QueueFull
+from ..sse import SSEChannel
+from ..log_translation import TranslatedLogChannel
+from ..message_catalog import MESSAGE_CATALOG
+from ..translate import is_chinese, translate_batch, translate_text
+from ..workflow_pool import WORKFLOW_POOLS, PoolTimeout
 
 router = APIRouter()
 SAVED_DOCS_DIR = "saved_docs"
+# How long a run waits for a free workflow instance of its topic.
+WORKFLOW_CHECKOUT_TIMEOUT_S = 600
 
 
 @router.get("/chat_stream")
@@ -25,65 +33,167 @@ async def chat_stream(
         model: Optional[str] = Query(None),
         temperature: Optional[str] = Query(None),
         mode: Optional[str] = Query("fast"),
+        fresh: Optional[str] = Query(None),
 ):
     """
     Streaming chat endpoint using Server-Sent Events (SSE).
     The `message` comes from the query string, e.g. /chat_stream?message=...
-    """
-    user_query = message
 
-    # --- language detection ---
-    user_is_chinese = is_chinese(user_query)
-    # Use an English query internally if Chinese
-    internal_query = (
-        translate_text(user_query, "English") if user_is_chinese else user_query
-    )
+    Finished runs are cached per (topic, normalized query, mode, model);
+    pass `fresh=1` to bypass the cache and recompute.
 
+    Research runs go through the bounded scheduler (fast and deep lanes);
+    waiting clients get `queue` events and a full queue answers HTTP 429.
+    Closing the stream cancels the run at its next checkpoint.
+    """
     selected_model = model or "gpt-4.1-mini"
     selected_temperature = float(temperature) if temperature is not None else 0.1
-
     speed_mode = (mode or "fast").lower()
+    bypass_cache = (fresh or "").lower() in ("1", "true", "yes")
+
+    if RESEARCH_SCHEDULER.is_full():
+        return queue_full_response()
+
+    # Events flow worker thread -> bounded asyncio queue -> async generator,
+    # so an open stream costs no threadpool worker while it waits.
+    channel = SSEChannel(asyncio.get_running_loop())
+    cancel_token = CancelToken()
+    channel.on_disconnect = lambda: cancel_token.cancel("client disconnected")
+    start_chat_run(
+        channel,
+        cancel_token=cancel_token,
+        user_query=message,
+        selected_model=selected_model,
+        selected_temperature=selected_temperature,
+        speed_mode=speed_mode,
+        bypass_cache=bypass_cache,
+    )
+
+    return StreamingResponse(
+        channel.events(),
+        media_type="text/event-stream",
+    )
+
+
+def queue_full_response() -> JSONResponse:
+    return JSONResponse(
+        status_code=429,
+        content={"detail": "Too many research requests in progress, please retry shortly."},
+        headers={"Retry-After": "30"},
+    )
+
+
+def start_chat_run(
+        channel,
+        *,
+        user_query: str,
+        selected_model: str,
+        selected_temperature: float,
+        speed_mode: str,
+        bypass_cache: bool,
+        cancel_token: Optional[CancelToken] = None,
+) -> None:
+    """
+    Classify, replay from cache or schedule the research run, writing SSE
+    payloads to `channel` (an SSEChannel or a ResearchJobRun). Returns at once;
+    the work happens on a background thread and the scheduler, and the
+    channel is closed when the run ends.
+
+    Once `cancel_token` fires the run stops at the next checkpoint: between
+    graph steps and tool lookups, before each file is written and before the
+    history entry.
+    """
+    if cancel_token is None:
+        cancel_token = CancelToken()
     fast_mode = speed_mode != "deep"
+    lane = "fast" if fast_mode else "deep"
     print("User selected model:", selected_model)
     print("User selected temperature:", selected_temperature)
     print("Fast mode:", fast_mode)
 
-    # 1) classify topic
-    topic_key, topic_label, topic_domain = classify_topic_with_llm(internal_query)
+    # Filled in by admit() on the worker thread; translation and topic
+    # classification are LLM calls and must not run on the event loop.
+    user_is_chinese = is_chinese(user_query)
+    internal_query = user_query
+    # Every event goes through `out`. For Chinese users it translates log
+    # lines in batches on its own thread, keeping the stream order, so a
+    # log call never waits for the translator. Fixed templates come from the
+    # message catalog; only free-form lines reach the LLM.
+    out = TranslatedLogChannel(
+        channel,
+        "Chinese" if user_is_chinese else None,
+        translate=lambda texts, lang: MESSAGE_CATALOG.translate_batch(texts, lang, translate_batch),
+    )
+    topic_label_display = ""
+    cache_key = None
 
-    # 2) get the *instance* from TOPIC_WORKFLOWS
-    workflow = TOPIC_WORKFLOWS.get(topic_key)
-    if workflow is None:
-        workflow = TOPIC_WORKFLOWS.get("developer_tools")
-        topic_key = "developer_tools"
-        topic_label = "Developer Tools"
-        topic_domain = "tools"
+    def admit():
+        nonlocal internal_query, topic_label_display, cache_key
 
-    # If Chinese, we may also translate the topic label for UI
-    topic_label_display = (
-        translate_text(topic_label, "Chinese") if user_is_chinese else topic_label
-    )
-    q: Queue[str] = Queue()
+        # Use an English query internally if Chinese
+        if user_is_chinese:
+            internal_query = translate_text(user_query, "English")
+
+        # 1) classify topic
+        topic_key, topic_label, topic_domain = classify_topic(internal_query)
+        cancel_token.raise_if_cancelled()
+
+        # 2) get the *instance* from TOPIC_WORKFLOWS
+        workflow = TOPIC_WORKFLOWS.get(topic_key)
+        if workflow is None:
+            workflow = TOPIC_WORKFLOWS.get("developer_tools")
+            topic_key = "developer_tools"
+            topic_label = "Developer Tools"
+            topic_domain = "tools"
+
+        # If Chinese, we may also translate the topic label for UI
+        topic_label_display = (
+            MESSAGE_CATALOG.translate(topic_label, "Chinese", translate_text)
+            if user_is_chinese
+            else topic_label
+        )
+
+        # Topic info goes first so the UI can update its title immediately.
+        out.put({
+            "type": "topic",
+            "topic_key": topic_key,
+            "topic_label": topic_label_display,
+            "topic_domain": topic_domain,
+        })
+        cache_key = make_run_key(topic_key, user_query, speed_mode, selected_model)
+        return topic_key, workflow
+
+    def replay_cached() -> bool:
+        """
+        3) whole-run cache: replay a previous answer through the same event shape.
+        """
+        cached = None if bypass_cache else RUN_CACHE.get(cache_key)
+        if cached is None:
+            return False
+        minutes = int(cached.age_seconds() // 60)
+
+        out.put({"type": "log", "message": f"📌 Model selected: {selected_model}"})
+        out.put_log(
+            f"♻️ Served cached result from {minutes} min ago (add fresh=1 to recompute). ↪ {cached.query}"
+            if cached.key != cache_key and cached.query
+            else f"♻️ Served cached result from {minutes} min ago (add fresh=1 to recompute)."
+        )
+        out.put(cached.final_payload, timeout=None)
+        return True
 
     def log_callback(msg: str) -> None:
-        out_msg = msg
-        if user_is_chinese:
-            # You can prefix if you want, but simplest: just translate the log
-            out_msg = translate_text(msg, "Chinese")
-        payload = {"type": "log", "message": out_msg}
-        q.put(json.dumps(payload))
-
-    # Initial log messages (model + temp)
-    q.put(json.dumps({"type": "log", "message": f"📌 Model selected: {selected_model}"}))
-    q.put(json.dumps({"type": "log", "message": f"🎛️ Temperature set to: {selected_temperature}"}))
-    # 👇 NEW: log speed mode
-    if fast_mode:
-        speed_msg = "⚡ Fast mode: quicker answer with lighter analysis."
-    else:
-        speed_msg = "🧠 Deep Thinking: multi-pass research and knowledge extraction enabled."
-    if user_is_chinese:
-        speed_msg = translate_text(speed_msg, "Chinese")
-    q.put(json.dumps({"type": "log", "message": speed_msg}))
+        out.put_log(msg)
+
+    def send_run_settings() -> None:
+        # Initial log messages (model + temp)
+        out.put({"type": "log", "message": f"📌 Model selected: {selected_model}"})
+        out.put({"type": "log", "message": f"🎛️ Temperature set to: {selected_temperature}"})
+        # 👇 NEW: log speed mode
+        out.put_log(
+            "⚡ Fast mode: quicker answer with lighter analysis."
+            if fast_mode
+            else "🧠 Deep Thinking: multi-pass research and knowledge extraction enabled."
+        )
 
     def format_workflow_result(result):
         reply_text_en = format_result_text(internal_query, result)
@@ -113,6 +223,7 @@ async def chat_stream(
             for c in result.companies or []
         ] if hasattr(result, "companies") else []
 
+        cancel_token.raise_if_cancelled()
         layout = generate_document_and_slides(
             query=user_query,
             raw_text=reply_text,
@@ -141,6 +252,7 @@ async def chat_stream(
             layout=layout,
             base_folder="saved_docs",
             base_filename=base_filename,
+            cancel_token=cancel_token,
         )
 
         pdf_path = paths["pdf"]
@@ -183,6 +295,7 @@ async def chat_stream(
             )
 
         # ----------------- Save to history -----------------
+        cancel_token.raise_if_cancelled()
         entry_id = str(uuid.uuid4())
         created_at = datetime.utcnow().isoformat() + "Z"
 
@@ -210,12 +323,73 @@ async def chat_stream(
             "companies_visual": companies_visual,
             # you can also add "resources_visual" if you want it on the frontend
         }
-        return final_payload
+        return final_payload, layout, paths
+
+    def on_queue_position(position: int) -> None:
+        if position > 0:
+            if not queue_state["announced"]:
+                queue_state["announced"] = True
+                out.put_log(f"⏳ Research queue is busy, you are number {position} in line...")
+            out.put({"type": "queue", "lane": lane, "position": position})
+        elif queue_state["announced"]:
+            out.put({"type": "queue", "lane": lane, "position": 0})
+
+    queue_state = {"announced": False}
+
+    def run_research(topic_key, workflow):
+        try:
+            if cancel_token.cancelled:
+                print(f"[Cancel] client left while queued, skipping: {user_query!r}")
+                cancel_token.raise_if_cancelled()
+            pool = WORKFLOW_POOLS.pool(topic_key, workflow)
+            if pool.would_wait():
+                out.put_log(
+                    f"⏳ All {pool.max_size} research slots for this topic are busy; "
+                    "waiting for one to free up..."
+                )
+            with pool.checkout(timeout=WORKFLOW_CHECKOUT_TIMEOUT_S) as instance:
+                run_with_instance(instance)
+        except RunCancelled:
+            # Re-raised so the scheduler counts the run as cancelled.
+            print(f"[Cancel] research stopped ({cancel_token.reason}): {user_query!r}")
+            raise
+        except PoolTimeout:
+            out.put_log("⚠️ The server is busy with this topic, please try again in a few minutes.")
+        finally:
+            out.close()
 
     def run_workflow():
+        handed_off = False
+        try:
+            topic_key, workflow = admit()
+            if replay_cached():
+                return
+            send_run_settings()
+            try:
+                RESEARCH_SCHEDULER.submit(
+                    lambda: run_research(topic_key, workflow),
+                    lane=lane,
+                    on_position=on_queue_position,
+                )
+                handed_off = True
+            except QueueFull:
+                out.put_log("⚠️ The server is busy, please try again in a few minutes.")
+        except RunCancelled:
+            print(f"[Cancel] client left during admission: {user_query!r}")
+        finally:
+            # After hand-off the scheduled job closes the stream.
+            if not handed_off:
+                out.close()
+
+    def run_with_instance(workflow):
         # set callback just for this run
         workflow.set_llm(selected_model, selected_temperature)
         workflow.set_log_callback(log_callback)
+        # Workflows without cancellation support just run to the end; the
+        # checks after the run still skip the files and the history entry.
+        set_cancel_token = getattr(workflow, "set_cancel_token", None)
+        if set_cancel_token is not None:
+            set_cancel_token(cancel_token)
         try:
             # 👇 TRY to call with fast_mode; fall back to old signature if needed
             try:
@@ -223,33 +397,27 @@ async def chat_stream(
             except TypeError:
                 # Old workflows that don't know about fast_mode
                 result = workflow.run(internal_query)
-            final_payload = format_workflow_result(result)
-            q.put(json.dumps(final_payload))
+            cancel_token.raise_if_cancelled()
+            final_payload, layout, paths = format_workflow_result(result)
+            RUN_CACHE.put(
+                CachedRun(
+                    key=cache_key,
+                    state=result,
+                    layout=layout,
+                    file_paths=paths,
+                    final_payload=final_payload,
+                    query=user_query,
+                )
+            )
+            # The answer is never dropped: wait for the client as long as it is connected.
+            out.put(final_payload, timeout=None)
         finally:
             workflow.set_log_callback(None)
-            q.put("__DONE__")
+            if set_cancel_token is not None:
+                set_cancel_token(None)
 
 
-    # Run workflow in background thread so we can stream logs
+    # Admission runs in a background thread and hands the research run to the
+    # scheduler; the caller returns its stream right away and the topic event
+    # follows once classified.
     threading.Thread(target=run_workflow, daemon=True).start()
-
-    def event_generator():
-        # First send topic info so UI can update title immediately
-        topic_payload = {
-            "type": "topic",
-            "topic_key": topic_key,
-            "topic_label": topic_label_display,
-            "topic_domain": topic_domain,
-        }
-        yield f"data: {json.dumps(topic_payload)}\n\n"
-
-        while True:
-            item = q.get()
-            if item == "__DONE__":
-                break
-            yield f"data: {item}\n\n"
-
-    return StreamingResponse(
-        event_generator(),
-        media_type="text/event-stream",
-    )
@@ -0,0 +1,45 @@
+# src/api/routes/metrics.py
+from fastapi import APIRouter
+
+from ..message_catalog import MESSAGE_CATALOG
+from ..scheduler import RESEARCH_SCHEDULER
+from ..translation_memory import TRANSLATION_MEMORY
+from ..workflow_pool import WORKFLOW_POOLS
+
+router = APIRouter()
+
+
+@router.get("/metrics/workflow_pools")
+def workflow_pool_metrics():
+    """
+    Per-topic pool size, instances in use / idle, peak concurrency and the
+    checkout wait-time histogram.
+    """
+    return WORKFLOW_POOLS.metrics()
+
+
+@router.get("/metrics/scheduler")
+def scheduler_metrics():
+    """
+    Research workers busy, queue depth per lane, rejections (429s) and
+    per-lane queue wait times.
+    """
+    return RESEARCH_SCHEDULER.metrics()
+
+
+@router.get("/metrics/translation")
+def translation_metrics():
+    """
+    Message-catalog coverage: lines rendered from the bilingual table (hits)
+    vs. sent to the LLM translator (misses).
+    """
+    return MESSAGE_CATALOG.metrics()
+
+
+@router.get("/metrics/translation_memory")
+def translation_memory_metrics():
+    """
+    Translation memory size, paragraph/line hit rate, characters reused vs.
+    sent to the translator, and evictions.
+    """
+    return TRANSLATION_MEMORY.metrics()
@@ -0,0 +1,92 @@
+# src/api/routes/research.py
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from ...query_canon import canonicalize_query
+from ..models import ResearchJobResponse, ResearchRequest
+from ..research_jobs import RESEARCH_JOBS
+from ..scheduler import RESEARCH_SCHEDULER
+from .chat import queue_full_response, start_chat_run
+
+router = APIRouter()
+
+
+def _parse_event_id(value: Optional[str]) -> int:
+    try:
+        return max(0, int(value or 0))
+    except ValueError:
+        return 0
+
+
+@router.post("/research", response_model=ResearchJobResponse)
+def create_research_job(req: ResearchRequest):
+    """
+    Start a research run that outlives the HTTP connection and return its id.
+
+    Same pipeline and events as /chat_stream. Asking for the same
+    (query, mode, model) while that run is still going joins it instead of
+    starting another one, unless `fresh` is set.
+    """
+    selected_model = req.model or "gpt-4.1-mini"
+    selected_temperature = req.temperature if req.temperature is not None else 0.1
+    speed_mode = (req.mode or "fast").lower()
+
+    key = None if req.fresh else (canonicalize_query(req.message), speed_mode, selected_model)
+    job, created = RESEARCH_JOBS.get_or_create(key)
+    if created:
+        if RESEARCH_SCHEDULER.is_full():
+            RESEARCH_JOBS.discard(job)
+            return queue_full_response()
+        start_chat_run(
+            job,
+            user_query=req.message,
+            selected_model=selected_model,
+            selected_temperature=selected_temperature,
+            speed_mode=speed_mode,
+            bypass_cache=req.fresh,
+        )
+    else:
+        print(f"[Research] joined running job {job.id} for {req.message!r}")
+
+    return ResearchJobResponse(
+        job_id=job.id,
+        status=job.status,
+        events_url=f"/research/{job.id}/events",
+        result_url=f"/research/{job.id}",
+        joined=not created,
+    )
+
+
+@router.get("/research/{job_id}")
+def get_research_job(job_id: str):
+    """
+    Job status, topic and, once finished, the `final` payload.
+    """
+    job = RESEARCH_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Research job not found")
+    return job.summary()
+
+
+@router.get("/research/{job_id}/events")
+async def research_job_events(
+        job_id: str,
+        last_event_id: Optional[str] = Query(None),
+        last_event_id_header: Optional[str] = Header(None, alias="Last-Event-ID"),
+):
+    """
+    SSE stream of the job's events. Every event carries an `id:`; reconnecting
+    with `Last-Event-ID` (sent automatically by EventSource, or as the
+    `last_event_id` query parameter after a page reload) replays only what was
+    missed, then continues live. Disconnecting does not stop the run.
+    """
+    job = RESEARCH_JOBS.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Research job not found")
+    after = _parse_event_id(last_event_id_header or last_event_id)
+    return StreamingResponse(
+        job.events(last_event_id=after),
+        media_type="text/event-stream",
+    )
@@ -2,12 +2,14 @@
 from fastapi import APIRouter
 
 from ..models import TopicRequest, TopicResponse
-from ..deps import classify_topic_with_llm
+from ..deps import classify_topic as route_query
 
 router = APIRouter()
 
 
+# Plain def: FastAPI runs it in the threadpool, so the local predict and the
+# blocking LLM fallback stay off the event loop.
 @router.post("/classify_topic", response_model=TopicResponse)
-async def classify_topic(req: TopicRequest) -> TopicResponse:
-    key, label = classify_topic_with_llm(req.message)
+def classify_topic(req: TopicRequest) -> TopicResponse:
+    key, label, _ = route_query(req.message)
     return TopicResponse(topic_key=key, topic_label=label)
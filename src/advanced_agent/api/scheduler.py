@@ -0,0 +1,192 @@
+# src/api/scheduler.py
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from ..cancellation import RunCancelled
+from .wait_stats import WaitHistogram
+
+# Research runs executing at once (each drives Firecrawl + LLM calls).
+RESEARCH_WORKERS = int(os.getenv("RESEARCH_WORKERS", "4"))
+# Runs allowed to wait for a worker; beyond this new chats get HTTP 429.
+RESEARCH_QUEUE_MAX = int(os.getenv("RESEARCH_QUEUE_MAX", "32"))
+# Fast runs go first; a deep run waiting longer than this is taken next anyway.
+DEEP_MAX_WAIT_S = float(os.getenv("RESEARCH_DEEP_MAX_WAIT_S", "60"))
+
+LANES: Tuple[str, ...] = ("fast", "deep")
+
+
+class QueueFull(Exception):
+    """The research queue is at capacity."""
+
+
+@dataclass
+class ResearchJob:
+    fn: Callable[[], Any]
+    lane: str
+    # Called (from a scheduler thread) with the 1-based queue position while
+    # waiting, and with 0 when the job starts.
+    on_position: Optional[Callable[[int], None]] = None
+    enqueued_at: float = field(default_factory=time.monotonic)
+    last_position: int = -1
+
+
+class ResearchScheduler:
+    """
+    Fixed pool of worker threads fed from two bounded priority lanes.
+
+    submit() never blocks: it queues the job or raises QueueFull. Waiting jobs
+    hear about their queue position whenever it changes.
+    """
+
+    def __init__(
+        self,
+        workers: int = RESEARCH_WORKERS,
+        queue_max: int = RESEARCH_QUEUE_MAX,
+        deep_max_wait_s: float = DEEP_MAX_WAIT_S,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.queue_max = queue_max
+        self.deep_max_wait_s = deep_max_wait_s
+        self._lanes: Dict[str, Deque[ResearchJob]] = {lane: deque() for lane in LANES}
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._busy = 0
+
+        # metrics
+        self.submitted = 0
+        self.rejected = 0
+        self.completed = 0
+        self.failed = 0
+        # Runs whose client left, while queued or mid-run (job raised RunCancelled).
+        self.cancelled = 0
+        self.peak_depth = 0
+        self.wait_times: Dict[str, WaitHistogram] = {lane: WaitHistogram() for lane in LANES}
+
+    # ---------------- queue ----------------
+
+    def _depth(self) -> int:
+        return sum(len(q) for q in self._lanes.values())
+
+    def _ordered(self) -> List[ResearchJob]:
+        """Waiting jobs in the order they will be started (ignoring aging)."""
+        return list(self._lanes["fast"]) + list(self._lanes["deep"])
+
+    def is_full(self) -> bool:
+        with self._cond:
+            return self._depth() >= self.queue_max
+
+    def submit(
+        self,
+        fn: Callable[[], Any],
+        lane: str = "fast",
+        on_position: Optional[Callable[[int], None]] = None,
+    ) -> ResearchJob:
+        if lane not in self._lanes:
+            raise ValueError(f"unknown lane {lane!r}")
+        job = ResearchJob(fn=fn, lane=lane, on_position=on_position)
+        with self._cond:
+            if self._depth() >= self.queue_max:
+                self.rejected += 1
+                raise QueueFull(f"{self._depth()} research runs already waiting")
+            self._ensure_workers()
+            self._lanes[lane].append(job)
+            self.submitted += 1
+            self.peak_depth = max(self.peak_depth, self._depth())
+            self._cond.notify()
+        self._announce_positions()
+        return job
+
+    def _next_job(self) -> ResearchJob:
+        fast, deep = self._lanes["fast"], self._lanes["deep"]
+        if deep and (not fast or time.monotonic() - deep[0].enqueued_at >= self.deep_max_wait_s):
+            return deep.popleft()
+        return fast.popleft()
+
+    def _announce_positions(self) -> None:
+        with self._cond:
+            # Jobs an idle worker is about to pick up are not really waiting.
+            free = max(0, self.workers - self._busy)
+            changed = []
+            for index, job in enumerate(self._ordered(), start=1):
+                position = index - free
+                if position > 0 and job.last_position != position:
+                    job.last_position = position
+                    changed.append((job, position))
+        for job, position in changed:
+            _notify(job, position)
+
+    # ---------------- workers ----------------
+
+    def _ensure_workers(self) -> None:
+        # Called with the lock held; threads are started on first use.
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(
+                target=self._work, name=f"research-worker-{len(self._threads)}", daemon=True
+            )
+            self._threads.append(thread)
+            thread.start()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                self._cond.wait_for(self._depth)
+                job = self._next_job()
+                self._busy += 1
+                self.wait_times[job.lane].record(time.monotonic() - job.enqueued_at)
+            self._announce_positions()
+            _notify(job, 0)
+            completed = cancelled = False
+            try:
+                job.fn()
+                completed = True
+            except RunCancelled as e:
+                print(f"[Scheduler] {job.lane} job cancelled: {e}")
+                cancelled = True
+            except Exception as e:
+                print(f"[Scheduler] {job.lane} job failed: {e}")
+            with self._cond:
+                self._busy -= 1
+                self.completed += completed
+                self.cancelled += cancelled
+                self.failed += not (completed or cancelled)
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "busy": self._busy,
+                "queue_max": self.queue_max,
+                "queue_depth": {lane: len(q) for lane, q in self._lanes.items()},
+                "peak_depth": self.peak_depth,
+                "submitted": self.submitted,
+                "rejected": self.rejected,
+                "completed": self.completed,
+                "failed": self.failed,
+                "cancelled": self.cancelled,
+                "wait": {
+                    lane: {
+                        "mean_s": round(h.mean_s, 4),
+                        "max_s": round(h.max_s, 4),
+                        "histogram": h.histogram(),
+                    }
+                    for lane, h in self.wait_times.items()
+                },
+            }
+
+
+def _notify(job: ResearchJob, position: int) -> None:
+    if job.on_position is None:
+        return
+    try:
+        job.on_position(position)
+    except Exception as e:
+        print(f"[Scheduler] position callback failed: {e}")
+
+
+RESEARCH_SCHEDULER = ResearchScheduler()
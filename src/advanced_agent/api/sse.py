@@ -0,0 +1,107 @@
+# src/api/sse.py
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Union
+
+# Max undelivered events per stream; a worker producing faster than the
+# client reads blocks (backpressure) instead of growing memory.
+STREAM_QUEUE_MAX = 256
+# How long a worker waits for queue space before dropping a log line.
+STREAM_PUT_TIMEOUT_S = 30.0
+# An SSE comment is sent when nothing else was sent for this long, so proxies
+# and browsers keep idle streams open. EventSource ignores comments.
+HEARTBEAT_INTERVAL_S = 15.0
+
+_DONE = object()
+
+
+def sse_data(payload: Union[str, Dict[str, Any]], event_id: Optional[int] = None) -> str:
+    data = payload if isinstance(payload, str) else json.dumps(payload)
+    if event_id is None:
+        return f"data: {data}\n\n"
+    return f"id: {event_id}\ndata: {data}\n\n"
+
+
+class SSEChannel:
+    """
+    Bounded asyncio.Queue between a worker thread and an async SSE generator.
+
+    The worker calls put()/close() from its own thread; the handoff goes
+    through the event loop, so no threadpool worker is held while a client
+    waits for the next event. Code running on the loop uses put_nowait().
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        maxsize: int = STREAM_QUEUE_MAX,
+        heartbeat_s: float = HEARTBEAT_INTERVAL_S,
+    ) -> None:
+        self.loop = loop
+        self.heartbeat_s = heartbeat_s
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.disconnected = False
+        self.dropped = 0
+        # Called once if the client goes away before the stream is closed.
+        self.on_disconnect: Optional[Callable[[], None]] = None
+
+    # ---------- producer side ----------
+
+    def put_nowait(self, payload: Union[str, Dict[str, Any]]) -> None:
+        """Loop-side enqueue (before the worker starts)."""
+        self._queue.put_nowait(payload)
+
+    def _put_threadsafe(self, item: Any, timeout: Optional[float]) -> bool:
+        if self.disconnected:
+            return False
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(item), self.loop)
+        try:
+            future.result(timeout)
+            return True
+        except FutureTimeoutError:
+            future.cancel()
+            return False
+        except RuntimeError:
+            # loop closed (server shutting down)
+            return False
+
+    def put(self, payload: Union[str, Dict[str, Any]], timeout: Optional[float] = STREAM_PUT_TIMEOUT_S) -> bool:
+        """
+        Worker-side enqueue; blocks while the queue is full. Returns False if
+        the client is gone or no space freed up within `timeout`.
+        """
+        ok = self._put_threadsafe(payload, timeout)
+        if not ok and not self.disconnected:
+            self.dropped += 1
+            print(f"[SSE] slow client, dropped event ({self.dropped} so far)")
+        return ok
+
+    def close(self) -> None:
+        """Worker-side end of stream."""
+        self._put_threadsafe(_DONE, None)
+
+    # ---------- consumer side ----------
+
+    async def events(self) -> AsyncIterator[str]:
+        finished = False
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=self.heartbeat_s)
+                except asyncio.TimeoutError:
+                    yield ": heartbeat\n\n"
+                    continue
+                if item is _DONE:
+                    finished = True
+                    break
+                yield sse_data(item)
+        finally:
+            # Client went away (or stream ended): unblock any waiting producer.
+            self.disconnected = True
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            if not finished and self.on_disconnect is not None:
+                self.on_disconnect()
@@ -0,0 +1,342 @@
+# src/api/topic_classifier.py
+from __future__ import annotations
+
+import json
+import math
+import os
+import re
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+# Queries the LLM router had to decide; replayed as training data on the next fit.
+ROUTE_LOG_PATH = Path("saved_docs") / "topic_routes.json"
+ROUTE_LOG_MAX_ENTRIES = 5000
+# Only the most recent logged routes are trained on, which bounds refit time.
+ROUTE_TRAINING_MAX_ENTRIES = int(os.getenv("TOPIC_ROUTE_TRAINING_MAX", "1000"))
+
+# Below this top-class probability the query is escalated to the LLM router.
+DEFAULT_CONFIDENCE_THRESHOLD = 0.75
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#.-]*")
+_QUOTED_RE = re.compile(r"'([^']{6,})'")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+
+# Description sentences that point *away* from a topic ("... route to X instead").
+_NEGATIVE_SENTENCE_RE = re.compile(r"\binstead\b|\bdo not\b|\bnot about\b|\bnot for\b", re.IGNORECASE)
+
+_STOPWORDS = {
+    "a", "an", "the", "and", "or", "for", "of", "to", "in", "on", "with", "about", "at", "by",
+    "is", "are", "be", "it", "this", "that", "my", "me", "i", "we", "our", "you", "your",
+    "what", "which", "how", "should", "can", "do", "does", "e.g", "etc", "like", "as",
+}
+
+
+def _stem(token: str) -> str:
+    if len(token) <= 3:
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def featurize(text: str) -> List[str]:
+    """
+    Stemmed unigrams, bigrams over the unfiltered word sequence, and character
+    4-grams of longer words (so "microservice" still overlaps "micro-services").
+    """
+    words = [_stem(w.strip(".-")) for w in _WORD_RE.findall((text or "").lower())]
+    words = [w for w in words if w]
+    features = [w for w in words if w not in _STOPWORDS]
+    features.extend(f"{a} {b}" for a, b in zip(words, words[1:]))
+    for w in words:
+        if len(w) > 5:
+            padded = f"<{w}>"
+            features.extend(f"#{padded[i:i + 4]}" for i in range(len(padded) - 3))
+    return features
+
+
+def description_examples(label: str, description: str) -> List[str]:
+    """
+    Training texts for one topic: its label, every description sentence that
+    describes the topic (not the ones redirecting elsewhere) and the example
+    questions quoted in those sentences.
+    """
+    examples = [label]
+    for sentence in _SENTENCE_RE.split(description or ""):
+        if not sentence.strip() or _NEGATIVE_SENTENCE_RE.search(sentence):
+            continue
+        quoted = _QUOTED_RE.findall(sentence)
+        examples.extend(quoted)
+        remainder = _QUOTED_RE.sub(" ", sentence).strip(" .,:")
+        if len(remainder.split()) >= 3:
+            examples.append(remainder)
+    return examples
+
+
+@dataclass
+class TopicPrediction:
+    key: str
+    confidence: float
+    runner_up: str
+    runner_up_confidence: float
+
+
+class LocalTopicClassifier:
+    """
+    TF-IDF features + multinomial logistic regression, trained in-process from
+    the topic descriptions, their quoted example questions and the queries the
+    LLM router has already decided (ROUTE_LOG_PATH).
+
+    Fits lazily on first use (about a second for the built-in topics) and
+    predicts in microseconds, so the LLM is only needed for low-confidence queries.
+    Refits triggered by record() run in one background thread at a time; the
+    previous model keeps serving until the new one is swapped in.
+    """
+
+    def __init__(
+        self,
+        topics: Mapping[str, Any],
+        log_path: Optional[Path] = ROUTE_LOG_PATH,
+        confidence_threshold: float = DEFAULT_CONFIDENCE_THRESHOLD,
+        refit_every: int = 25,
+        max_training_routes: int = ROUTE_TRAINING_MAX_ENTRIES,
+        epochs: int = 200,
+        learning_rate: float = 0.1,
+        l2: float = 1e-7,
+    ) -> None:
+        self.topics = dict(topics)
+        self.log_path = Path(log_path) if log_path is not None else None
+        self.confidence_threshold = confidence_threshold
+        self.refit_every = refit_every
+        self.max_training_routes = max_training_routes
+        self.epochs = epochs
+        self.learning_rate = learning_rate
+        self.l2 = l2
+
+        self._lock = threading.Lock()
+        self._fit_lock = threading.Lock()
+        self._keys: List[str] = list(self.topics.keys())
+        # (vocab, idf, weights, bias), replaced atomically by fit()
+        self._model: Optional[Tuple[Dict[str, int], np.ndarray, np.ndarray, np.ndarray]] = None
+        self._unfitted_routes = 0
+        self._refitting = False
+
+    # ---------------- training data ----------------
+
+    def _load_routes(self) -> List[Dict[str, str]]:
+        if self.log_path is None or not self.log_path.exists():
+            return []
+        try:
+            data = json.loads(self.log_path.read_text(encoding="utf-8"))
+        except Exception:
+            return []
+        return data if isinstance(data, list) else []
+
+    def training_examples(self) -> List[Tuple[str, str]]:
+        examples: List[Tuple[str, str]] = []
+        for key, cfg in self.topics.items():
+            for text in description_examples(cfg.label, cfg.description):
+                examples.append((text, key))
+        routes = [
+            route for route in self._load_routes()
+            if route.get("topic_key") in self.topics and route.get("query")
+        ]
+        for route in routes[-self.max_training_routes:] if self.max_training_routes > 0 else []:
+            examples.append((route["query"], route["topic_key"]))
+        return examples
+
+    # ---------------- features ----------------
+
+    @staticmethod
+    def _sparse_vector(
+        text: str, vocab: Dict[str, int], idf: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (column indices, L2-normalized log-TF * IDF values) of the known features.
+        """
+        counts: Dict[int, int] = {}
+        for feature in featurize(text):
+            col = vocab.get(feature)
+            if col is not None:
+                counts[col] = counts.get(col, 0) + 1
+        cols = np.fromiter(counts.keys(), dtype=np.int64, count=len(counts))
+        values = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        values *= idf[cols]
+        norm = float(np.linalg.norm(values))
+        return cols, (values / norm if norm > 0 else values)
+
+    # ---------------- model ----------------
+
+    def fit(self) -> None:
+        with self._lock:
+            seen_routes = self._unfitted_routes
+        examples = self.training_examples()
+        texts = [text for text, _ in examples]
+        labels = np.array([self._keys.index(key) for _, key in examples])
+
+        doc_freq: Dict[str, int] = {}
+        for text in texts:
+            for feature in set(featurize(text)):
+                doc_freq[feature] = doc_freq.get(feature, 0) + 1
+        features = sorted(doc_freq)
+        vocab = {feature: i for i, feature in enumerate(features)}
+        idf = np.array(
+            [math.log((1 + len(texts)) / (1 + doc_freq[f])) + 1.0 for f in features],
+            dtype=np.float32,
+        )
+
+        # Sparse design matrix: the non-zero (row, column, value) entries in row
+        # order, plus the same entries in column order for the gradient. A dense
+        # texts x features matrix is almost all zeros and grows with every
+        # logged route.
+        row_parts, col_parts, value_parts = [], [], []
+        for row, text in enumerate(texts):
+            cols, values = self._sparse_vector(text, vocab, idf)
+            row_parts.append(np.full(len(cols), row, dtype=np.int64))
+            col_parts.append(cols)
+            value_parts.append(values)
+        rows = np.concatenate(row_parts)
+        cols = np.concatenate(col_parts)
+        values = np.concatenate(value_parts).astype(np.float32)[:, None]
+        by_row = _Segments(rows, len(texts))
+        by_col = _Segments(cols, len(vocab))
+        y = np.zeros((len(texts), len(self._keys)), dtype=np.float32)
+        y[np.arange(len(texts)), labels] = 1.0
+
+        # Every topic counts equally, however many examples it has.
+        class_counts = y.sum(axis=0)
+        sample_weight = (1.0 / np.maximum(class_counts, 1.0))[labels]
+        sample_weight = (sample_weight / sample_weight.sum()).astype(np.float32)
+
+        # Full-batch Adam; plain gradient descent needs thousands of epochs here
+        # because each example only touches a handful of sparse features.
+        params = [
+            np.zeros((len(vocab), len(self._keys)), dtype=np.float32),
+            np.zeros(len(self._keys), dtype=np.float32),
+        ]
+        moments = [(np.zeros_like(p), np.zeros_like(p)) for p in params]
+        beta1, beta2 = 0.9, 0.999
+        for step in range(1, self.epochs + 1):
+            weights, bias = params
+            probs = _softmax(by_row.sum(values * weights[cols]) + bias)
+            grad = (probs - y) * sample_weight[:, None]
+            grads = [by_col.sum(values * grad[rows]) + self.l2 * weights, grad.sum(axis=0)]
+            for param, g, (m, v) in zip(params, grads, moments):
+                m *= beta1
+                m += (1 - beta1) * g
+                v *= beta2
+                v += (1 - beta2) * g * g
+                m_hat = m / (1 - beta1 ** step)
+                v_hat = v / (1 - beta2 ** step)
+                param -= self.learning_rate * m_hat / (np.sqrt(v_hat) + 1e-8)
+
+        # Swap the whole model at once so concurrent predicts never mix versions.
+        with self._lock:
+            self._model = (vocab, idf, params[0], params[1])
+            # Routes recorded while fitting count towards the next refit.
+            self._unfitted_routes = max(0, self._unfitted_routes - seen_routes)
+        print(f"[TopicClassifier] fitted on {len(texts)} examples, {len(vocab)} features")
+
+    def predict(self, query: str) -> TopicPrediction:
+        if self._model is None:
+            with self._fit_lock:
+                if self._model is None:
+                    self.fit()
+        vocab, idf, weights, bias = self._model
+        cols, values = self._sparse_vector(query, vocab, idf)
+        probs = _softmax((values @ weights[cols] + bias)[None, :])[0]
+        second, best = np.argpartition(probs, -2)[-2:]
+        if probs[second] > probs[best]:
+            best, second = second, best
+        return TopicPrediction(
+            key=self._keys[best],
+            confidence=float(probs[best]),
+            runner_up=self._keys[second],
+            runner_up_confidence=float(probs[second]),
+        )
+
+    def predict_if_ready(self, query: str) -> Optional[TopicPrediction]:
+        """
+        predict(), or None while no model has been fitted yet; the first fit is
+        then started in the background instead of blocking the caller.
+        """
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    self._start_refit_locked()
+                    return None
+        return self.predict(query)
+
+    def is_confident(self, prediction: TopicPrediction) -> bool:
+        return prediction.confidence >= self.confidence_threshold
+
+    def record(self, query: str, topic_key: str) -> Optional[threading.Thread]:
+        """
+        Remember an LLM routing decision; after `refit_every` new ones the model
+        refits in a background thread (returned, for callers that want to wait).
+        Never blocks on a fit, and at most one refit runs at a time.
+        """
+        if self.log_path is None or topic_key not in self.topics:
+            return None
+        with self._lock:
+            routes = self._load_routes()
+            routes.append({"query": query, "topic_key": topic_key})
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self.log_path.write_text(
+                json.dumps(routes[-ROUTE_LOG_MAX_ENTRIES:], ensure_ascii=False, indent=2),
+                encoding="utf-8",
+            )
+            self._unfitted_routes += 1
+            if self._unfitted_routes < self.refit_every:
+                return None
+            return self._start_refit_locked()
+
+    def _start_refit_locked(self) -> Optional[threading.Thread]:
+        """Called with _lock held: start a background fit unless one is running."""
+        if self._refitting:
+            return None
+        self._refitting = True
+        thread = threading.Thread(target=self._refit, name="topic-classifier-refit", daemon=True)
+        thread.start()
+        return thread
+
+    def _refit(self) -> None:
+        try:
+            with self._fit_lock:
+                self.fit()
+        except Exception as e:
+            print(f"[TopicClassifier] refit failed: {e}")
+        finally:
+            with self._lock:
+                self._refitting = False
+
+
+class _Segments:
+    """
+    Sums per-entry rows of a sparse matrix into `size` groups (its rows or its
+    columns) with one np.add.reduceat; much faster than np.add.at.
+    """
+
+    def __init__(self, group_of_entry: np.ndarray, size: int) -> None:
+        self.order = np.argsort(group_of_entry, kind="stable")
+        sorted_groups = group_of_entry[self.order]
+        self.groups, self.starts = np.unique(sorted_groups, return_index=True)
+        self.size = size
+
+    def sum(self, entries: np.ndarray) -> np.ndarray:
+        out = np.zeros((self.size,) + entries.shape[1:], dtype=entries.dtype)
+        if len(self.groups):
+            out[self.groups] = np.add.reduceat(entries[self.order], self.starts, axis=0)
+        return out
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    shifted = logits - logits.max(axis=1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=1, keepdims=True)
@@ -1,11 +1,19 @@
 # --- Translation helpers ---
 from langchain_core.messages import SystemMessage, HumanMessage
 from langchain_openai import ChatOpenAI
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
 import json
+import os
+
+from .translation_memory import TRANSLATION_MEMORY, SegmentMismatch
 
 # use the cheapest model for small jobs like this
 translator_llm = ChatOpenAI(model="gpt-4.1-nano", temperature=0)
 
+# Concurrent one-text calls when a batched reply cannot be lined up.
+TRANSLATE_FALLBACK_WORKERS = int(os.getenv("TRANSLATE_FALLBACK_WORKERS", "8"))
+
 def is_chinese(text: str) -> bool:
     """Heuristic: check if there's at least one CJK character."""
     return any("\u4e00" <= ch <= "\u9fff" for ch in text)
@@ -13,7 +21,25 @@ def is_chinese(text: str) -> bool:
 def translate_text(text: str, target_lang: str) -> str:
     """
     Translate arbitrary text into target_lang ("English", "Chinese", etc.)
+
+    Goes through the translation memory: paragraphs translated before are
+    reused and only unseen ones are sent to the model (in one call).
     """
+    text = text.strip()
+    if not text:
+        return text
+    return TRANSLATION_MEMORY.translate(text, target_lang, _llm_translate_array, _llm_translate)
+
+
+def translate_batch(texts: List[str], target_lang: str) -> List[str]:
+    """
+    Translate several short texts, reusing remembered translations; the
+    unseen ones share one LLM call.
+    """
+    return TRANSLATION_MEMORY.translate_many(texts, target_lang, _llm_translate_batch)
+
+
+def _llm_translate(text: str, target_lang: str) -> str:
     text = text.strip()
     if not text:
         return text
@@ -30,3 +56,54 @@ def translate_text(text: str, target_lang: str) -> str:
     ]
     resp = translator_llm.invoke(messages)
     return resp.content.strip()
+
+
+def _llm_translate_array(texts: List[str], target_lang: str) -> List[str]:
+    """
+    Translate several texts in one LLM call (JSON array in, JSON array out,
+    same order). Raises SegmentMismatch if the reply is not an array of the
+    same length.
+    """
+    if not texts:
+        return []
+    if len(texts) == 1:
+        return [_llm_translate(texts[0], target_lang)]
+
+    system = (
+        f"You are a precise translator. "
+        f"The user sends a JSON array of strings. Translate every string into {target_lang}. "
+        f"Preserve technical terms, emojis and formatting. "
+        f"Reply with ONLY a JSON array of the translated strings, same length and same order."
+    )
+    messages = [
+        SystemMessage(content=system),
+        HumanMessage(content=json.dumps(texts, ensure_ascii=False)),
+    ]
+    resp = translator_llm.invoke(messages)
+    raw = resp.content.strip()
+    if raw.startswith("```"):
+        raw = raw.strip("`").removeprefix("json").strip()
+    try:
+        translated = json.loads(raw)
+    except ValueError:
+        translated = None
+    if (
+        isinstance(translated, list)
+        and len(translated) == len(texts)
+        and all(isinstance(t, str) for t in translated)
+    ):
+        return [t.strip() for t in translated]
+    raise SegmentMismatch(f"batch reply did not match {len(texts)} inputs")
+
+
+def _llm_translate_batch(texts: List[str], target_lang: str) -> List[str]:
+    """
+    _llm_translate_array, falling back to one call per text, run in parallel,
+    if the reply does not line up.
+    """
+    try:
+        return _llm_translate_array(texts, target_lang)
+    except SegmentMismatch:
+        print(f"[Translate] batch reply did not match {len(texts)} inputs; translating them in parallel")
+    with ThreadPoolExecutor(max_workers=min(len(texts), TRANSLATE_FALLBACK_WORKERS)) as executor:
+        return list(executor.map(lambda t: _llm_translate(t, target_lang), texts))
@@ -0,0 +1,307 @@
+# src/api/translation_memory.py
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+TRANSLATION_MEMORY_PATH = Path("saved_docs") / "translation_memory.json"
+# Stored translations are evicted least-recently-used first beyond this size.
+TRANSLATION_MEMORY_MAX_BYTES = int(os.getenv("TRANSLATION_MEMORY_MAX_BYTES", str(5 * 1024 * 1024)))
+# New entries are written to disk at most this often, off the translating thread.
+TRANSLATION_MEMORY_SAVE_INTERVAL_S = float(os.getenv("TRANSLATION_MEMORY_SAVE_INTERVAL_S", "2.0"))
+
+BatchTranslator = Callable[[List[str], str], List[str]]
+DocumentTranslator = Callable[[str, str], str]
+
+# Paragraph separators (blank lines) are kept verbatim between segments.
+_PARAGRAPH_SPLIT_RE = re.compile(r"(\n[ \t]*\n+)")
+_FENCE_RE = re.compile(r"^\s*(```|~~~)", re.MULTILINE)
+_WORD_RE = re.compile(r"[^\W\d_]", re.UNICODE)
+
+
+class SegmentMismatch(Exception):
+    """A batch translator's reply does not line up with the texts it was sent."""
+
+
+def segment_key(text: str, target_lang: str) -> str:
+    """
+    (target language, whitespace-insensitive text hash) -> stored translation.
+    """
+    normalized = " ".join(text.split())
+    digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:24]
+    return f"{target_lang}::{digest}"
+
+
+def split_segments(text: str) -> List[str]:
+    """
+    Split markdown into paragraphs and the blank-line separators between
+    them; "".join(result) == text. A fenced code block stays one segment even
+    if it contains blank lines.
+    """
+    parts = _PARAGRAPH_SPLIT_RE.split(text)
+    segments: List[str] = []
+    in_fence = False
+    for part in parts:
+        if in_fence:
+            segments[-1] += part
+        else:
+            segments.append(part)
+        if not _PARAGRAPH_SPLIT_RE.fullmatch(part) and len(_FENCE_RE.findall(part)) % 2 == 1:
+            in_fence = not in_fence
+    return segments
+
+
+def _needs_translation(segment: str) -> bool:
+    """Separators, numbers and rules like '---' are copied as-is."""
+    return bool(_WORD_RE.search(segment))
+
+
+def _translate_paragraphs(
+    paragraphs: List[str],
+    target_lang: str,
+    translate: BatchTranslator,
+    translate_document: DocumentTranslator,
+) -> List[str]:
+    """
+    `translate`, or on SegmentMismatch one `translate_document` call over the
+    paragraphs joined by blank lines, split back into the same number of
+    paragraphs (SegmentMismatch if the count differs).
+    """
+    try:
+        return translate(paragraphs, target_lang)
+    except SegmentMismatch:
+        print(
+            f"[TranslationMemory] batch reply did not match {len(paragraphs)} paragraphs; "
+            f"translating them as one document"
+        )
+    joined = translate_document("\n\n".join(paragraphs), target_lang)
+    parts = [
+        segment.strip()
+        for segment in split_segments(joined)
+        if segment.strip() and not _PARAGRAPH_SPLIT_RE.fullmatch(segment)
+    ]
+    if len(parts) != len(paragraphs):
+        raise SegmentMismatch(f"expected {len(paragraphs)} paragraphs, got {len(parts)}")
+    return parts
+
+
+class TranslationMemory:
+    """
+    JSON-file backed translation memory keyed by (target language, text hash).
+
+    translate() splits a document into paragraphs, reuses every paragraph
+    translated before and sends only unseen ones to the translator, in one
+    batched call. Entries are kept in least-recently-used order and evicted
+    once their total size passes `max_bytes`. Loaded lazily; changes are
+    written by a timer at most every `save_interval_s`, outside the lock, so
+    translating never waits on a multi-megabyte file write.
+    """
+
+    def __init__(
+        self,
+        path: Path = TRANSLATION_MEMORY_PATH,
+        max_bytes: int = TRANSLATION_MEMORY_MAX_BYTES,
+        save_interval_s: float = TRANSLATION_MEMORY_SAVE_INTERVAL_S,
+    ) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.save_interval_s = save_interval_s
+        self._entries: Optional["OrderedDict[str, Dict[str, Any]]"] = None
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Serializes file writes; never held together with _lock.
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._save_timer: Optional[threading.Timer] = None
+
+        # metrics
+        self.hits = 0
+        self.misses = 0
+        self.chars_reused = 0
+        self.chars_translated = 0
+        self.evictions = 0
+
+    # ---------- storage ----------
+
+    def _loaded(self) -> "OrderedDict[str, Dict[str, Any]]":
+        if self._entries is None:
+            self._entries = OrderedDict()
+            self._bytes = 0
+            if self.path.exists():
+                try:
+                    raw = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+                    for key, item in sorted(raw.items(), key=lambda kv: kv[1].get("used_at", 0)):
+                        self._entries[key] = item
+                        self._bytes += item["bytes"]
+                except Exception as e:
+                    # Corrupted file? Start empty rather than failing translation.
+                    print(f"[TranslationMemory] could not read {self.path}: {e}")
+                    self._entries = OrderedDict()
+                    self._bytes = 0
+        return self._entries
+
+    def _schedule_save(self) -> None:
+        """Called with the lock held after the entries changed."""
+        self._dirty = True
+        if self._save_timer is None:
+            self._save_timer = threading.Timer(self.save_interval_s, self.flush)
+            self._save_timer.daemon = True
+            self._save_timer.start()
+
+    def flush(self) -> None:
+        """Write pending changes now (also run by the save timer and at exit)."""
+        with self._write_lock:
+            with self._lock:
+                self._save_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                snapshot = {key: dict(item) for key, item in self._loaded().items()}
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.path.write_text(json.dumps(snapshot, ensure_ascii=False), encoding="utf-8")
+            except Exception as e:
+                print(f"[TranslationMemory] could not write {self.path}: {e}")
+
+    def _get(self, key: str) -> Optional[str]:
+        entries = self._loaded()
+        item = entries.get(key)
+        if item is None:
+            return None
+        item["used_at"] = time.time()
+        entries.move_to_end(key)
+        return item["text"]
+
+    def _put(self, key: str, translation: str) -> None:
+        entries = self._loaded()
+        old = entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old["bytes"]
+        size = len(translation.encode("utf-8"))
+        entries[key] = {"text": translation, "bytes": size, "used_at": time.time()}
+        self._bytes += size
+        while self._bytes > self.max_bytes and len(entries) > 1:
+            _, evicted = entries.popitem(last=False)
+            self._bytes -= evicted["bytes"]
+            self.evictions += 1
+
+    # ---------- translation ----------
+
+    def translate_many(
+        self,
+        texts: List[str],
+        target_lang: str,
+        translate: BatchTranslator,
+    ) -> List[str]:
+        """
+        Whole-string lookups; unseen texts go to `translate` in one call.
+        Texts without any words are returned unchanged.
+        """
+        results: List[Optional[str]] = list(texts)
+        lookups = [i for i, text in enumerate(texts) if _needs_translation(text)]
+        with self._lock:
+            for i in lookups:
+                results[i] = self._get(segment_key(texts[i], target_lang))
+        missing = [i for i in lookups if results[i] is None]
+        # Identical unseen texts in one call are translated once.
+        unique = list(dict.fromkeys(texts[i].strip() for i in missing))
+
+        translated: Dict[str, str] = {}
+        if unique:
+            translated = dict(zip(unique, translate(unique, target_lang)))
+
+        with self._lock:
+            for i in missing:
+                results[i] = translated.get(texts[i].strip(), texts[i])
+            for source, target in translated.items():
+                self._put(segment_key(source, target_lang), target)
+            self.hits += len(lookups) - len(missing)
+            self.misses += len(missing)
+            self.chars_reused += sum(len(texts[i]) for i in lookups) - sum(len(texts[i]) for i in missing)
+            self.chars_translated += sum(len(source) for source in unique)
+            if translated:
+                self._schedule_save()
+        return [r if r is not None else t for r, t in zip(results, texts)]
+
+    def translate(
+        self,
+        text: str,
+        target_lang: str,
+        translate: BatchTranslator,
+        translate_document: Optional[DocumentTranslator] = None,
+    ) -> str:
+        """
+        Paragraph-level reuse for one document: only paragraphs not seen
+        before (for this language) are translated; separators, code fences
+        and leading/trailing whitespace are kept.
+
+        If `translate` raises SegmentMismatch (the model merged or split
+        paragraphs), the unseen paragraphs go to `translate_document` as one
+        joined document and are split back at blank lines. If that does not
+        line up either, the whole document is translated in one call and
+        nothing is stored.
+        """
+        segments = split_segments(text)
+        slots: List[Tuple[int, str, str, str]] = []
+        for index, segment in enumerate(segments):
+            if _PARAGRAPH_SPLIT_RE.fullmatch(segment) or not _needs_translation(segment):
+                continue
+            core = segment.strip()
+            lead = segment[: len(segment) - len(segment.lstrip())]
+            trail = segment[len(segment.rstrip()):]
+            slots.append((index, core, lead, trail))
+        if not slots:
+            return text
+
+        batch: BatchTranslator = translate
+        if translate_document is not None:
+            batch = partial(_translate_paragraphs, translate=translate, translate_document=translate_document)
+
+        try:
+            translated = self.translate_many([core for _, core, _, _ in slots], target_lang, batch)
+        except SegmentMismatch:
+            if translate_document is None:
+                raise
+            print("[TranslationMemory] paragraphs did not line up; translating the document whole")
+            return translate_document(text, target_lang)
+        for (index, _, lead, trail), target in zip(slots, translated):
+            segments[index] = f"{lead}{target}{trail}"
+        return "".join(segments)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = OrderedDict()
+            self._bytes = 0
+            self._schedule_save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded())
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "entries": len(self._loaded()),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / total, 4) if total else None,
+                "chars_reused": self.chars_reused,
+                "chars_translated": self.chars_translated,
+                "evictions": self.evictions,
+            }
+
+
+TRANSLATION_MEMORY = TranslationMemory()
+atexit.register(TRANSLATION_MEMORY.flush)
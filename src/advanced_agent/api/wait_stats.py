@@ -0,0 +1,36 @@
+# src/api/wait_stats.py
+from __future__ import annotations
+
+import bisect
+from typing import Dict, Tuple
+
+# Upper bounds (seconds) of the wait-time histogram buckets.
+WAIT_BUCKETS_S: Tuple[float, ...] = (0.01, 0.1, 0.5, 1.0, 5.0, 30.0, 120.0)
+
+
+class WaitHistogram:
+    """
+    Count / total / bucketed histogram of wait times. Not locked: callers
+    update it under their own lock.
+    """
+
+    def __init__(self, buckets: Tuple[float, ...] = WAIT_BUCKETS_S) -> None:
+        self.buckets = buckets
+        self.count = 0
+        self.total_s = 0.0
+        self.max_s = 0.0
+        self._counts = [0] * (len(buckets) + 1)
+
+    def record(self, waited_s: float) -> None:
+        self.count += 1
+        self.total_s += waited_s
+        self.max_s = max(self.max_s, waited_s)
+        self._counts[bisect.bisect_left(self.buckets, waited_s)] += 1
+
+    @property
+    def mean_s(self) -> float:
+        return self.total_s / self.count if self.count else 0.0
+
+    def histogram(self) -> Dict[str, int]:
+        labels = [f"<={b:g}s" for b in self.buckets] + [f">{self.buckets[-1]:g}s"]
+        return dict(zip(labels, self._counts))
@@ -0,0 +1,146 @@
+# src/api/workflow_pool.py
+from __future__ import annotations
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from .wait_stats import WaitHistogram
+
+# Max concurrent runs per topic; each one gets its own workflow instance.
+WORKFLOW_POOL_SIZE = int(os.getenv("WORKFLOW_POOL_SIZE", "4"))
+
+
+class PoolTimeout(Exception):
+    """No workflow instance became free within the checkout timeout."""
+
+
+class WorkflowPool:
+    """
+    Bounded pool of workflow instances for one topic, with checkout/return.
+
+    The first instance is the registry's prototype; more are created on demand
+    with `prototype.spawn()`, which shares the Firecrawl client (and its caches),
+    prompts and stores, and compiles a graph bound to the new instance. Objects
+    without `spawn()` get a pool of one, i.e. the old one-run-at-a-time behavior.
+    """
+
+    def __init__(self, prototype: Any, max_size: int = WORKFLOW_POOL_SIZE) -> None:
+        self.prototype = prototype
+        self.max_size = max(1, max_size if hasattr(prototype, "spawn") else 1)
+        self._idle: List[Any] = [prototype]
+        self._size = 1
+        self._in_use = 0
+        self._cond = threading.Condition()
+
+        # metrics
+        self.peak_in_use = 0
+        self.checkouts = 0
+        self.waits = 0
+        self.timeouts = 0
+        self.wait_times = WaitHistogram()
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        start = time.perf_counter()
+        spawn = False
+        with self._cond:
+            if not self._idle and self._size >= self.max_size:
+                self.waits += 1
+                if not self._cond.wait_for(lambda: bool(self._idle), timeout=timeout):
+                    self.timeouts += 1
+                    self.wait_times.record(time.perf_counter() - start)
+                    raise PoolTimeout(f"no free workflow after {timeout}s")
+            if self._idle:
+                workflow = self._idle.pop()
+            else:
+                # Reserve the slot now; build outside the lock.
+                self._size += 1
+                spawn = True
+                workflow = None
+            self._in_use += 1
+            self.checkouts += 1
+            self.peak_in_use = max(self.peak_in_use, self._in_use)
+            self.wait_times.record(time.perf_counter() - start)
+
+        if spawn:
+            try:
+                workflow = self.prototype.spawn()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._in_use -= 1
+                    self._cond.notify()
+                raise
+        return workflow
+
+    def release(self, workflow: Any) -> None:
+        with self._cond:
+            self._idle.append(workflow)
+            self._in_use -= 1
+            self._cond.notify()
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[Any]:
+        workflow = self.acquire(timeout)
+        try:
+            yield workflow
+        finally:
+            self.release(workflow)
+
+    def would_wait(self) -> bool:
+        with self._cond:
+            return not self._idle and self._size >= self.max_size
+
+    def metrics(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "size": self._size,
+                "in_use": self._in_use,
+                "idle": len(self._idle),
+                "peak_in_use": self.peak_in_use,
+                "checkouts": self.checkouts,
+                "waits": self.waits,
+                "timeouts": self.timeouts,
+                "mean_wait_s": round(self.wait_times.mean_s, 4),
+                "wait_histogram": self.wait_times.histogram(),
+            }
+
+
+class TopicWorkflowPools:
+    """
+    One WorkflowPool per topic key, created on first checkout from the
+    registry's instance for that topic. A different prototype for the same key
+    (e.g. the registry entry was replaced) starts a fresh pool.
+    """
+
+    def __init__(self, max_size: int = WORKFLOW_POOL_SIZE) -> None:
+        self.max_size = max_size
+        self._pools: Dict[str, WorkflowPool] = {}
+        self._lock = threading.Lock()
+
+    def pool(self, topic_key: str, prototype: Any) -> WorkflowPool:
+        with self._lock:
+            pool = self._pools.get(topic_key)
+            if pool is None or pool.prototype is not prototype:
+                pool = WorkflowPool(prototype, self.max_size)
+                self._pools[topic_key] = pool
+            return pool
+
+    def metrics(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            pools = dict(self._pools)
+        return {key: pool.metrics() for key, pool in sorted(pools.items())}
+
+
+WORKFLOW_POOLS = TopicWorkflowPools()
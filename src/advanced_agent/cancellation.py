@@ -0,0 +1,42 @@
+# src/cancellation.py
+from __future__ import annotations
+
+import threading
+from typing import Optional
+
+
+class RunCancelled(Exception):
+    """Raised at a checkpoint once the run's CancelToken has fired."""
+
+
+class CancelToken:
+    """
+    Cooperative cancellation flag shared by one research run.
+
+    Whoever notices the run is no longer wanted (e.g. the SSE client went
+    away) calls cancel(); the workflow, its thread pools and the file writers
+    call raise_if_cancelled() between units of work. Work already in flight
+    (an LLM or Firecrawl request) finishes, nothing after it starts.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason = ""
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise RunCancelled(self.reason)
+
+
+def raise_if_cancelled(token: Optional[CancelToken]) -> None:
+    if token is not None:
+        token.raise_if_cancelled()
@@ -4,23 +4,70 @@ from typing import Any
 from firecrawl import FirecrawlApp
 from dotenv import load_dotenv
 
+from .query_canon import DEFAULT_SIMILARITY_THRESHOLD, QuerySimilarityIndex, canonicalize_query
+
 load_dotenv()
 
+FULL_PAGE_FORMATS = ("markdown", "branding", "images")
+BRANDING_FORMATS = ("branding",)
+MARKDOWN_FORMATS = ("markdown",)
+
 
 class FirecrawlService:
-    def __init__(self, timeout_seconds: float = 90.0):
+    def __init__(
+        self,
+        timeout_seconds: float = 90.0,
+        similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+    ):
         api_key = os.getenv("FIRECRAWL_API_KEY")
         if not api_key:
             raise ValueError("Environment variable FIRECRAWL_API_KEY not found")
 
         self.app = FirecrawlApp(api_key=api_key)
 
-        # Caches to avoid unnecessary external calls
-        self._search_cache: dict[tuple[str, int], Any] = {}
-        self._scrape_cache: dict[str, Any] = {}
+        # Caches to avoid unnecessary external calls.
+        # Search results are keyed on (kind, num_results, canonical query) and
+        # near-identical queries are matched through a per-(kind, num_results)
+        # similarity index, so "best python ide" also serves "Top Python IDEs?".
+        self._search_cache: dict[tuple[str, int, str], Any] = {}
+        self._search_indexes: dict[tuple[str, int], QuerySimilarityIndex[str]] = {}
+        # Scrapes are keyed on (url, formats): a branding-only fetch is not a full page.
+        self._scrape_cache: dict[tuple[str, tuple[str, ...]], Any] = {}
+        self._map_cache: dict[tuple[str, str, int], list[str]] = {}
+        self.similarity_threshold = similarity_threshold
 
         self.timeout_seconds = timeout_seconds
 
+    # ------------------------------------------------------------
+    # 🗂️ Canonical / similarity search cache
+    # ------------------------------------------------------------
+    def _search_index(self, kind: str, num_results: int) -> QuerySimilarityIndex[str]:
+        key = (kind, num_results)
+        if key not in self._search_indexes:
+            self._search_indexes[key] = QuerySimilarityIndex(self.similarity_threshold)
+        return self._search_indexes[key]
+
+    def _cached_search(self, kind: str, query: str, num_results: int) -> Any:
+        canonical = canonicalize_query(query)
+        match = self._search_index(kind, num_results).lookup(canonical)
+        if match is None:
+            return None
+
+        matched, original_query, score = match
+        if original_query == query:
+            attribution = "exact"
+        elif score == 1.0:
+            attribution = "canonical"
+        else:
+            attribution = f"similar {score:.2f}"
+        print(f"[Firecrawl] {kind} cache hit ({attribution}): '{query}' -> '{original_query}'")
+        return self._search_cache.get((kind, num_results, matched))
+
+    def _store_search(self, kind: str, query: str, num_results: int, result: Any) -> None:
+        canonical = canonicalize_query(query)
+        self._search_cache[(kind, num_results, canonical)] = result
+        self._search_index(kind, num_results).add(canonical, query)
+
     # ------------------------------------------------------------
     # 🔍 SEARCH with forced timeout
     # ------------------------------------------------------------
@@ -33,9 +80,9 @@ class FirecrawlService:
 
         Does NOT force 'pricing' into the query.
         """
-        key = (query, num_results)
-        if key in self._search_cache:
-            return self._search_cache[key]
+        cached = self._cached_search("web", query, num_results)
+        if cached is not None:
+            return cached
 
         print(f"[Firecrawl] Searching web for: {query}")
 
@@ -63,19 +110,20 @@ class FirecrawlService:
             print(f"[WARN] search returned empty result for '{query}'")
             return []
 
-        self._search_cache[key] = result
+        self._store_search("web", query, num_results, result)
         return result
 
     # ------------------------------------------------------------
     # 🌐 SCRAPE with forced timeout
     # ------------------------------------------------------------
-    def scrape_company_pages(self, url: str):
-        if url in self._scrape_cache:
-            return self._scrape_cache[url]
+    def _scrape_formats(self, url: str, formats: tuple[str, ...]):
+        key = (url, formats)
+        if key in self._scrape_cache:
+            return self._scrape_cache[key]
         def _do_scrape():
             return self.app.scrape(
                 url=url,
-                formats=["markdown", "branding", "images"],
+                formats=list(formats),
             )
         try:
             with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
@@ -93,9 +141,71 @@ class FirecrawlService:
             print(f"[WARN] scrape returned empty result for {url}")
             return None
 
-        self._scrape_cache[url] = result
+        self._scrape_cache[key] = result
         return result
 
+    def scrape_company_pages(self, url: str):
+        """
+        Full scrape of an official site: markdown + branding + images.
+        """
+        return self._scrape_formats(url, FULL_PAGE_FORMATS)
+
+    def scrape_branding(self, url: str):
+        """
+        Branding-only fetch (colors, logo/favicon) for a page whose markdown
+        we already have from search. Reuses a full scrape if one is cached.
+        """
+        full = self._scrape_cache.get((url, FULL_PAGE_FORMATS))
+        if full is not None:
+            return full
+        return self._scrape_formats(url, BRANDING_FORMATS)
+
+    def scrape_markdown(self, url: str):
+        """
+        Markdown-only scrape, for secondary pages (pricing, docs, features).
+        """
+        full = self._scrape_cache.get((url, FULL_PAGE_FORMATS))
+        if full is not None:
+            return full
+        return self._scrape_formats(url, MARKDOWN_FORMATS)
+
+    # ------------------------------------------------------------
+    # 🗺️ MAP (site URL discovery) with forced timeout
+    # ------------------------------------------------------------
+    def map_site(self, url: str, search: str | None = None, limit: int = 30) -> list[str]:
+        """
+        URLs of a site (sitemap + discovered links), optionally ranked by `search`.
+        """
+        key = (url, search or "", limit)
+        if key in self._map_cache:
+            return self._map_cache[key]
+
+        def _do_map():
+            return self.app.map(url, search=search, limit=limit, sitemap="include")
+
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(_do_map)
+                result = future.result(timeout=self.timeout_seconds)
+        except concurrent.futures.TimeoutError:
+            print(f"[TIMEOUT] map took longer than {self.timeout_seconds}s for {url}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            return []
+        except Exception as e:
+            print(f"[ERROR] map failed for {url}: {e}")
+            executor.shutdown(wait=False, cancel_futures=True)
+            return []
+
+        links = result.get("links", []) if isinstance(result, dict) else getattr(result, "links", None) or []
+        urls = [
+            link if isinstance(link, str)
+            else (link.get("url") if isinstance(link, dict) else getattr(link, "url", None))
+            for link in links
+        ]
+        urls = [u for u in urls if u]
+        self._map_cache[key] = urls
+        return urls
+
     # ------------------------------------------------------------
     # 📰 NEWS SEARCH (Fast, no inline scraping)
     # ------------------------------------------------------------
@@ -106,10 +216,10 @@ class FirecrawlService:
         - Higher default limit (to filter out irrelevant results later).
         - Distinct cache key.
         """
-        # Cache key distinguishes this from company searches
-        key = (query, num_results, "news")
-        if key in self._search_cache:
-            return self._search_cache[key]
+        # Separate cache kind distinguishes this from company searches
+        cached = self._cached_search("news", query, num_results)
+        if cached is not None:
+            return cached
 
         def _do_search():
             # Pure search. Lightweight.
@@ -139,7 +249,7 @@ class FirecrawlService:
         # Normalize it here if needed, or return as is.
         final_data = result.get('data', result) if isinstance(result, dict) else result
 
-        self._search_cache[key] = final_data
+        self._store_search("news", query, num_results, final_data)
         return final_data
 
     # ------------------------------------------------------------
@@ -150,8 +260,9 @@ class FirecrawlService:
         Direct wrapper for FirecrawlApp.scrape
         """
         # Check cache if you implemented one, otherwise direct call
-        if hasattr(self, "_scrape_cache") and url in self._scrape_cache:
-            return self._scrape_cache[url]
+        key = (url, ("markdown",))
+        if hasattr(self, "_scrape_cache") and key in self._scrape_cache:
+            return self._scrape_cache[key]
         try:
             # Call the underlying SDK
             result = self.app.scrape_url(url, params={"formats": ["markdown"]})
@@ -160,7 +271,7 @@ class FirecrawlService:
             # If the above fails, try: return self.app.scrape(url)
 
             if hasattr(self, "_scrape_cache"):
-                self._scrape_cache[url] = result
+                self._scrape_cache[key] = result
             return result
         except AttributeError:
             # Fallback for different SDK versions
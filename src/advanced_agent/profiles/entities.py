@@ -0,0 +1,112 @@
+# src/profiles/entities.py
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from ..query_canon import numbers_conflict
+from .store import canonical_product_name
+from .websites import WebsiteIndex, alias_keys
+
+# "Microsoft VS Code" and "VS Code" are the same product; "AWS Lambda" and "AWS" are not.
+# Only applied when the unprefixed name has several words: a single word like
+# "Copilot" or "Go" is too generic to attribute to one vendor.
+VENDOR_TOKENS = {
+    "microsoft", "google", "amazon", "apple", "meta", "facebook", "jetbrains",
+    "atlassian", "github", "adobe", "ibm", "oracle", "salesforce", "hashicorp",
+}
+
+# Compact names at most this fraction of characters apart are typo/spelling variants.
+MAX_EDIT_RATIO = 0.1
+
+
+def levenshtein(a: str, b: str) -> int:
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, start=1):
+        current = [i]
+        for j, cb in enumerate(b, start=1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def _url_identity(url: Optional[str]) -> Optional[str]:
+    if not url:
+        return None
+    parsed = urlparse(url)
+    host = parsed.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return f"{host}{parsed.path.rstrip('/')}" if host else None
+
+
+def same_entity(a: str, b: str, website_index: Optional[WebsiteIndex] = None) -> bool:
+    """
+    True if two extracted names refer to the same product: shared alias key,
+    vendor-prefixed variant, near-identical spelling, or the same known site.
+    Names with different version numbers ("PostgreSQL 15" / "PostgreSQL 16",
+    "Elasticsearch" / "Elasticsearch 8") are never merged by the vendor or
+    spelling rules.
+    """
+    if set(alias_keys(a)) & set(alias_keys(b)):
+        return True
+
+    tokens_a = set(canonical_product_name(a).split())
+    tokens_b = set(canonical_product_name(b).split())
+    versions_differ = numbers_conflict(tokens_a, tokens_b)
+    if tokens_a and tokens_b and tokens_a != tokens_b and not versions_differ:
+        small, big = sorted((tokens_a, tokens_b), key=len)
+        if len(small) > 1 and small < big and (big - small) <= VENDOR_TOKENS:
+            return True
+
+    compact_a = canonical_product_name(a).replace(" ", "")
+    compact_b = canonical_product_name(b).replace(" ", "")
+    longest = max(len(compact_a), len(compact_b))
+    if (
+        longest
+        and not versions_differ
+        and levenshtein(compact_a, compact_b) / longest <= MAX_EDIT_RATIO
+    ):
+        return True
+
+    if website_index is not None:
+        site_a = _url_identity(website_index.resolve(a))
+        if site_a and site_a == _url_identity(website_index.resolve(b)):
+            return True
+
+    return False
+
+
+@dataclass
+class EntityResolution:
+    """
+    Deduplicated names (first spelling wins, extraction order kept) and the
+    aliases merged into each of them.
+    """
+
+    names: List[str] = field(default_factory=list)
+    merged: Dict[str, List[str]] = field(default_factory=dict)
+
+    @property
+    def avoided(self) -> int:
+        return sum(len(v) for v in self.merged.values())
+
+
+def resolve_entities(
+    names: List[str],
+    website_index: Optional[WebsiteIndex] = None,
+) -> EntityResolution:
+    result = EntityResolution()
+    for raw in names:
+        name = (raw or "").strip()
+        if not name:
+            continue
+        match = next((kept for kept in result.names if same_entity(kept, name, website_index)), None)
+        if match is None:
+            result.names.append(name)
+        else:
+            result.merged.setdefault(match, []).append(name)
+    return result
@@ -0,0 +1,131 @@
+# src/profiles/store.py
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+PROFILE_DB_PATH = Path("saved_docs") / "company_profiles.json"
+
+# Analyzed profiles are reused without any Firecrawl/LLM call for this long.
+PROFILE_TTL_SECONDS = 7 * 24 * 60 * 60
+
+_NAME_NOISE_RE = re.compile(r"\(.*?\)|\b(inc|llc|ltd|corp|corporation)\b\.?", re.IGNORECASE)
+_NON_ALNUM_RE = re.compile(r"[^\w+#]+", re.UNICODE)
+
+
+def canonical_product_name(name: str) -> str:
+    """
+    "VS Code", "vs-code" and "VS Code (Microsoft)" -> "vs code";
+    "Stripe, Inc." -> "stripe".
+    """
+    text = _NAME_NOISE_RE.sub(" ", (name or "").lower())
+    return " ".join(_NON_ALNUM_RE.sub(" ", text).split())
+
+
+def source_hash(content: str) -> str:
+    """
+    Fingerprint of the scraped content a profile was analyzed from
+    (whitespace-insensitive, so re-scrapes with different line breaks still match).
+    """
+    normalized = " ".join((content or "").split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:16]
+
+
+@dataclass
+class CompanyProfile:
+    """
+    One analyzed company/tool, shared by every topic of the same family
+    ("tools", "career", ...). `data` is the company model's model_dump().
+    """
+
+    family: str
+    name: str
+    data: Dict[str, Any]
+    source_hash: str
+    updated_at: float = field(default_factory=time.time)
+
+    def age_seconds(self) -> float:
+        return time.time() - self.updated_at
+
+
+class CompanyProfileStore:
+    """
+    JSON-file backed store of CompanyProfile records keyed by
+    (family, canonical product name). Loaded lazily, written on every put.
+    """
+
+    def __init__(
+        self,
+        path: Path = PROFILE_DB_PATH,
+        ttl_seconds: float = PROFILE_TTL_SECONDS,
+    ) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._profiles: Optional[Dict[str, CompanyProfile]] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(family: str, name: str) -> str:
+        return f"{family}::{canonical_product_name(name)}"
+
+    def _loaded(self) -> Dict[str, CompanyProfile]:
+        if self._profiles is None:
+            self._profiles = {}
+            if self.path.exists():
+                try:
+                    raw = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+                    for key, item in raw.items():
+                        self._profiles[key] = CompanyProfile(**item)
+                except Exception as e:
+                    # Corrupted file? Start empty rather than failing research.
+                    print(f"[Profiles] could not read {self.path}: {e}")
+                    self._profiles = {}
+        return self._profiles
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {key: asdict(p) for key, p in self._loaded().items()}
+        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+
+    def get(self, family: str, name: str) -> Optional[CompanyProfile]:
+        """
+        Stored profile regardless of age (callers decide what stale means).
+        """
+        with self._lock:
+            return self._loaded().get(self._key(family, name))
+
+    def get_fresh(self, family: str, name: str) -> Optional[CompanyProfile]:
+        profile = self.get(family, name)
+        if profile is None or profile.age_seconds() > self.ttl_seconds:
+            return None
+        return profile
+
+    def put(self, family: str, name: str, data: Dict[str, Any], content: str) -> CompanyProfile:
+        profile = CompanyProfile(
+            family=family,
+            name=name,
+            data=data,
+            source_hash=source_hash(content),
+        )
+        with self._lock:
+            self._loaded()[self._key(family, name)] = profile
+            self._save()
+        return profile
+
+    def clear(self) -> None:
+        with self._lock:
+            self._profiles = {}
+            self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._loaded())
+
+
+PROFILE_STORE = CompanyProfileStore()
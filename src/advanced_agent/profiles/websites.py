@@ -0,0 +1,187 @@
+# src/profiles/websites.py
+from __future__ import annotations
+
+import json
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from .store import canonical_product_name
+
+WEBSITE_INDEX_PATH = Path("saved_docs") / "official_sites.json"
+# Entries are re-checked by a fresh search once they are this old.
+WEBSITE_TTL_SECONDS = 30 * 24 * 60 * 60
+
+# Common spellings that canonicalization alone cannot merge.
+DEFAULT_ALIASES: Dict[str, str] = {
+    "vscode": "visual studio code",
+    "vs code": "visual studio code",
+    "gh": "github",
+    "aws": "amazon web services",
+    "gcp": "google cloud platform",
+    "google cloud": "google cloud platform",
+    "azure": "microsoft azure",
+    "postgres": "postgresql",
+    "k8s": "kubernetes",
+}
+
+
+def alias_keys(name: str) -> List[str]:
+    """
+    Lookup keys for a product name: canonical form, its space-free form
+    ("vs code" / "vscode") and the alias target if there is one.
+    """
+    canon = canonical_product_name(name)
+    keys = [canon, canon.replace(" ", "")]
+    for key in list(keys):
+        target = DEFAULT_ALIASES.get(key)
+        if target:
+            keys.append(target)
+    # de-duplicate, keep order
+    return list(dict.fromkeys(k for k in keys if k))
+
+
+def url_matches_name(name: str, url: str) -> bool:
+    """
+    True if the URL's host names the product ("stripe.com" for Stripe,
+    "code.visualstudio.com" for VS Code). Review and directory pages such as
+    "g2.com/products/stripe" do not count as the product's own site.
+    """
+    host = (urlparse(url or "").hostname or "").lower()
+    labels = [label.replace("-", "") for label in host.split(".")[:-1] if label != "www"]
+    keys = alias_keys(name)
+    compact = {k.replace(" ", "") for k in keys}
+    words = {w for k in keys for w in k.split() if len(w) >= 3}
+    for label in labels:
+        if len(label) < 3:
+            continue
+        if any(c in label or (len(label) >= 4 and label in c) for c in compact):
+            return True
+        if any(w in label for w in words):
+            return True
+    return False
+
+
+@dataclass
+class KnownWebsite:
+    url: str
+    description: str = ""
+    recorded_at: float = 0.0
+
+    @property
+    def age_seconds(self) -> float:
+        return time.time() - self.recorded_at
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"url": self.url, "description": self.description, "recorded_at": self.recorded_at}
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> "KnownWebsite":
+        # Older index files stored a bare URL; those count as expired.
+        if isinstance(raw, str):
+            return cls(url=raw)
+        return cls(
+            url=str(raw.get("url", "")),
+            description=str(raw.get("description", "") or ""),
+            recorded_at=float(raw.get("recorded_at", 0.0) or 0.0),
+        )
+
+
+class WebsiteIndex:
+    """
+    Persisted product name -> official URL index, so known tools can be
+    scraped directly without an "official site" search first.
+
+    Only URLs whose host names the product are recorded, and entries older
+    than `ttl_seconds` are treated as misses so a wrong search hit is not
+    kept forever.
+    """
+
+    def __init__(self, path: Path = WEBSITE_INDEX_PATH, ttl_seconds: float = WEBSITE_TTL_SECONDS) -> None:
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self._sites: Optional[Dict[str, KnownWebsite]] = None
+        self._lock = threading.Lock()
+
+    def _loaded(self) -> Dict[str, KnownWebsite]:
+        if self._sites is None:
+            self._sites = {}
+            if self.path.exists():
+                try:
+                    raw = json.loads(self.path.read_text(encoding="utf-8") or "{}")
+                    if isinstance(raw, dict):
+                        self._sites = {
+                            str(k): KnownWebsite.from_raw(v)
+                            for k, v in raw.items()
+                            if isinstance(v, (str, dict))
+                        }
+                except Exception as e:
+                    print(f"[Websites] could not read {self.path}: {e}")
+        return self._sites
+
+    def _save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(
+            json.dumps(
+                {k: v.to_dict() for k, v in self._loaded().items()},
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            ),
+            encoding="utf-8",
+        )
+
+    def lookup(self, name: str) -> Optional[KnownWebsite]:
+        """Fresh entry for any alias of `name`, or None."""
+        with self._lock:
+            sites = self._loaded()
+            for key in alias_keys(name):
+                site = sites.get(key)
+                if site is not None and site.age_seconds <= self.ttl_seconds:
+                    return site
+        return None
+
+    def resolve(self, name: str) -> Optional[str]:
+        site = self.lookup(name)
+        return site.url if site else None
+
+    def remember(self, name: str, url: str, description: str = "") -> bool:
+        """
+        Record `url` as the official site of `name`. Returns False (and stores
+        nothing) when the URL is malformed or its host does not name the product.
+        """
+        parsed = urlparse(url or "")
+        if parsed.scheme not in ("http", "https") or not parsed.netloc:
+            return False
+        if not url_matches_name(name, url):
+            print(f"[Websites] not recording {url} for {name!r}: host does not match the name")
+            return False
+        with self._lock:
+            sites = self._loaded()
+            keys = alias_keys(name)
+            site = KnownWebsite(url=url, description=description or "", recorded_at=time.time())
+            for key in keys:
+                old = sites.get(key)
+                if old is not None and old.url == url and not site.description:
+                    site.description = old.description
+            for key in keys:
+                sites[key] = site
+            self._save()
+        return True
+
+    def forget(self, name: str) -> None:
+        with self._lock:
+            sites = self._loaded()
+            removed = [sites.pop(k) for k in alias_keys(name) if k in sites]
+            if removed:
+                self._save()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len({site.url for site in self._loaded().values()})
+
+
+WEBSITE_INDEX = WebsiteIndex()
@@ -0,0 +1,159 @@
+# src/query_canon.py
+from __future__ import annotations
+
+import re
+import threading
+from typing import Dict, Generic, Optional, Set, Tuple, TypeVar
+
+# Queries at or above this token-set Jaccard similarity are treated as the same question.
+DEFAULT_SIMILARITY_THRESHOLD = 0.85
+
+# Words that do not change what a research query is about.
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "for", "of", "to", "in", "on", "with", "about",
+    "what", "which", "who", "how", "is", "are", "was", "do", "does", "should",
+    "i", "me", "my", "we", "our", "you", "your", "can", "could", "would",
+    "best", "top", "good", "great", "leading", "popular", "recommended",
+    "vs", "versus", "compare", "comparison", "between",
+}
+
+# Collapse common spelling variants onto one token.
+SYNONYMS = {
+    "alternatives": "alternative",
+    "options": "option",
+    "tools": "tool",
+    "js": "javascript",
+    "ts": "typescript",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+}
+
+_TOKEN_RE = re.compile(r"[\w+#.-]+", re.UNICODE)
+
+
+def _stem(token: str) -> str:
+    """
+    Very small plural stemmer: IDEs -> ide, libraries -> library, APIs -> api.
+    Short tokens (aws, gcp, ios) are left alone.
+    """
+    if len(token) <= 3:
+        return token
+    if token.endswith("ies") and len(token) > 4:
+        return token[:-3] + "y"
+    if token.endswith("sses"):
+        return token[:-2]
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def query_tokens(query: str) -> Set[str]:
+    """
+    Case-folded, punctuation-free, stopword-free, singularized token set.
+    """
+    tokens: Set[str] = set()
+    for raw in _TOKEN_RE.findall((query or "").lower()):
+        tok = raw.strip(".-")
+        if not tok or tok in STOPWORDS:
+            continue
+        tok = SYNONYMS.get(tok, tok)
+        tok = SYNONYMS.get(_stem(tok), _stem(tok))
+        if tok in STOPWORDS:
+            continue
+        tokens.add(tok)
+    return tokens
+
+
+def canonicalize_query(query: str) -> str:
+    """
+    Order-independent canonical form, e.g.
+    "Best Python IDEs?" and "python ide" -> "ide python".
+
+    Falls back to a whitespace-collapsed lowercase string if every token was a
+    stopword, so "what is the best?" still gets a stable key.
+    """
+    tokens = query_tokens(query)
+    if tokens:
+        return " ".join(sorted(tokens))
+    return re.sub(r"\s+", " ", (query or "").strip().lower())
+
+
+def jaccard(a: Set[str], b: Set[str]) -> float:
+    if not a and not b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def numbers_conflict(a: Set[str], b: Set[str]) -> bool:
+    """
+    "python 3.11" vs "python 3.12" or "top 5" vs "top 10" are different questions
+    even though they look alike; never merge queries whose numeric tokens differ.
+    """
+    nums_a = {t for t in a if any(ch.isdigit() for ch in t)}
+    nums_b = {t for t in b if any(ch.isdigit() for ch in t)}
+    return nums_a != nums_b
+
+
+V = TypeVar("V")
+
+
+class QuerySimilarityIndex(Generic[V]):
+    """
+    Maps canonical queries to values and finds the closest stored query by
+    token-set Jaccard similarity (via a small inverted index).
+    """
+
+    def __init__(self, threshold: float = DEFAULT_SIMILARITY_THRESHOLD) -> None:
+        self.threshold = threshold
+        self._values: Dict[str, V] = {}
+        self._tokens: Dict[str, Set[str]] = {}
+        self._postings: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, canonical: str, value: V) -> None:
+        tokens = set(canonical.split())
+        with self._lock:
+            self._values[canonical] = value
+            self._tokens[canonical] = tokens
+            for tok in tokens:
+                self._postings.setdefault(tok, set()).add(canonical)
+
+    def remove(self, canonical: str) -> None:
+        with self._lock:
+            self._values.pop(canonical, None)
+            for tok in self._tokens.pop(canonical, set()):
+                bucket = self._postings.get(tok)
+                if bucket is not None:
+                    bucket.discard(canonical)
+                    if not bucket:
+                        del self._postings[tok]
+
+    def lookup(self, canonical: str) -> Optional[Tuple[str, V, float]]:
+        """
+        Returns (matched_canonical, value, score) for the best match at or above
+        the threshold, or None.
+        """
+        tokens = set(canonical.split())
+        with self._lock:
+            if canonical in self._values:
+                return canonical, self._values[canonical], 1.0
+
+            candidates: Set[str] = set()
+            for tok in tokens:
+                candidates |= self._postings.get(tok, set())
+
+            best: Optional[Tuple[str, V, float]] = None
+            for cand in candidates:
+                cand_tokens = self._tokens[cand]
+                if numbers_conflict(tokens, cand_tokens):
+                    continue
+                score = jaccard(tokens, cand_tokens)
+                if score >= self.threshold and (best is None or score > best[2]):
+                    best = (cand, self._values[cand], score)
+            return best
+
+    def __len__(self) -> int:
+        return len(self._values)
+
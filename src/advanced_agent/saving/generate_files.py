@@ -4,6 +4,7 @@ import os
 from pathlib import Path
 from typing import Dict, Optional
 
+from ..cancellation import CancelToken, raise_if_cancelled
 from . import save_result_slides
 from .layout_llm import DocumentLayout
 from .pdf_builder import build_pdf_document
@@ -57,10 +58,12 @@ def generate_all_files_for_layout(
     layout: DocumentLayout,
     base_folder: str,
     base_filename: str,
+    cancel_token: Optional[CancelToken] = None,
 ) -> Dict[str, str]:
     """
     Given a DocumentLayout, write txt, pdf, docx, and slides,
-    and return their paths.
+    and return their paths. If `cancel_token` fires, RunCancelled is raised
+    before the next file is rendered.
 
     NOTE:
     - TXT / PDF / DOCX are always written to project-root "saved_docs/"
@@ -85,9 +88,13 @@ def generate_all_files_for_layout(
     pptx_path = base_slides.with_suffix(".pptx")
 
     # Actually write files
+    raise_if_cancelled(cancel_token)
     write_txt(txt_path, layout.report_markdown)
+    raise_if_cancelled(cancel_token)
     write_pdf(pdf_path, layout)
+    raise_if_cancelled(cancel_token)
     write_docx(docx_path, layout)
+    raise_if_cancelled(cancel_token)
     write_slides(pptx_path, layout)
 
     return {
@@ -0,0 +1,181 @@
+# src/site_crawler.py
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+from .firecrawl import FirecrawlService
+
+# Secondary pages worth reading for a product, in priority order.
+PAGE_KINDS: Tuple[str, ...] = ("pricing", "features", "docs")
+
+_KIND_PATTERNS: Dict[str, re.Pattern] = {
+    "pricing": re.compile(r"(^|[/.-])(pricing|plans?|prices?)([/.-]|$)", re.IGNORECASE),
+    "features": re.compile(r"(^|[/.-])(features?|product|platform)([/.-]|$)", re.IGNORECASE),
+    "docs": re.compile(r"(^|[/.-])(docs?|documentation|developers?|api)([/.-]|$)", re.IGNORECASE),
+}
+
+# Lines worth keeping from each kind of page.
+_KIND_KEEP: Dict[str, re.Pattern] = {
+    "pricing": re.compile(
+        r"[$€£¥]|\bfree\b|per (user|seat|month|year)|/mo\b|/month|\bplan|\btier|\btrial|"
+        r"\benterprise\b|\bbilled\b|\bpricing\b|open[- ]source",
+        re.IGNORECASE,
+    ),
+    "features": re.compile(r"^#|^[-*] ", re.MULTILINE),
+    "docs": re.compile(r"^#|\bapi\b|\bsdk\b|\bcli\b|install|quickstart|integrat", re.IGNORECASE),
+}
+
+_MD_LINK_RE = re.compile(r"\]\(([^)\s]+)\)")
+
+
+@dataclass
+class CrawledPage:
+    kind: str
+    url: str
+    content: str
+
+
+# Suffixes under which unrelated companies register their own sites, so the
+# site is one label longer than usual: "acme.co.uk", "acme.github.io".
+# A small public-suffix list covering the ccTLD second levels and shared
+# hosts that product sites commonly use.
+_CC_SECOND_LEVEL = {
+    "ac", "co", "com", "edu", "gen", "go", "gob", "gov", "ltd", "me", "mil",
+    "ne", "net", "nic", "or", "org", "plc", "sch",
+}
+_SHARED_HOST_SUFFIXES = {
+    "appspot.com", "azurewebsites.net", "firebaseapp.com", "github.io", "gitlab.io",
+    "herokuapp.com", "netlify.app", "notion.site", "pages.dev", "readthedocs.io",
+    "vercel.app", "web.app",
+}
+
+
+def _site_root(host: str) -> str:
+    """
+    Registrable domain of `host`: "docs.acme.dev" -> "acme.dev",
+    "www.acme.co.uk" -> "acme.co.uk", "acme.github.io" -> "acme.github.io".
+    """
+    labels = host.lower().split(":")[0].strip(".").split(".")
+    if labels and labels[0] == "www":
+        labels = labels[1:]
+    suffix = ".".join(labels[-2:])
+    if suffix in _SHARED_HOST_SUFFIXES or (
+        len(labels[-1]) == 2 and len(labels) > 2 and labels[-2] in _CC_SECOND_LEVEL
+    ):
+        return ".".join(labels[-3:])
+    return suffix
+
+
+def classify_url(url: str) -> Optional[str]:
+    """
+    "https://x.com/pricing" -> "pricing", "https://docs.x.com/" -> "docs", else None.
+    """
+    parsed = urlparse(url)
+    host_label = parsed.netloc.lower().split(".")[0]
+    path = parsed.path.rstrip("/")
+    for kind in PAGE_KINDS:
+        pattern = _KIND_PATTERNS[kind]
+        if pattern.search(path) or pattern.fullmatch(host_label):
+            return kind
+    return None
+
+
+def relevant_sections(kind: str, markdown: str, max_chars: int) -> str:
+    """
+    Keep only lines that matter for analysis (prices/plans, feature bullets,
+    API/SDK mentions), in page order, up to `max_chars`.
+    """
+    keep = _KIND_KEEP.get(kind)
+    out: List[str] = []
+    used = 0
+    for line in (markdown or "").splitlines():
+        line = line.strip()
+        if not line or (keep is not None and not keep.search(line)):
+            continue
+        # Strip link targets, they cost tokens and carry no facts.
+        line = re.sub(r"\]\([^)]*\)", "]", line)
+        if used + len(line) > max_chars:
+            break
+        out.append(line)
+        used += len(line) + 1
+    return "\n".join(out)
+
+
+class TargetedCrawler:
+    """
+    Bounded crawl of a product site's pricing / features / docs pages.
+
+    Links are discovered from the landing page markdown first (free) and from
+    Firecrawl map only if the landing page had none. At most `max_pages` pages
+    are fetched, concurrently, and at most `max_chars` of relevant lines are kept.
+    """
+
+    def __init__(
+        self,
+        firecrawl: FirecrawlService,
+        max_pages: int = 3,
+        max_chars: int = 2500,
+    ) -> None:
+        self.firecrawl = firecrawl
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+
+    def discover(self, base_url: str, landing_markdown: Optional[str]) -> List[Tuple[str, str]]:
+        """
+        (kind, url) per page kind, same site only, in PAGE_KINDS priority order.
+        """
+        root = _site_root(urlparse(base_url).netloc)
+        base = base_url.rstrip("/")
+        found: Dict[str, str] = {}
+
+        def consider(candidates: List[str]) -> None:
+            for raw in candidates:
+                url = urljoin(base_url, raw).split("#")[0]
+                parsed = urlparse(url)
+                if parsed.scheme not in ("http", "https") or _site_root(parsed.netloc) != root:
+                    continue
+                if url.rstrip("/") == base:
+                    continue
+                kind = classify_url(url)
+                if kind and kind not in found:
+                    found[kind] = url
+
+        consider(_MD_LINK_RE.findall(landing_markdown or ""))
+        if not found and hasattr(self.firecrawl, "map_site"):
+            consider(self.firecrawl.map_site(base_url, search=" ".join(PAGE_KINDS)))
+
+        return [(kind, found[kind]) for kind in PAGE_KINDS if kind in found][: self.max_pages]
+
+    def _fetch(self, kind: str, url: str) -> Optional[CrawledPage]:
+        scraped = self.firecrawl.scrape_markdown(url)
+        if not scraped:
+            return None
+        data = scraped.get("data", scraped) if isinstance(scraped, dict) else scraped
+        markdown = data.get("markdown") if isinstance(data, dict) else getattr(data, "markdown", None)
+        if not markdown:
+            return None
+        return CrawledPage(kind=kind, url=url, content=markdown)
+
+    def crawl(self, base_url: str, landing_markdown: Optional[str]) -> List[CrawledPage]:
+        targets = self.discover(base_url, landing_markdown)
+        if not targets or self.max_pages <= 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+            pages = list(executor.map(lambda t: self._fetch(*t), targets))
+
+        # Split the character budget across the pages actually fetched.
+        fetched = [p for p in pages if p is not None]
+        if not fetched:
+            return []
+        share = self.max_chars // len(fetched)
+        result: List[CrawledPage] = []
+        for page in fetched:
+            section = relevant_sections(page.kind, page.content, share)
+            if section:
+                result.append(CrawledPage(kind=page.kind, url=page.url, content=section))
+        return result
@@ -136,7 +136,7 @@ All plans should be realistic, concrete, and broken into actionable steps.
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-Useful Resources (JSON array of analyzed resources):
+Useful Resources (table of analyzed resources + per-resource details):
 {company_data}
 
 You must produce a JSON object describing a step-by-step plan using this schema:
@@ -1,7 +1,6 @@
 # src/topics/career/base_workflow.py
 from __future__ import annotations
 
-import json
 from concurrent.futures import as_completed, ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Type, TypeVar, Generic
 
@@ -15,8 +14,10 @@ from .base_models import (
     CareerGoal,
     CareerActionPlan,
 )
+from ...cancellation import RunCancelled
 from .base_prompts import CareerBasePrompts
 from ..root_workflow import RootWorkflow
+from ..compact_encoding import encode_research_payload
 
 # ---------------------------
 # Type variables
@@ -30,14 +31,19 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
     """
     Generic workflow for career-related topics.
 
-    7-step pipeline:
+    7-step pipeline, wired as a DAG:
       1) interpret_query         – normalize goal
       2) collect_articles        – multi-pass article search
       3) extract_tools           – extract platforms/resources
       4) research                – per-platform research
-      5) extract_knowledge       – global entities/pros/cons/risks/timeline
+      5) extract_knowledge       – global entities/pros/cons/risks/timeline from articles
       6) analyze                 – structured CareerActionPlan
       7) generate_analysis       – final analysis string (kept JSON for compatibility)
+
+    Knowledge extraction only needs the article corpus, so it fans out right
+    after collect_articles. Steps 3) and 4) run back to back as one graph node
+    on the other branch, so knowledge extraction overlaps per-platform research
+    rather than just platform extraction; both branches join before analyze.
     """
 
     # Defaults; subclasses override these
@@ -49,6 +55,7 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
     topic_label: str = "Career"
     article_query_suffix: str = "career tools and method comparison best alternatives"
     official_site_suffix: str = "official site"
+    profile_family: str = "career"
 
     def __init__(
         self,
@@ -61,24 +68,28 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
 
     # ------------------------------------------------------------------ #
     # Graph building (7 steps)
+    #
+    #   interpret_query → collect_articles ─┬→ research (extract + research) ─┬→ analyze → generate_analysis
+    #                                       └→ extract_knowledge ─────────────┘
+    #
+    # LangGraph advances in supersteps, so separate extract_tools → research
+    # nodes would let extract_knowledge overlap only the first of them.
     # ------------------------------------------------------------------ #
     def _build_workflow(self):
         graph = StateGraph(self.state_cls)
 
         graph.add_node("interpret_query", self._interpret_query_step)
         graph.add_node("collect_articles", self._collect_articles_step)
-        graph.add_node("extract_tools", self._extract_tools_step)
-        graph.add_node("research", self._research_step)
+        graph.add_node("research", self._extract_and_research_step)
         graph.add_node("extract_knowledge", self._extract_knowledge_step)
         graph.add_node("analyze", self._analyze_step)
         graph.add_node("generate_analysis", self._generate_analysis_step)
 
         graph.set_entry_point("interpret_query")
         graph.add_edge("interpret_query", "collect_articles")
-        graph.add_edge("collect_articles", "extract_tools")
-        graph.add_edge("extract_tools", "research")
-        graph.add_edge("research", "extract_knowledge")
-        graph.add_edge("extract_knowledge", "analyze")
+        graph.add_edge("collect_articles", "research")
+        graph.add_edge("collect_articles", "extract_knowledge")
+        graph.add_edge(["research", "extract_knowledge"], "analyze")
         graph.add_edge("analyze", "generate_analysis")
         graph.add_edge("generate_analysis", END)
 
@@ -200,31 +211,24 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
                 seniority_focus=None,
             )
 
-    def _research_single_tool(self, tool_name: str) -> Optional[TInfo]:
+    def _research_single_tool(
+        self,
+        tool_name: str,
+        max_subpages: Optional[int] = None,
+    ) -> Optional[TInfo]:
+        self._check_cancelled()
+        stored = self._stored_profile(tool_name, self.info_cls)
+        if stored is not None:
+            return stored  # type: ignore[return-value]
+
         self._log(f"researching: {tool_name}")
         tool_query = f"{tool_name} {self.official_site_suffix}"
 
-        tool_search_results = self.firecrawl.search_companies(tool_query, num_results=1)
-        web_results = self._get_web_results(tool_search_results)
-
-        if not web_results:
-            self._log(f"no web results for {tool_name}")
-            return None
-
-        doc = web_results[0]
-
-        url = getattr(doc, "url", "") or ""
-        desc = ""
-
-        meta = getattr(doc, "metadata", None)
-        if meta:
-            desc = getattr(meta, "description", "") or desc
-            if not url:
-                url = getattr(meta, "url", "") or url
-
-        if not url:
-            self._log(f"no URL for {tool_name}, skipping")
+        resolved = self._resolve_and_scrape(tool_name, tool_query)
+        if resolved is None:
             return None
+        # Prefer markdown from search doc (None when the URL came from the index)
+        url, desc, content, scraped = resolved
 
         company: TInfo = self.info_cls(  # type: ignore[call-arg]
             name=tool_name,
@@ -233,15 +237,12 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
             tech_stack=[],
             competitors=[],
         )
-        # Prefer markdown from search doc
-        content = getattr(doc, "markdown", None)
 
         primary_color: Optional[str] = None
         brand_colors: Optional[Dict[str, Any]] = None
         logo_url: Optional[str] = None
 
-        # Scrape official site for richer content + branding
-        scraped = self.firecrawl.scrape_company_pages(url)
+        # Scrape result of the official site: richer content + branding
         if scraped:
             if isinstance(scraped, dict):
                 data = scraped.get("data", scraped)
@@ -282,6 +283,17 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
                     )
 
         # If still no content, last-chance scrape already done above; we keep behavior:
+        if max_subpages is None:
+            max_subpages = self.subpage_pages_deep
+        content = self._augment_with_subpages(tool_name, url, content, max_subpages)
+
+        stored = self._stored_profile(tool_name, self.info_cls, content=content) if content else None
+        if stored is not None:
+            # Stale profile, but the official site did not change: skip the LLM.
+            stored.website = url
+            self._store_profile(stored, content)
+            return stored  # type: ignore[return-value]
+
         if not content:
             self._log(f"no content (markdown/scrape) for {tool_name}, skipping analysis")
         else:
@@ -309,8 +321,19 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
         if logo_url:
             company.logo_url = logo_url
 
+        if content and company.description != "Analysis failed":
+            self._store_profile(company, content)
+
         return company
 
+    # ------------------------------------------------------------------ #
+    # Steps 3 + 4 as one node, so the knowledge branch overlaps both
+    # ------------------------------------------------------------------ #
+    def _extract_and_research_step(self, state: TState) -> Dict[str, Any]:
+        update = self._extract_tools_step(state)
+        research = self._research_step(state.model_copy(update=update))
+        return {**update, **research}
+
     # ------------------------------------------------------------------ #
     # Step 4: research – per-platform research (parallel)
     # ------------------------------------------------------------------ #
@@ -330,16 +353,17 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
                 else:
                     tool_names.append(getattr(doc, "title", None) or "Unknown")
         else:
-            tool_names = extracted[:4]
+            tool_names = self._resolve_tool_entities(extracted)[:4]
 
         self._log(f"🔬 Researching specific resources: {', '.join(tool_names)}")
 
         companies: List[TInfo] = []
+        max_subpages = self._subpage_budget(state)
 
         max_workers = min(4, len(tool_names))
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_name = {
-                executor.submit(self._research_single_tool, name): name
+                executor.submit(self._research_single_tool, name, max_subpages): name
                 for name in tool_names
             }
 
@@ -349,8 +373,11 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
                     comp = fut.result()
                     if comp is not None:
                         companies.append(comp)
+                except RunCancelled:
+                    pass
                 except Exception as e:
                     self._log(f"error while researching {tool_name}: {e}")
+        self._check_cancelled()
 
         return {"companies": companies}
 
@@ -366,28 +393,9 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
             self._log("Fast mode: skipping knowledge extraction.")
             return {}
 
-        # Enrich with company-level info, including strengths/limitations if present
-        if state.companies:
-            blocks: List[str] = []
-            for c in state.companies:
-                blocks.append(f"# {c.name}\n{c.description}\n")
-                # These attributes are optional; only include if present.
-                if getattr(c, "strengths", None):
-                    blocks.append(
-                        "## Strengths\n" + "\n".join(f"- {s}" for s in c.strengths)
-                    )
-                if getattr(c, "limitations", None):
-                    blocks.append(
-                        "## Limitations\n" + "\n".join(f"- {l}" for l in c.limitations)
-                    )
-            company_block = "\n\n".join(blocks).strip()
-            if company_block:
-                aggregated = (
-                    aggregated + "\n\n---\n\n" + company_block
-                    if aggregated
-                    else company_block
-                )
-
+        # Runs in parallel with extract_tools + research, so it only sees the
+        # article corpus; per-platform strengths/limitations reach analyze
+        # directly through state.companies.
         if not aggregated:
             self._log("No aggregated content available; skipping knowledge extraction.")
             return {}
@@ -408,11 +416,7 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
     def _analyze_step(self, state: TState) -> Dict[str, Any]:
         self._log("Generating career action plan and recommendations")
 
-        payload = {
-            "companies": [c.model_dump() for c in state.companies],
-            "knowledge": state.knowledge.model_dump() if state.knowledge else None,
-        }
-        company_data = json.dumps(payload, ensure_ascii=False)
+        company_data = encode_research_payload(state.companies, state.knowledge)
 
         messages = [
             SystemMessage(content=self.prompts.RECOMMENDATIONS_SYSTEM),
@@ -469,6 +473,6 @@ class CareerBaseWorkflow(RootWorkflow, Generic[TState, TInfo, TAnalysis]):
     # ------------------------------------------------------------------ #
     def run(self, query: str, fast_mode: bool = True) -> TState:
         initial_state = self.state_cls(query=query, fast_mode=fast_mode)
-        final_state = self.workflow.invoke(initial_state)
+        final_state = self._invoke_graph(initial_state)
         # Keep returning a Pydantic state instance for compatibility with formatters.
         return self.state_cls(**final_state)
@@ -69,7 +69,7 @@ Keep replies short and practical.
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-Behavioral Interview Tools Analyzed (JSON):
+Behavioral Interview Tools Analyzed (table + per-item details):
 {company_data}
 
 Provide a concise recommendation:
@@ -70,7 +70,7 @@ Keep replies under 4 sentences.
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-Job Platforms Analyzed (JSON array):
+Job Platforms Analyzed (table + per-item details):
 {company_data}
 
 Provide a short recommendation:
@@ -66,7 +66,7 @@ Keep responses brief (3-4 sentences).
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-Learning Platforms Analyzed (JSON):
+Learning Platforms Analyzed (table + per-item details):
 {company_data}
 
 Provide a concise recommendation:
@@ -75,7 +75,7 @@ Keep responses brief (3-4 sentences).
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-Resume Tools Analyzed (JSON):
+Resume Tools Analyzed (table + per-item details):
 {company_data}
 
 Provide a concise recommendation:
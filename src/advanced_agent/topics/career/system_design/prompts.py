@@ -65,7 +65,7 @@ Keep responses under 4 sentences.
 
     def recommendations_user(self, query: str, company_data: str) -> str:
         return f"""Career Query: {query}
-System Design Platforms Analyzed (JSON):
+System Design Platforms Analyzed (table + per-item details):
 {company_data}
 
 Provide a succinct recommendation:
@@ -0,0 +1,142 @@
+# src/topics/compact_encoding.py
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from pydantic import BaseModel
+
+# Presentation-only fields: useful for the UI, useless (and costly) in prompts.
+VISUAL_FIELDS = {"logo_url", "primary_color", "brand_colors"}
+
+# Short scalars go into the shared table; longer text goes to per-record details.
+MAX_TABLE_CELL_CHARS = 60
+
+# Model defaults that carry no information.
+_EMPTY_STRINGS = {"", "unknown", "n/a", "none", "null"}
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value.strip().lower() in _EMPTY_STRINGS
+    if isinstance(value, (list, tuple, set, dict)):
+        return len(value) == 0
+    return False
+
+
+def _as_dict(record: Any, exclude: Iterable[str]) -> Dict[str, Any]:
+    if isinstance(record, BaseModel):
+        data = record.model_dump()
+    elif isinstance(record, dict):
+        data = dict(record)
+    else:
+        data = dict(getattr(record, "__dict__", {}) or {})
+    skip = set(exclude)
+    return {k: v for k, v in data.items() if k not in skip and not _is_empty(v)}
+
+
+def _scalar(value: Any) -> str:
+    if isinstance(value, bool):
+        return "yes" if value else "no"
+    text = " ".join(str(value).split())
+    if text.startswith(("http://", "https://")):
+        text = text.split("://", 1)[1].rstrip("/")
+    return text
+
+
+def _is_table_value(value: Any) -> bool:
+    if isinstance(value, (bool, int, float)):
+        return True
+    return isinstance(value, str) and len(_scalar(value)) <= MAX_TABLE_CELL_CHARS
+
+
+def _inline(value: Any) -> str:
+    if isinstance(value, dict):
+        parts = [
+            _scalar(v) if k in ("text", "description") else f"{k}={_scalar(v)}"
+            for k, v in value.items()
+            if not _is_empty(v)
+        ]
+        return "; ".join(parts)
+    if isinstance(value, (list, tuple, set)):
+        return "; ".join(_inline(v) for v in value if not _is_empty(v))
+    return _scalar(value)
+
+
+def encode_records(
+    records: Sequence[Any],
+    *,
+    key_field: str = "name",
+    exclude: Iterable[str] = VISUAL_FIELDS,
+) -> str:
+    """
+    Compact text for a list of companies/resources:
+
+      name|pricing_model|is_open_source|...      <- attributes short enough to tabulate
+      Stripe|Paid|no|...
+      [Stripe]                                   <- long text and lists, per record
+      description: ...
+      strengths: a; b; c
+
+    Nulls, empties, "Unknown" and visual fields are dropped.
+    """
+    rows = [_as_dict(r, exclude) for r in records]
+    rows = [r for r in rows if r]
+    if not rows:
+        return "(none)"
+
+    # Columns: fields that are short scalars in every record that has them.
+    columns: List[str] = [key_field] if any(key_field in r for r in rows) else []
+    for row in rows:
+        for field_name, value in row.items():
+            if field_name in columns:
+                continue
+            if all(_is_table_value(r[field_name]) for r in rows if field_name in r):
+                columns.append(field_name)
+
+    lines = ["|".join(columns)]
+    for row in rows:
+        lines.append("|".join(_scalar(row.get(c, "")).replace("|", "/") for c in columns))
+
+    for row in rows:
+        details = [(k, v) for k, v in row.items() if k not in columns]
+        if not details:
+            continue
+        lines.append(f"[{_scalar(row.get(key_field, '?'))}]")
+        lines.extend(f"{k}: {_inline(v)}" for k, v in details)
+
+    return "\n".join(lines)
+
+
+def encode_knowledge(knowledge: Optional[Any]) -> str:
+    """
+    One section per non-empty knowledge list, one line per item.
+    """
+    if knowledge is None:
+        return ""
+    data = _as_dict(knowledge, exclude=())
+    lines: List[str] = []
+    for section, value in data.items():
+        if isinstance(value, list):
+            lines.append(f"{section}:")
+            lines.extend(f"- {_inline(item)}" for item in value if not _is_empty(item))
+        else:
+            lines.append(f"{section}: {_inline(value)}")
+    return "\n".join(lines)
+
+
+def encode_research_payload(
+    records: Sequence[Any],
+    knowledge: Optional[Any] = None,
+    *,
+    key_field: str = "name",
+) -> str:
+    """
+    Records table + details, followed by the knowledge sections (if any).
+    """
+    parts = [encode_records(records, key_field=key_field)]
+    knowledge_text = encode_knowledge(knowledge)
+    if knowledge_text:
+        parts.append("KNOWLEDGE\n" + knowledge_text)
+    return "\n\n".join(parts)
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 from urllib.parse import urlparse, urlunparse, parse_qsl, urlencode
 
@@ -122,3 +122,98 @@ def dedup_web_results(results: Iterable[WebResult]) -> List[WebResult]:
         return (r.rank, r.source_type)
 
     return sorted(merged.values(), key=sort_key)
+
+
+@dataclass
+class PassYield:
+    """
+    What a single search pass contributed, used to build the yield curve.
+    """
+    pass_index: int
+    query: str
+    num_results: int    # how many results were requested
+    results: int        # how many results came back
+    new_domains: int    # domains not seen in earlier passes
+    unique_domains: int # running total of distinct domains
+    new_chars: int      # markdown characters contributed by this pass
+    total_chars: int    # running total of markdown characters
+
+
+@dataclass
+class AdaptivePassController:
+    """
+    Decides how far a multi-pass article search should go.
+
+    After every pass we record the unique-domain yield and the content volume.
+    - Once both targets are met, the remaining passes are skipped.
+    - If a pass mostly returned domains we already had, the next pass asks
+      for more results (up to `max_results`) to compensate.
+    """
+    target_domains: int = 5
+    target_chars: int = 6000
+    base_results: int = 3
+    max_results: int = 8
+    # below this share of new domains per requested result, the pass is "poor"
+    poor_yield_ratio: float = 0.5
+
+    seen_domains: set = field(default_factory=set)
+    total_chars: int = 0
+    curve: List[PassYield] = field(default_factory=list)
+    num_results: int = 0
+
+    def __post_init__(self) -> None:
+        if not self.num_results:
+            self.num_results = self.base_results
+
+    def record(
+        self,
+        query: str,
+        meta_items: List[Dict[str, str]],
+        content: str,
+    ) -> PassYield:
+        """
+        Register the outcome of one pass and adapt `num_results` for the next one.
+        """
+        domains = {
+            (urlparse(item.get("url") or "").netloc or "").lower().removeprefix("www.")
+            for item in meta_items
+        }
+        domains.discard("")
+        new_domains = domains - self.seen_domains
+        self.seen_domains |= new_domains
+
+        new_chars = len(content.strip())
+        self.total_chars += new_chars
+
+        pass_yield = PassYield(
+            pass_index=len(self.curve) + 1,
+            query=query,
+            num_results=self.num_results,
+            results=len(meta_items),
+            new_domains=len(new_domains),
+            unique_domains=len(self.seen_domains),
+            new_chars=new_chars,
+            total_chars=self.total_chars,
+        )
+        self.curve.append(pass_yield)
+
+        # Widen the next pass only when this one was mostly duplicates / empty.
+        if len(new_domains) < self.poor_yield_ratio * self.num_results:
+            self.num_results = min(self.max_results, self.num_results + self.base_results)
+
+        return pass_yield
+
+    def satisfied(self) -> bool:
+        return (
+            len(self.seen_domains) >= self.target_domains
+            and self.total_chars >= self.target_chars
+        )
+
+    def format_curve(self) -> str:
+        """
+        Compact one-line yield curve, e.g. "p1 n=3 3d/4210c → p2 n=3 5d/8377c".
+        """
+        return " → ".join(
+            f"p{p.pass_index} n={p.num_results} {p.unique_domains}d/{p.total_chars}c"
+            for p in self.curve
+        )
@@ -1,8 +1,11 @@
 # src/topics/registry.py
 from __future__ import annotations
 
+import threading
+import time
+from collections.abc import MutableMapping
 from dataclasses import dataclass
-from typing import Callable, Dict, Any
+from typing import Callable, Dict, Any, Iterable, Iterator, List, Optional
 
 # Core / original CS-tool topics
 from .tools.developer_tools.workflow import DeveloperToolsWorkflow
@@ -501,12 +504,98 @@ TOPIC_CONFIGS: Dict[str, TopicConfig] = {
 }
 
 
-def build_workflows() -> Dict[str, Any]:
+class LazyWorkflowRegistry(MutableMapping):
     """
-    Instantiate one workflow per topic key.
-    If you want lazy creation later, you can change this to return a factory.
+    { topic_key: workflow } that builds each workflow on first access and
+    caches it. Building one means a ChatOpenAI client, a FirecrawlService and a
+    compiled StateGraph, so startup no longer pays for topics nobody asks about.
+
+    Assigning an instance (`registry[key] = wf`) overrides the factory.
+    """
+
+    def __init__(self, factories: Dict[str, Callable[[], Any]]) -> None:
+        self._factories = dict(factories)
+        self._instances: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+
+    def _key_lock(self, key: str) -> threading.Lock:
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def __getitem__(self, key: str) -> Any:
+        instance = self._instances.get(key)
+        if instance is not None:
+            return instance
+        if key not in self._factories:
+            raise KeyError(key)
+        # One build per key, even when several requests hit a cold topic at once.
+        with self._key_lock(key):
+            instance = self._instances.get(key)
+            if instance is None:
+                start = time.perf_counter()
+                instance = self._factories[key]()
+                self._instances[key] = instance
+                print(f"[Registry] built {key} in {time.perf_counter() - start:.2f}s")
+        return instance
+
+    def __setitem__(self, key: str, workflow: Any) -> None:
+        with self._lock:
+            self._factories.pop(key, None)
+            self._instances[key] = workflow
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            if key not in self._factories and key not in self._instances:
+                raise KeyError(key)
+            self._factories.pop(key, None)
+            self._instances.pop(key, None)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._factories) + [k for k in self._instances if k not in self._factories])
+
+    def __len__(self) -> int:
+        return len(set(self._factories) | set(self._instances))
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._factories or key in self._instances
+
+    def clear(self) -> None:
+        # MutableMapping.clear() would pop (and therefore build) every workflow.
+        with self._lock:
+            self._factories.clear()
+            self._instances.clear()
+
+    def built_keys(self) -> List[str]:
+        return list(self._instances)
+
+    def prewarm(self, keys: Iterable[str], background: bool = True) -> Optional[threading.Thread]:
+        """
+        Build the given topics now, in a daemon thread unless background=False.
+        Unknown keys and build errors are logged and skipped.
+        """
+        keys = [k for k in keys if k in self]
+
+        def _build_all() -> None:
+            for key in keys:
+                try:
+                    self[key]
+                except Exception as e:
+                    print(f"[Registry] prewarm failed for {key}: {e}")
+
+        if not background:
+            _build_all()
+            return None
+        thread = threading.Thread(target=_build_all, name="workflow-prewarm", daemon=True)
+        thread.start()
+        return thread
+
+
+def build_workflows() -> LazyWorkflowRegistry:
+    """
+    One (lazily built) workflow per topic key.
     """
-    return {key: cfg.workflow_factory() for key, cfg in TOPIC_CONFIGS.items()}
+    return LazyWorkflowRegistry({key: cfg.workflow_factory for key, cfg in TOPIC_CONFIGS.items()})
 
 
 def get_topic_labels() -> Dict[str, str]:
@@ -1,16 +1,20 @@
 # src/topics/root_workflow.py
 from __future__ import annotations
+import copy
 from typing import Optional, Callable, Any, List, Dict, Tuple, Type, TypeVar, Generic
 from pydantic import BaseModel
 
 from langchain_openai import ChatOpenAI
-from langchain_deepseek import ChatDeepSeek
-from langchain_anthropic import ChatAnthropic
-from langchain_google_genai import ChatGoogleGenerativeAI
 
+from ..cancellation import CancelToken, raise_if_cancelled
 from ..firecrawl import FirecrawlService
+from ..profiles.store import PROFILE_STORE, CompanyProfileStore, source_hash
+from ..profiles.websites import WEBSITE_INDEX, WebsiteIndex
+from ..profiles.entities import resolve_entities
 from .root_prompts import BaseRootPrompts
 from .knowledge_extraction import KnowledgeExtractionResult
+from .multi_pass_search import AdaptivePassController
+from ..site_crawler import TargetedCrawler
 
 from urllib.parse import urlparse
 import re
@@ -22,6 +26,25 @@ class RootWorkflow(Generic[StateT]):
     topic_label: str = "GenericTopic"
     topic_tag: str = "GenericSubTopic"
 
+    # Adaptive multi-pass search: stop once this many unique domains and
+    # characters of article content are collected; widen poor passes up to max.
+    multi_pass_target_domains: int = 5
+    multi_pass_target_chars: int = 6000
+    multi_pass_max_results: int = 8
+
+    # Analyzed companies are shared through the profile store by family;
+    # an empty family disables the store for a workflow.
+    profile_family: str = ""
+
+    # Targeted crawl of each researched tool's pricing / features / docs pages.
+    # When sub-pages are read, the landing page is trimmed so landing + sections
+    # still fit the analysis prompt's content window. Fast mode reads landing
+    # pages only: a sub-page adds a scrape per company to its latency budget.
+    subpage_pages_fast: int = 0
+    subpage_pages_deep: int = 3
+    subpage_landing_chars: int = 1000
+    subpage_chars: int = 1500
+
     def __init__(
         self,
         default_model: str = "gpt-4o-mini",
@@ -30,7 +53,25 @@ class RootWorkflow(Generic[StateT]):
         self.llm = ChatOpenAI(model=default_model, temperature=default_temperature)
         self.knowledge_llm = self.llm.with_structured_output(KnowledgeExtractionResult)
         self._log_callback: Optional[Callable[[str], None]] = None
+        self._cancel_token: Optional[CancelToken] = None
         self.firecrawl = FirecrawlService()
+        self.profile_store: Optional[CompanyProfileStore] = PROFILE_STORE
+        self.website_index: Optional[WebsiteIndex] = WEBSITE_INDEX
+
+    def spawn(self) -> "RootWorkflow":
+        """
+        Another instance for a concurrent run. Clients, caches, prompts and
+        stores are shared; the per-run state (LLM choice, log callback, cancel
+        token) and the compiled graph, whose nodes are bound methods, belong to
+        the copy.
+        """
+        clone = copy.copy(self)
+        clone._log_callback = None
+        clone._cancel_token = None
+        if hasattr(self, "workflow"):
+            build = getattr(clone, "_build_workflow", None) or getattr(clone, "build_graph")
+            clone.workflow = build()
+        return clone
 
     @staticmethod
     def _is_fast(state: Any) -> bool:
@@ -41,13 +82,21 @@ class RootWorkflow(Generic[StateT]):
     def set_llm(self, model_name: str, temperature: float) -> None:
         print(f"Setting LLM... model: {model_name} temperature: {temperature}")
 
+        # Non-OpenAI providers are imported on first use: together they add
+        # ~2s to server startup and most sessions never select them.
         if "gpt" in model_name:
             self.llm = ChatOpenAI(model=model_name, temperature=temperature, timeout=100, max_retries=1)
         elif "deepseek" in model_name:
+            from langchain_deepseek import ChatDeepSeek
+
             self.llm = ChatDeepSeek(model=model_name, temperature=temperature, timeout=100, max_retries=1)
         elif "claude" in model_name:
+            from langchain_anthropic import ChatAnthropic
+
             self.llm = ChatAnthropic(model=model_name, temperature=temperature, timeout=100, max_retries=1)
         else:
+            from langchain_google_genai import ChatGoogleGenerativeAI
+
             self.llm = ChatGoogleGenerativeAI(model=model_name, temperature=temperature, timeout=100, max_retries=1)
 
         self.knowledge_llm = self.llm.with_structured_output(KnowledgeExtractionResult)
@@ -64,6 +113,213 @@ class RootWorkflow(Generic[StateT]):
         if self._log_callback:
             self._log_callback(msg)
 
+    # ---------------------------
+    # Cancellation
+    # ---------------------------
+    def set_cancel_token(self, token: Optional[CancelToken]) -> None:
+        self._cancel_token = token
+
+    def _check_cancelled(self) -> None:
+        raise_if_cancelled(getattr(self, "_cancel_token", None))
+
+    def _invoke_graph(self, initial_state: Any) -> Any:
+        """
+        workflow.invoke(), except that with a cancel token set the graph is
+        streamed and RunCancelled is raised between supersteps.
+        """
+        if getattr(self, "_cancel_token", None) is None:
+            return self.workflow.invoke(initial_state)
+        self._check_cancelled()
+        final_state = None
+        for final_state in self.workflow.stream(initial_state, stream_mode="values"):
+            self._check_cancelled()
+        return final_state
+
+    # ---------------------------
+    # Company profile store helpers
+    # ---------------------------
+    def _stored_profile(
+        self,
+        name: str,
+        model_cls: Type[BaseModel],
+        content: Optional[str] = None,
+    ) -> Optional[BaseModel]:
+        """
+        Fresh stored profile for `name` as a `model_cls` instance. With `content`,
+        a stale profile is also accepted if it was analyzed from the same source.
+        """
+        if self.profile_store is None or not self.profile_family:
+            return None
+
+        if content is None:
+            profile = self.profile_store.get_fresh(self.profile_family, name)
+            reason = "fresh"
+        else:
+            profile = self.profile_store.get(self.profile_family, name)
+            if profile is not None and profile.source_hash != source_hash(content):
+                profile = None
+            reason = "source unchanged"
+        if profile is None:
+            return None
+
+        try:
+            company = model_cls.model_validate({**profile.data, "name": name})
+        except Exception as e:
+            print(f"[Profiles] stored profile for {name} no longer validates: {e}")
+            return None
+
+        self._log(
+            f"♻️ Reusing stored profile for {name} "
+            f"({reason}, {profile.age_seconds() / 3600:.1f}h old)"
+        )
+        return company
+
+    def _store_profile(self, company: BaseModel, content: str) -> None:
+        if self.profile_store is None or not self.profile_family or not content:
+            return
+        try:
+            self.profile_store.put(
+                self.profile_family,
+                getattr(company, "name", ""),
+                company.model_dump(),
+                content,
+            )
+        except Exception as e:
+            print(f"[Profiles] could not store profile: {e}")
+
+    # ---------------------------
+    # Official website resolution
+    # ---------------------------
+    def _known_website(self, name: str) -> Optional[Tuple[str, str]]:
+        """
+        (url, description) from the website index, seeded on a miss from any
+        stored profile (fresh or stale) for the same product.
+        """
+        if self.website_index is None:
+            return None
+        site = self.website_index.lookup(name)
+        if site is not None:
+            return site.url, site.description
+        if self.profile_store is not None and self.profile_family:
+            profile = self.profile_store.get(self.profile_family, name)
+            data = profile.data if profile else {}
+            url = data.get("website") or None
+            if url and self.website_index.remember(name, url, data.get("description") or ""):
+                return url, data.get("description") or ""
+        return None
+
+    def _resolve_tool_entities(self, names: List[str]) -> List[str]:
+        """
+        Merge aliases ("VS Code" / "Visual Studio Code" / "VSCode") before any
+        per-tool research is fanned out.
+        """
+        resolution = resolve_entities(names, self.website_index)
+        if resolution.avoided:
+            merged = "; ".join(
+                f"{', '.join(aliases)} → {kept}" for kept, aliases in resolution.merged.items()
+            )
+            self._log(
+                f"Entity resolution merged {merged} "
+                f"({resolution.avoided} redundant research job(s) avoided)."
+            )
+        return resolution.names
+
+    def _subpage_budget(self, state: Any) -> int:
+        return self.subpage_pages_fast if self._is_fast(state) else self.subpage_pages_deep
+
+    def _augment_with_subpages(
+        self,
+        name: str,
+        url: str,
+        content: Optional[str],
+        max_pages: int,
+    ) -> Optional[str]:
+        """
+        Append the relevant sections of the tool's pricing / features / docs pages
+        (discovered from the landing page) to its landing-page content.
+        """
+        if max_pages <= 0 or not url:
+            return content
+        crawler = TargetedCrawler(self.firecrawl, max_pages=max_pages, max_chars=self.subpage_chars)
+        try:
+            pages = crawler.crawl(url, content)
+        except Exception as e:
+            self._log(f"Sub-page crawl failed for {name}: {e}")
+            return content
+        if not pages:
+            return content
+
+        self._log(f"📄 Read {', '.join(p.kind for p in pages)} page(s) for {name}")
+        sections = "\n\n".join(f"## {p.kind.title()} page ({p.url})\n{p.content}" for p in pages)
+        landing = (content or "")[: self.subpage_landing_chars]
+        return f"{landing}\n\n{sections}" if landing else sections
+
+    def _search_official_site(
+        self,
+        name: str,
+        query: str,
+    ) -> Optional[Tuple[str, str, Optional[str]]]:
+        """
+        Search round trip for a product's official site.
+        Returns (url, description, search markdown) and records the URL
+        (with its description) when its host names the product.
+        """
+        search_results = self.firecrawl.search_companies(query, num_results=1)
+        web_results = self._get_web_results(search_results)
+        if not web_results:
+            self._log(f"No web results for {name}")
+            return None
+
+        doc = web_results[0]
+        url = getattr(doc, "url", "") or ""
+        desc = ""
+        meta = getattr(doc, "metadata", None)
+        if meta:
+            desc = getattr(meta, "description", "") or desc
+            if not url:
+                url = getattr(meta, "url", "") or url
+
+        if not url:
+            self._log(f"No URL for {name}, skipping.")
+            return None
+
+        if self.website_index is not None:
+            self.website_index.remember(name, url, desc)
+        return url, desc, getattr(doc, "markdown", None)
+
+    def _resolve_and_scrape(
+        self,
+        name: str,
+        query: str,
+    ) -> Optional[Tuple[str, str, Optional[str], Any]]:
+        """
+        Scrape a product's official site, going straight to a known URL when the
+        index has one. Falls back to the search round trip (and drops the stale
+        index entry) if the known URL no longer scrapes. When the search result
+        already carries markdown, only branding is fetched.
+
+        Returns (url, description, search markdown, scrape result) or None.
+        """
+        known = self._known_website(name)
+        if known:
+            url, desc = known
+            scraped = self.firecrawl.scrape_company_pages(url)
+            if scraped:
+                self._log(f"🔗 Known official site for {name}: {url}")
+                return url, desc, None, scraped
+            self._log(f"Known site for {name} did not scrape ({url}); searching again.")
+            if self.website_index is not None:
+                self.website_index.forget(name)
+
+        found = self._search_official_site(name, query)
+        if found is None:
+            return None
+        url, desc, markdown = found
+        if markdown:
+            # Search already scraped this page's markdown; only branding is missing.
+            return url, desc, markdown, self.firecrawl.scrape_branding(url)
+        return url, desc, markdown, self.firecrawl.scrape_company_pages(url)
+
     # ---------------------------
     # Shared knowledge extraction helper
     # ---------------------------
@@ -118,7 +374,12 @@ class RootWorkflow(Generic[StateT]):
         web_results: List[Any],
         *,
         snippet_len: int = 1500,
+        include_snippets: bool = False,
     ) -> Tuple[str, List[Dict[str, str]]]:
+        """
+        Merge result markdown into one corpus plus {title, url} meta items.
+        With include_snippets, each meta item also carries its own `snippet`.
+        """
         all_content = ""
         meta_items: List[Dict[str, str]] = []
 
@@ -167,7 +428,10 @@ class RootWorkflow(Generic[StateT]):
                 all_content += markdown[:snippet_len] + "\n\n"
 
             if url or title:
-                meta_items.append({"title": title, "url": url})
+                item = {"title": title, "url": url}
+                if include_snippets:
+                    item["snippet"] = (markdown or "")[:snippet_len]
+                meta_items.append(item)
 
         return all_content, meta_items
 
@@ -227,6 +491,7 @@ class RootWorkflow(Generic[StateT]):
         snippet_len: int = 1500,
         query_variants: Optional[List[str]] = None,
         fast: bool = False,
+        include_snippets: bool = False,
     ) -> Tuple[str, List[Dict[str, str]]]:
         if fast:
             # FAST PATH: single search
@@ -241,6 +506,7 @@ class RootWorkflow(Generic[StateT]):
             merged_content, meta_items = self._collect_content_from_web_results(
                 web_results,
                 snippet_len=snippet_len,
+                include_snippets=include_snippets,
             )
             return merged_content, meta_items
 
@@ -254,24 +520,45 @@ class RootWorkflow(Generic[StateT]):
         all_content_blocks: List[str] = []
         all_meta_items: List[Dict[str, str]] = []
 
+        controller = AdaptivePassController(
+            target_domains=self.multi_pass_target_domains,
+            target_chars=self.multi_pass_target_chars,
+            base_results=num_results,
+            max_results=max(num_results, self.multi_pass_max_results),
+        )
+
         for idx, tmpl in enumerate(query_variants):
+            self._check_cancelled()
+            if controller.satisfied():
+                self._log(
+                    f"Multi-pass search: yield target met after {idx} pass(es), "
+                    f"skipping {len(query_variants) - idx} remaining."
+                )
+                break
+
             pass_query = tmpl.format(query=query)
-            self._log(f"Multi-pass search [pass {idx+1}/{len(query_variants)}]: {pass_query}")
+            pass_results = controller.num_results
+            self._log(
+                f"Multi-pass search [pass {idx+1}/{len(query_variants)}, n={pass_results}]: {pass_query}"
+            )
 
             try:
-                search_results = self.firecrawl.search_companies(pass_query, num_results=num_results)
+                search_results = self.firecrawl.search_companies(pass_query, num_results=pass_results)
             except Exception as e:
                 self._log(f"multi-pass search error in pass {idx+1}: {e}")
+                controller.record(pass_query, [], "")
                 continue
 
             web_results = self._get_web_results(search_results)
             if not web_results:
                 self._log(f"multi-pass search pass {idx+1}: no web results")
+                controller.record(pass_query, [], "")
                 continue
 
             pass_content, pass_meta = self._collect_content_from_web_results(
                 web_results,
                 snippet_len=snippet_len,
+                include_snippets=include_snippets,
             )
 
             if pass_content.strip():
@@ -280,6 +567,15 @@ class RootWorkflow(Generic[StateT]):
 
             all_meta_items.extend(pass_meta)
 
+            pass_yield = controller.record(pass_query, pass_meta, pass_content)
+            self._log(
+                f"Pass {idx+1} yield: {pass_yield.results} results, "
+                f"+{pass_yield.new_domains} new domains ({pass_yield.unique_domains} unique), "
+                f"+{pass_yield.new_chars} chars"
+            )
+
+        self._log(f"Multi-pass yield curve: {controller.format_curve() or 'no passes'}")
+
         deduped_meta = self._dedupe_meta_items(all_meta_items)
         merged_content = "\n\n---\n\n".join(all_content_blocks).strip()
         return merged_content, deduped_meta
@@ -304,7 +600,7 @@ class RootWorkflow(Generic[StateT]):
         initial_state: StateT = self.state_model(query=query, fast_mode=fast_mode)
 
         # 2) run the graph
-        final_state = self.workflow.invoke(initial_state)
+        final_state = self._invoke_graph(initial_state)
 
         # 3) normalize output
         # LangGraph may return:
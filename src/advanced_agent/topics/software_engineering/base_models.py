@@ -52,6 +52,9 @@ class BaseSoftwareEngState(RootResearchState):
     # useful resources (articles, docs, etc.) that were summarized
     resources: List[BaseSoftwareEngResourceSummary] = Field(default_factory=list)
 
+    # per-resource article snippet keyed by url (input of the summarize map step)
+    resource_snippets: Dict[str, str] = Field(default_factory=dict)
+
     # structured knowledge is already inherited as `knowledge`
 
     # final actionable recommendation
@@ -74,7 +74,7 @@ class BaseSoftwareEngPrompts(BaseRootPrompts, ABC):
     def recommendations_user(query: str, serialized_resources: str) -> str:
         return (
             "Developer Query: {query}\n\n"
-            "Aggregated Resource Data (JSON-like, may include multiple analyzed resources):\n"
+            "Aggregated Resource Data (table + per-resource details, may include multiple analyzed resources):\n"
             "{resources}\n\n"
             "Provide a short but actionable recommendation for the team using the schema:\n"
             "- summary: 2–3 sentence summary of the best approach.\n"
@@ -1,12 +1,16 @@
 # src/topics/software_eng/workflow.py
 from __future__ import annotations
 
-import json
-from typing import List
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 from langgraph.graph import StateGraph
 
+from ...profiles.store import source_hash
 from ..root_workflow import RootWorkflow
+from ..compact_encoding import encode_research_payload
 from .base_prompts import BaseSoftwareEngPrompts
 from .base_models import (
     BaseSoftwareEngState,
@@ -20,10 +24,18 @@ class BaseSoftwareEngWorkflow(RootWorkflow[BaseSoftwareEngState]):
     article_query_suffix: str = "Software Engineering methodology"
     topic_tag = "Base"
 
+    # Summarize map step: one LLM call per resource on a bounded pool; results
+    # are cached per (url, snippet hash) for the lifetime of the workflow.
+    summarize_max_workers: int = 4
+    summary_cache_max_entries: int = 512
+    max_extracted_keywords: int = 10
+
     def __init__(self) -> None:
         super().__init__()
         self.state_model = BaseSoftwareEngState
         self.prompts = BaseSoftwareEngPrompts()
+        self._summary_cache: Dict[Tuple[str, str], List[str]] = {}
+        self._summary_lock = threading.Lock()
         self.workflow = self.build_graph()
 
     # -------------------------
@@ -55,6 +67,7 @@ class BaseSoftwareEngWorkflow(RootWorkflow[BaseSoftwareEngState]):
             snippet_len=1500,
             query_variants=query_variants,
             fast=fast,
+            include_snippets=True,
         )
 
         # Populate aggregated_markdown
@@ -71,13 +84,69 @@ class BaseSoftwareEngWorkflow(RootWorkflow[BaseSoftwareEngState]):
             )
 
         if resources:
-            new_state = new_state.model_copy(update={"resources": resources})
+            snippets = {
+                item["url"]: item["snippet"]
+                for item in meta_items
+                if item.get("url") and item.get("snippet")
+            }
+            new_state = new_state.model_copy(
+                update={"resources": resources, "resource_snippets": snippets}
+            )
 
         return new_state
 
     # -------------------------
-    # Step 3: summarize resources / extract keywords
+    # Step 3: summarize resources / extract keywords (map → reduce)
     # -------------------------
+    def _extract_key_points(self, query: str, content: str) -> List[str]:
+        user_msg = self.prompts.tool_extraction_user(query=query, content=content)
+        raw_response = self.llm.invoke(
+            [
+                {"role": "system", "content": self.prompts.TOOL_EXTRACTION_SYSTEM},
+                {"role": "user", "content": user_msg},
+            ]
+        )
+        text = raw_response.content if hasattr(raw_response, "content") else str(raw_response)
+        lines = [line.strip("-• ").strip() for line in text.splitlines() if line.strip()]
+        return [line for line in lines if line]
+
+    def _summarize_resource(self, query: str, url: str, snippet: str) -> Optional[List[str]]:
+        """
+        Map step for one resource; None if the call failed (not cached).
+        """
+        self._check_cancelled()
+        key = (url, source_hash(f"{type(self.prompts).__name__}\n{query}\n{snippet}"))
+        with self._summary_lock:
+            cached = self._summary_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            points = self._extract_key_points(query, snippet)
+        except Exception as e:
+            self._log(f"Summarization failed for {url}: {e}")
+            return None
+
+        with self._summary_lock:
+            self._summary_cache[key] = points
+            while len(self._summary_cache) > self.summary_cache_max_entries:
+                self._summary_cache.pop(next(iter(self._summary_cache)))
+        return points
+
+    def _reduce_keywords(self, per_resource: List[List[str]]) -> List[str]:
+        """
+        Points raised by more resources rank first; ties keep first-seen order.
+        """
+        counts: Counter = Counter()
+        first_seen: Dict[str, str] = {}
+        for points in per_resource:
+            for point in dict.fromkeys(p.strip() for p in points if p.strip()):
+                norm = point.lower()
+                counts[norm] += 1
+                first_seen.setdefault(norm, point)
+        ranked = sorted(enumerate(first_seen), key=lambda pair: (-counts[pair[1]], pair[0]))
+        return [first_seen[norm] for _, norm in ranked[: self.max_extracted_keywords]]
+
     def step_3_summarize(self, state: BaseSoftwareEngState) -> BaseSoftwareEngState:
         if not state.aggregated_markdown:
             self._log("No aggregated markdown available; skipping summarization.")
@@ -89,42 +158,46 @@ class BaseSoftwareEngWorkflow(RootWorkflow[BaseSoftwareEngState]):
             self._log("Fast mode: skipping summarization step.")
             return state
 
-        self._log("Summarizing aggregated content into keywords / key points...")
+        jobs = [
+            (idx, r.url, state.resource_snippets[r.url])
+            for idx, r in enumerate(state.resources)
+            if r.url and state.resource_snippets.get(r.url)
+        ]
 
-        user_msg = self.prompts.tool_extraction_user(
-            query=state.query,
-            content=state.aggregated_markdown,
-        )
+        if not jobs:
+            # No per-resource content: summarize the aggregated corpus in one call.
+            self._log("Summarizing aggregated content into keywords / key points...")
+            keywords = self._extract_key_points(state.query, state.aggregated_markdown)
+            new_state = state.model_copy(update={"extracted_keywords": keywords})
+            if not new_state.resources:
+                synthetic = BaseSoftwareEngResourceSummary(
+                    title="Aggregated software engineering research",
+                    url="",
+                    key_points=keywords,
+                )
+                new_state = new_state.model_copy(update={"resources": [synthetic]})
+            return new_state
 
-        raw_response = self.llm.invoke(
-            [
-                {"role": "system", "content": self.prompts.TOOL_EXTRACTION_SYSTEM},
-                {"role": "user", "content": user_msg},
-            ]
+        self._log(
+            f"Summarizing {len(jobs)} resources in parallel "
+            f"(max {self.summarize_max_workers} at a time)..."
         )
+        with ThreadPoolExecutor(max_workers=min(self.summarize_max_workers, len(jobs))) as executor:
+            results = list(
+                executor.map(lambda job: self._summarize_resource(state.query, job[1], job[2]), jobs)
+            )
 
-        text = raw_response.content if hasattr(raw_response, "content") else str(raw_response)
-        lines = [line.strip("-• ").strip() for line in text.splitlines() if line.strip()]
-        keywords = [line for line in lines if line]
-
-        # Put them both into extracted_keywords and into the first resource key_points
-        new_state = state.model_copy(update={"extracted_keywords": keywords})
+        resources = list(state.resources)
+        per_resource: List[List[str]] = []
+        for (idx, _, _), points in zip(jobs, results):
+            if points:
+                resources[idx] = resources[idx].model_copy(update={"key_points": points})
+                per_resource.append(points)
 
-        if not new_state.resources:
-            # Create a synthetic resource if none exist
-            synthetic = BaseSoftwareEngResourceSummary(
-                title="Aggregated software engineering research",
-                url="",
-                key_points=keywords,
-            )
-            new_state = new_state.model_copy(update={"resources": [synthetic]})
-        else:
-            # Attach key points to the first resource as a simple approach
-            first = new_state.resources[0].model_copy(update={"key_points": keywords})
-            remaining = new_state.resources[1:]
-            new_state = new_state.model_copy(update={"resources": [first, *remaining]})
+        keywords = self._reduce_keywords(per_resource)
+        self._log(f"Summarized {len(per_resource)}/{len(jobs)} resources into {len(keywords)} key points.")
 
-        return new_state
+        return state.model_copy(update={"resources": resources, "extracted_keywords": keywords})
 
     # -------------------------
     # Step 4: knowledge extraction
@@ -157,11 +230,7 @@ class BaseSoftwareEngWorkflow(RootWorkflow[BaseSoftwareEngState]):
         self._log("Generating software engineering recommendation from resources + knowledge...")
 
         # Serialize a light-weight view of resources and (optionally) knowledge
-        resources_payload = {
-            "resources": [r.model_dump() for r in state.resources],
-            "knowledge": state.knowledge.model_dump() if state.knowledge else None,
-        }
-        serialized = json.dumps(resources_payload, ensure_ascii=False)
+        serialized = encode_research_payload(state.resources, state.knowledge, key_field="title")
 
         user_msg = self.prompts.recommendations_user(
             query=state.query,
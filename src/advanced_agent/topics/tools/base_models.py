@@ -24,6 +24,24 @@ class ToolComparisonRecommendation(BaseModel):
     step_by_step_decision_guide: List[str] = Field(default_factory=list)
 
 
+class ToolTriageScore(BaseModel):
+    """
+    Cheap relevance score for one candidate, from article snippets only.
+    """
+
+    name: str
+    relevance: int = Field(0, ge=0, le=10)
+    reason: str = ""
+
+
+class ToolTriageResult(BaseModel):
+    """
+    Output of the triage pass that picks which candidates get deep research.
+    """
+
+    scores: List[ToolTriageScore] = Field(default_factory=list)
+
+
 class BaseCompanyAnalysis(RootCompanyAnalysis):
     """
     Generic structured output for LLM analysis of a product/service/platform.
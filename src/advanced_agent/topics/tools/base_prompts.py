@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC
-from typing import ClassVar
+from typing import ClassVar, List, Tuple
 
 from ..root_prompts import BaseRootPrompts
 
@@ -129,9 +129,6 @@ class BaseCSResearchPrompts(BaseRootPrompts, ABC):
             "- Return just the names, one per line, no descriptions, no numbering, no JSON.\n"
         )
 
-    # -----------------------------
-    # 2) TOOL / COMPANY ANALYSIS
-    # -----------------------------
     # -----------------------------
     # 2) TOOL / COMPANY ANALYSIS
     # -----------------------------
@@ -151,6 +148,35 @@ class BaseCSResearchPrompts(BaseRootPrompts, ABC):
             "Your answers should be concise, factual, and focused on how the product is used in practice."
         )
 
+    # Per-tool content window in analysis prompts (landing page + pricing/docs sections).
+    ANALYSIS_CONTENT_CHARS: ClassVar[int] = 4000
+
+    # Field list shared by the single-tool and batched analysis prompts.
+    ANALYSIS_FIELDS: ClassVar[str] = (
+        '- pricing_model: One of \"Free\", \"Freemium\", \"Paid\", \"Enterprise\", or \"Unknown\".\n'
+        '- pricing_details: Short string with any price info if available (e.g. '
+        '"from $20/month", "Free tier + $10/user/month"), or null/empty if unclear.\n'
+        "- is_open_source: true if clearly open source, false if clearly proprietary, null if unclear.\n"
+        '- category: Short description of the category (e.g. \"Cloud database\", \"CI/CD platform\", '
+        '\"Ride-sharing app\", \"Dating app\").\n'
+        '- primary_use_case: Short phrase summarizing the main use case or job to be done.\n'
+        '- target_users: Array of user types (e.g. [\"Backend engineers\", \"Data teams\", \"End consumers\"]).\n'
+        "- tech_stack: Array of notable languages, frameworks, infra, or technologies (if mentioned, else []).\n"
+        "- description: 1-sentence description of what it does for its users.\n"
+        "- api_available: true if API/SDK/programmatic access is clearly mentioned; "
+        "false if clearly none; null if unclear.\n"
+        "- language_support: Array of supported programming languages or human languages, if applicable.\n"
+        "- integration_capabilities: Array of integrations (e.g. GitHub, VS Code, AWS, Slack, Stripe).\n"
+        "- strengths: Array of concrete strengths or advantages, based on the snippet.\n"
+        "- limitations: Array of concrete downsides, gaps, or tradeoffs.\n"
+        "- ideal_for: Array of scenarios or team types where this is a strong fit.\n"
+        "- not_suited_for: Array of scenarios where this is likely a bad fit.\n\n"
+        "Guidelines:\n"
+        "- If the snippet does not mention something and it is not widely known, prefer Unknown/null/empty.\n"
+        "- Keep each string short and information-dense (1–2 lines max).\n"
+        "- Do NOT include any fields other than the ones listed.\n\n"
+    )
+
     @classmethod
     def tool_analysis_user(cls, company_name: str, content: str) -> str:
         """
@@ -173,37 +199,74 @@ class BaseCSResearchPrompts(BaseRootPrompts, ABC):
           - ideal_for
           - not_suited_for
         """
-        snippet = content[:2500]
+        limit = cls.ANALYSIS_CONTENT_CHARS
+        snippet = content[:limit]
         return (
             f"Tool / Service / Platform: {company_name}\n"
-            f"Website or Documentation Content (truncated to 2500 chars):\n{snippet}\n\n"
+            f"Website or Documentation Content (truncated to {limit} chars):\n{snippet}\n\n"
             "Analyze this from a developer/engineering perspective and return "
             "a single JSON object with the following fields:\n"
-            '- pricing_model: One of \"Free\", \"Freemium\", \"Paid\", \"Enterprise\", or \"Unknown\".\n'
-            '- pricing_details: Short string with any price info if available (e.g. '
-            '"from $20/month", "Free tier + $10/user/month"), or null/empty if unclear.\n'
-            "- is_open_source: true if clearly open source, false if clearly proprietary, null if unclear.\n"
-            '- category: Short description of the category (e.g. \"Cloud database\", \"CI/CD platform\", '
-            '\"Ride-sharing app\", \"Dating app\").\n'
-            '- primary_use_case: Short phrase summarizing the main use case or job to be done.\n'
-            '- target_users: Array of user types (e.g. [\"Backend engineers\", \"Data teams\", \"End consumers\"]).\n'
-            "- tech_stack: Array of notable languages, frameworks, infra, or technologies (if mentioned, else []).\n"
-            "- description: 1-sentence description of what it does for its users.\n"
-            "- api_available: true if API/SDK/programmatic access is clearly mentioned; "
-            "false if clearly none; null if unclear.\n"
-            "- language_support: Array of supported programming languages or human languages, if applicable.\n"
-            "- integration_capabilities: Array of integrations (e.g. GitHub, VS Code, AWS, Slack, Stripe).\n"
-            "- strengths: Array of concrete strengths or advantages, based on the snippet.\n"
-            "- limitations: Array of concrete downsides, gaps, or tradeoffs.\n"
-            "- ideal_for: Array of scenarios or team types where this is a strong fit.\n"
-            "- not_suited_for: Array of scenarios where this is likely a bad fit.\n\n"
-            "Guidelines:\n"
-            "- If the snippet does not mention something and it is not widely known, prefer Unknown/null/empty.\n"
-            "- Keep each string short and information-dense (1–2 lines max).\n"
-            "- Do NOT include any fields other than the ones listed.\n\n"
+            + cls.ANALYSIS_FIELDS
+            + "Return ONLY a valid JSON object. No extra commentary, no markdown, no backticks."
+        )
+
+    @classmethod
+    def tool_analysis_batch_user(cls, companies: List[Tuple[str, str]]) -> str:
+        """
+        User message for analyzing several tools in ONE call.
+
+        Same per-tool fields as tool_analysis_user, plus `company_name`, returned as
+        a list under `analyses` (one entry per tool, in the given order).
+        """
+        limit = cls.ANALYSIS_CONTENT_CHARS
+        blocks = []
+        for idx, (company_name, content) in enumerate(companies, start=1):
+            blocks.append(
+                f"=== Tool {idx}: {company_name} ===\n"
+                f"Website or Documentation Content (truncated to {limit} chars):\n{content[:limit]}\n"
+            )
+        names = ", ".join(name for name, _ in companies)
+        return (
+            f"Analyze each of the following {len(companies)} tools / services / platforms "
+            "independently, from a developer/engineering perspective.\n\n"
+            + "\n".join(blocks)
+            + "\nReturn a JSON object with a single field `analyses`: an array with exactly one "
+            f"entry per tool ({names}), in the same order. Each entry has:\n"
+            "- company_name: the tool name exactly as written above.\n"
+            + cls.ANALYSIS_FIELDS
+            + "- Never mix facts between tools; each entry uses only its own content.\n\n"
             "Return ONLY a valid JSON object. No extra commentary, no markdown, no backticks."
         )
 
+    # -----------------------------
+    # 2b) TRIAGE PROMPTS (cheap pre-ranking before deep research)
+    # -----------------------------
+    @property
+    def TOOL_TRIAGE_SYSTEM(self) -> str:
+        return (
+            f"You are a fast screener ranking candidates ({self.TOPIC_LABEL}) for a user's query.\n"
+            "You only see short snippets from comparison articles. Score how well each candidate "
+            "fits the user's primary job to be done, from 0 (unrelated or not a real product) to 10 "
+            "(a leading, directly matching option). Do not invent information."
+        )
+
+    @classmethod
+    def tool_triage_user(cls, query: str, candidates: List[Tuple[str, str]]) -> str:
+        """
+        candidates: (name, snippet) pairs; snippets may be empty.
+        """
+        blocks = [
+            f"- {name}: {snippet or '(not described in the articles)'}"
+            for name, snippet in candidates
+        ]
+        return (
+            f"User Query:\n{query}\n\n"
+            "Candidates with article snippets:\n"
+            + "\n".join(blocks)
+            + "\n\nReturn JSON with a `scores` array: one entry per candidate with "
+            "`name` (exactly as written above), `relevance` (integer 0-10) and a short `reason`."
+        )
+
     # -----------------------------
     # 3) RECOMMENDATION PROMPTS
     # -----------------------------
@@ -228,11 +291,14 @@ class BaseCSResearchPrompts(BaseRootPrompts, ABC):
         """
         User message template for final recommendations.
 
-        `company_data` is a JSON array of BaseCompanyInfo-like objects.
+        `company_data` is the compact encoding of the candidates (see
+        topics/compact_encoding.py): a `|`-separated table of short attributes,
+        `[Name]` detail blocks for lists/long text, then a KNOWLEDGE section.
         """
         return (
             f"User Query:\n{query}\n\n"
-            f"Candidate tools/services (JSON array):\n{company_data}\n\n"
+            f"Candidate tools/services (table + per-tool details; missing fields are unknown):\n"
+            f"{company_data}\n\n"
             "Interpretation steps:\n"
             "1) Infer the user’s primary job to be done and any explicit constraints (e.g., budget, team size, "
             "region, self-hosted vs fully managed, open source vs proprietary).\n"
@@ -2,14 +2,16 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import Type, TypeVar, Generic, Dict, Any, List, Callable, Optional
+from typing import Type, TypeVar, Generic, Dict, Any, List, Callable, Optional, Tuple
 
-import json
+import re
 
 from langgraph.graph import StateGraph
+from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from pydantic import BaseModel
+from pydantic import BaseModel, create_model
 
+from ...cancellation import RunCancelled
 from ...firecrawl import FirecrawlService
 from .base_prompts import BaseCSResearchPrompts
 from .base_models import (
@@ -17,28 +19,52 @@ from .base_models import (
     BaseCompanyInfo,
     BaseCompanyAnalysis,
     ToolComparisonRecommendation,
+    ToolTriageResult,
 )
 from ..root_workflow import RootWorkflow
+from ..compact_encoding import encode_research_payload
 
 StateT = TypeVar("StateT", bound=BaseResearchState)
 CompanyT = TypeVar("CompanyT", bound=BaseCompanyInfo)
 AnalysisT = TypeVar("AnalysisT", bound=BaseCompanyAnalysis)
 PromptsT = TypeVar("PromptsT", bound=BaseCSResearchPrompts)
 
+# analysis_model -> generated `{analyses: [...]}` schema for batched analysis
+_BATCH_ANALYSIS_MODELS: Dict[type, Type[BaseModel]] = {}
+
+# triage model name -> OpenAI client, shared by every workflow instance
+_TRIAGE_LLMS: Dict[str, ChatOpenAI] = {}
+
+
+def _openai_triage_llm(model: str) -> ChatOpenAI:
+    llm = _TRIAGE_LLMS.get(model)
+    if llm is None:
+        llm = _TRIAGE_LLMS.setdefault(
+            model, ChatOpenAI(model=model, temperature=0, timeout=30, max_retries=1)
+        )
+    return llm
+
 
 class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
     """
     Generic workflow for CS-product research topics (tools, platforms, services).
 
-    7-step clean pipeline:
+    7-step pipeline, wired as a DAG:
 
       1) interpret_query           – log / prepare
       2) collect_articles          – multi-pass article search, aggregated_markdown + sources
       3) extract_tools             – extract candidate tool names from aggregated content
-      4) research_tools            – per-tool scraping + structured company analysis
-      5) extract_knowledge         – global entities/pros/cons/risks/timeline
+      4) research_tools            – snippet triage of candidates, then scraping + batched
+                                     structured analysis of the top-k
+      5) extract_knowledge         – global entities/pros/cons/risks/timeline from articles
       6) compare_and_recommend     – structured ToolComparisonRecommendation
       7) generate_analysis         – final human-readable analysis string for UI
+
+    Knowledge extraction only needs the article corpus, so it fans out right after
+    collect_articles. Steps 3) and 4) run back to back as one graph node on the
+    other branch, so knowledge extraction overlaps tool research (the long
+    step) rather than just tool extraction; both branches join before
+    compare_and_recommend.
     """
 
     # Subclasses must override these:
@@ -51,6 +77,33 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
     # How to search for comparison articles given the query
     article_query_template: str = "{query} comparison best alternatives"
 
+    # Opt-in: analyze `analysis_batch_size` tools per LLM call (shared
+    # instructions sent once). This trades latency for fewer calls and input
+    # tokens: output tokens are generated serially inside one call, so a batch
+    # of N tools waits for N analyses' worth of output. The simulated model in
+    # benchmarks/bench_batched_analysis.py (0.4s per request + 2ms per output
+    # token, ~350 output tokens per tool; not a measurement against a real
+    # provider) puts 4 tools at ~1.1s per-tool, ~1.8s in pairs and ~3.2s in one
+    # call. Off by default, because research latency is what users wait on.
+    batch_analysis: bool = False
+    analysis_batch_size: int = 2
+
+    # Tool topics share analyzed profiles (Stripe researched under "payments"
+    # is reused under "developer tools").
+    profile_family: str = "tools"
+
+    # Two-phase research: a small model scores up to `triage_candidates`
+    # extracted names from article snippets, then only the top-k get the full
+    # scrape + analysis. `triage_model` is used when the run's model is an
+    # OpenAI one; other providers triage with the selected model.
+    triage_candidates: int = 10
+    deep_research_top_k: int = 4
+    triage_model: str = "gpt-4.1-nano"
+
+    # Landing + sub-page sections sized to prompts.ANALYSIS_CONTENT_CHARS.
+    subpage_landing_chars: int = 1500
+    subpage_chars: int = 2500
+
     def __init__(
         self,
         default_model: str = "gpt-4o-mini",
@@ -62,28 +115,49 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             default_temperature=default_temperature,
         )
         self.prompts: PromptsT = self.prompts_cls()
+        self.triage_llm = self._triage_llm_for(default_model)
         self.workflow = self._build_workflow()
 
+    def set_llm(self, model_name: str, temperature: float) -> None:
+        super().set_llm(model_name, temperature)
+        self.triage_llm = self._triage_llm_for(model_name)
+
+    def _triage_llm_for(self, model_name: str):
+        """
+        Triage follows the selected provider: the small OpenAI `triage_model`
+        (one shared client) for OpenAI runs, the run's own LLM otherwise, so
+        deployments without an OpenAI key still triage.
+        """
+        if "gpt" in model_name:
+            return _openai_triage_llm(self.triage_model)
+        return self.llm
+
     # ------------------------------------------------------------------ #
-    # Graph setup (7 steps) – now state-in / state-out like SoftwareEng
+    # Graph setup (7 steps)
+    #
+    #   interpret_query → collect_articles ─┬→ research_tools (extract + research) ─┬→ compare_and_recommend → generate_analysis
+    #                                       └→ extract_knowledge ───────────────────┘
+    #
+    # LangGraph advances in supersteps, so two separate nodes extract_tools →
+    # research_tools would let extract_knowledge overlap only the first of them.
+    # Nodes on the parallel branches return partial dict updates so they never
+    # write the same state keys in one superstep.
     # ------------------------------------------------------------------ #
     def _build_workflow(self):
         graph = StateGraph(self.state_model)
 
         graph.add_node("interpret_query", self._interpret_query_step)
         graph.add_node("collect_articles", self._collect_articles_step)
-        graph.add_node("extract_tools", self._extract_tools_step)
-        graph.add_node("research_tools", self._research_tools_step)
+        graph.add_node("research_tools", self._extract_and_research_tools_step)
         graph.add_node("extract_knowledge", self._extract_knowledge_step)
         graph.add_node("compare_and_recommend", self._compare_and_recommend_step)
         graph.add_node("generate_analysis", self._generate_analysis_step)
 
         graph.set_entry_point("interpret_query")
         graph.add_edge("interpret_query", "collect_articles")
-        graph.add_edge("collect_articles", "extract_tools")
-        graph.add_edge("extract_tools", "research_tools")
-        graph.add_edge("research_tools", "extract_knowledge")
-        graph.add_edge("extract_knowledge", "compare_and_recommend")
+        graph.add_edge("collect_articles", "research_tools")
+        graph.add_edge("collect_articles", "extract_knowledge")
+        graph.add_edge(["research_tools", "extract_knowledge"], "compare_and_recommend")
         graph.add_edge("compare_and_recommend", "generate_analysis")
         graph.set_finish_point("generate_analysis")
 
@@ -140,7 +214,7 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
     # ------------------------------------------------------------------ #
     # Step 3: extract_tools – use LLM to extract candidate tool names
     # ------------------------------------------------------------------ #
-    def _extract_tools_step(self, state: StateT) -> StateT:
+    def _extract_tools_step(self, state: StateT) -> Dict[str, Any]:
         content = state.aggregated_markdown or ""
 
         # If for some reason aggregated_markdown is empty, do a quick direct search.
@@ -153,7 +227,7 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
 
         if not content.strip():
             self._log("Still no content found to extract tool names from.")
-            return state.model_copy(update={"extracted_tools": []})
+            return {"extracted_tools": []}
 
         messages = [
             SystemMessage(content=self.prompts.TOOL_EXTRACTION_SYSTEM),
@@ -174,10 +248,68 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             else:
                 self._log("No tool names extracted from content.")
 
-            return state.model_copy(update={"extracted_tools": tool_names})
+            return {"extracted_tools": tool_names}
         except Exception as e:
             self._log(f"Extraction error: {e}")
-            return state.model_copy(update={"extracted_tools": []})
+            return {"extracted_tools": []}
+
+    # ------------------------------------------------------------------ #
+    # Helper: triage candidates from article snippets (phase 1 of research)
+    # ------------------------------------------------------------------ #
+    @staticmethod
+    def _candidate_snippet(name: str, corpus: str, max_chars: int = 300) -> str:
+        """
+        Text around the first couple of mentions of `name` in the article corpus.
+        """
+        if not name or not corpus:
+            return ""
+        pieces: List[str] = []
+        for match in re.finditer(re.escape(name), corpus, flags=re.IGNORECASE):
+            start = max(0, match.start() - 80)
+            end = min(len(corpus), match.end() + 160)
+            pieces.append(" ".join(corpus[start:end].split()))
+            if len(pieces) >= 2:
+                break
+        return " … ".join(pieces)[:max_chars]
+
+    def _triage_tools(self, query: str, candidates: List[str], corpus: str) -> List[str]:
+        """
+        Rank candidates by small-model relevance score. Ties (and unscored names)
+        keep extraction order; on any error the extraction order is returned.
+        """
+        pairs = [(name, self._candidate_snippet(name, corpus)) for name in candidates]
+        messages = [
+            SystemMessage(content=self.prompts.TOOL_TRIAGE_SYSTEM),
+            HumanMessage(content=self.prompts.tool_triage_user(query, pairs)),
+        ]
+        try:
+            result: ToolTriageResult = self.triage_llm.with_structured_output(
+                ToolTriageResult
+            ).invoke(messages)
+        except Exception as e:
+            self._log(f"Triage failed ({e}); keeping extraction order.")
+            return candidates
+
+        scores = {s.name.strip().lower(): s.relevance for s in result.scores}
+        ranked = sorted(candidates, key=lambda n: -scores.get(n.strip().lower(), -1))
+        relevant = [n for n in ranked if scores.get(n.strip().lower(), -1) != 0]
+
+        self._log(
+            "Triage scores: "
+            + ", ".join(f"{n} {scores.get(n.strip().lower(), '?')}" for n in ranked)
+        )
+        return relevant or ranked
+
+    def _select_tools_for_deep_research(
+        self,
+        query: str,
+        extracted: List[str],
+        corpus: str,
+    ) -> List[str]:
+        candidates = self._resolve_tool_entities(extracted)[: self.triage_candidates]
+        if len(candidates) <= self.deep_research_top_k:
+            return candidates
+        return self._triage_tools(query, candidates, corpus)[: self.deep_research_top_k]
 
     # ------------------------------------------------------------------ #
     # Helper: analyze one company's content into structured fields
@@ -231,32 +363,93 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
         return company
 
     # ------------------------------------------------------------------ #
-    # Helper: research a single tool
+    # Helper: analyze several companies in ONE structured LLM call
     # ------------------------------------------------------------------ #
-    def _research_single_tool(self, tool_name: str) -> Optional[CompanyT]:
-        self._log(f"🔬 Researching: {tool_name}")
-        tool_query = f"{tool_name} (computer software/platform/service/product) official site"
+    def _batch_analysis_model(self) -> Type[BaseModel]:
+        """
+        `{analyses: [<analysis_model> + company_name, ...]}`, built once per analysis model.
+        """
+        cached = _BATCH_ANALYSIS_MODELS.get(self.analysis_model)
+        if cached is None:
+            named = create_model(
+                f"Named{self.analysis_model.__name__}",
+                __base__=self.analysis_model,
+                company_name=(str, ...),
+            )
+            cached = create_model(
+                f"{self.analysis_model.__name__}Batch",
+                analyses=(List[named], ...),
+            )
+            _BATCH_ANALYSIS_MODELS[self.analysis_model] = cached
+        return cached
 
-        tool_search_results = self.firecrawl.search_companies(tool_query, num_results=1)
-        web_results = self._get_web_results(tool_search_results)
-        if not web_results:
-            self._log(f"No web results for {tool_name}")
-            return None
+    def _analyze_companies_batch(self, items: List[Tuple[str, str]]) -> Dict[str, AnalysisT]:
+        """
+        Analyze (company_name, content) pairs with a single prompt so the shared
+        instructions are paid for once. Any company the model drops (or a failed
+        call) falls back to the per-company prompt.
+        """
+        if len(items) == 1:
+            name, content = items[0]
+            return {name: self._analyze_company_content(name, content)}
+
+        results: Dict[str, AnalysisT] = {}
+        structured_llm = self.llm.with_structured_output(self._batch_analysis_model())
+        messages = [
+            SystemMessage(content=self.prompts.TOOL_ANALYSIS_SYSTEM),
+            HumanMessage(content=self.prompts.tool_analysis_batch_user(items)),
+        ]
+
+        try:
+            batch = structured_llm.invoke(messages)
+            by_name = {
+                (entry.company_name or "").strip().lower(): entry
+                for entry in getattr(batch, "analyses", None) or []
+            }
+            for name, _ in items:
+                entry = by_name.get(name.strip().lower())
+                if entry is not None:
+                    results[name] = entry
+        except Exception as e:
+            print(f"{self.topic_label} Error in batched company analysis:", e)
+
+        missing = [(name, content) for name, content in items if name not in results]
+        if missing:
+            self._log(
+                f"Batched analysis missed {len(missing)}/{len(items)} tools; "
+                "analyzing them one by one."
+            )
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    name: executor.submit(self._analyze_company_content, name, content)
+                    for name, content in missing
+                }
+                for name, fut in futures.items():
+                    results[name] = fut.result()
 
-        doc = web_results[0]
+        return results
 
-        # Basic info from search result
-        url = getattr(doc, "url", "") or ""
-        desc = ""
-        meta = getattr(doc, "metadata", None)
-        if meta:
-            desc = getattr(meta, "description", "") or desc
-            if not url:
-                url = getattr(meta, "url", "") or url
+    # ------------------------------------------------------------------ #
+    # Helper: gather search/scrape/branding material for a single tool
+    # ------------------------------------------------------------------ #
+    def _collect_tool_material(
+        self,
+        tool_name: str,
+        max_subpages: Optional[int] = None,
+    ) -> Optional[Tuple[CompanyT, Optional[str]]]:
+        """
+        Returns the company (with website + branding filled in) and the best
+        markdown to analyze (landing page plus pricing/features/docs sections,
+        up to `max_subpages` extra pages), or None if the tool could not be found.
+        """
+        self._check_cancelled()
+        self._log(f"🔬 Researching: {tool_name}")
+        tool_query = f"{tool_name} (computer software/platform/service/product) official site"
 
-        if not url:
-            self._log(f"No URL for {tool_name}, skipping.")
+        resolved = self._resolve_and_scrape(tool_name, tool_query)
+        if resolved is None:
             return None
+        url, desc, content, scraped = resolved
 
         company: CompanyT = self.company_model(
             name=tool_name,
@@ -266,14 +459,11 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             competitors=[],
         )
 
-        content = getattr(doc, "markdown", None)
-
         primary_color = None
         brand_colors = None
         logo_url = None
 
-        # Always scrape the official site for richer data + branding
-        scraped = self.firecrawl.scrape_company_pages(url)
+        # Scrape result of the official site: richer data + branding
         if scraped:
             if isinstance(scraped, dict):
                 data = scraped.get("data", scraped)
@@ -313,15 +503,6 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
                         or logo_url
                     )
 
-        # Run LLM analysis if we have content
-        if content:
-            analysis = self._analyze_company_content(company.name, content)
-            if getattr(analysis, "description", None):
-                company.description = analysis.description
-            company = self._apply_analysis_to_company(company, analysis)
-        else:
-            self._log(f"No content (markdown/scrape) for {tool_name}, skipping analysis.")
-
         if primary_color:
             company.primary_color = primary_color
         if brand_colors:
@@ -329,12 +510,43 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
         if logo_url:
             company.logo_url = logo_url
 
-        return company
+        if max_subpages is None:
+            max_subpages = self.subpage_pages_deep
+        content = self._augment_with_subpages(tool_name, url, content, max_subpages)
+
+        return company, content
+
+    def _finish_company(self, company: CompanyT, analysis: Optional[AnalysisT]) -> CompanyT:
+        if analysis is None:
+            self._log(f"No content (markdown/scrape) for {company.name}, skipping analysis.")
+            return company
+        if getattr(analysis, "description", None):
+            company.description = analysis.description
+        return self._apply_analysis_to_company(company, analysis)
+
+    # ------------------------------------------------------------------ #
+    # Helper: research a single tool (material + its own analysis call)
+    # ------------------------------------------------------------------ #
+    def _research_single_tool(self, tool_name: str) -> Optional[CompanyT]:
+        material = self._collect_tool_material(tool_name)
+        if material is None:
+            return None
+        company, content = material
+        analysis = self._analyze_company_content(company.name, content) if content else None
+        return self._finish_company(company, analysis)
 
     # ------------------------------------------------------------------ #
-    # Step 4: research_tools – run per-tool research in parallel
+    # Steps 3 + 4 as one node, so the knowledge branch overlaps both
+    # ------------------------------------------------------------------ #
+    def _extract_and_research_tools_step(self, state: StateT) -> Dict[str, Any]:
+        update = self._extract_tools_step(state)
+        research = self._research_tools_step(state.model_copy(update=update))
+        return {**update, **research}
+
     # ------------------------------------------------------------------ #
-    def _research_tools_step(self, state: StateT) -> StateT:
+    # Step 4: research_tools – triage, parallel scraping, batched analysis
+    # ------------------------------------------------------------------ #
+    def _research_tools_step(self, state: StateT) -> Dict[str, Any]:
         extracted_tools = getattr(state, "extracted_tools", [])
 
         if not extracted_tools:
@@ -350,55 +562,102 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             if not tool_names:
                 tool_names = ["Unknown"]
         else:
-            tool_names = extracted_tools[:4]
+            tool_names = self._select_tools_for_deep_research(
+                state.query, extracted_tools, state.aggregated_markdown or ""
+            )
 
         self._log(
             f"{self.topic_label} 🔬 Researching specific tools/products: {', '.join(tool_names)}"
         )
 
-        companies: List[CompanyT] = []
+        # 0) known tools with a fresh stored profile skip Firecrawl and the LLM
+        resolved: Dict[str, CompanyT] = {}
+        for name in tool_names:
+            stored = self._stored_profile(name, self.company_model)
+            if stored is not None:
+                resolved[name] = stored
+        pending = [name for name in tool_names if name not in resolved]
+
+        # 1) search + scrape every remaining tool (and its pricing/docs pages) in parallel
+        max_subpages = self._subpage_budget(state)
+        materials: Dict[str, Tuple[CompanyT, Optional[str]]] = {}
+        if pending:
+            max_workers = min(4, len(pending))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_name = {
+                    executor.submit(self._collect_tool_material, name, max_subpages): name
+                    for name in pending
+                }
+
+                for fut in as_completed(future_to_name):
+                    tool_name = future_to_name[fut]
+                    try:
+                        material = fut.result()
+                        if material is not None:
+                            materials[tool_name] = material
+                    except RunCancelled:
+                        pass
+                    except Exception as e:
+                        self._log(f"Error while researching {tool_name}: {e}")
+            self._check_cancelled()
+
+        # 2) stale profiles whose scraped source did not change are reused as-is
+        to_analyze: List[Tuple[str, str]] = []
+        for name in pending:
+            if name not in materials:
+                continue
+            company, content = materials[name]
+            if not content:
+                resolved[name] = self._finish_company(company, None)
+                continue
+            stored = self._stored_profile(name, self.company_model, content=content)
+            if stored is not None:
+                stored.website = company.website or stored.website
+                self._store_profile(stored, content)
+                resolved[name] = stored
+            else:
+                to_analyze.append((company.name, content))
+
+        # 3) analyze: chunks of `analysis_batch_size` tools per LLM call, chunks in parallel
+        batch_size = self.analysis_batch_size if self.batch_analysis else 1
+        batch_size = max(1, batch_size)
+        chunks = [to_analyze[i:i + batch_size] for i in range(0, len(to_analyze), batch_size)]
+
+        analyses: Dict[str, AnalysisT] = {}
+        if chunks:
+            if len(chunks) < len(to_analyze):
+                self._log(
+                    f"Analyzing {len(to_analyze)} tools in {len(chunks)} batched LLM call(s)."
+                )
+            self._check_cancelled()
+            with ThreadPoolExecutor(max_workers=len(chunks)) as executor:
+                for chunk_result in executor.map(self._analyze_companies_batch, chunks):
+                    analyses.update(chunk_result)
 
-        max_workers = min(4, len(tool_names))
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_name = {
-                executor.submit(self._research_single_tool, name): name
-                for name in tool_names
-            }
+        for name, content in to_analyze:
+            analysis = analyses.get(name)
+            company = self._finish_company(materials[name][0], analysis)
+            if analysis is not None and analysis.description != "Analysis failed":
+                self._store_profile(company, content)
+            resolved[name] = company
 
-            for fut in as_completed(future_to_name):
-                tool_name = future_to_name[fut]
-                try:
-                    comp = fut.result()
-                    if comp is not None:
-                        companies.append(comp)
-                except Exception as e:
-                    self._log(f"Error while researching {tool_name}: {e}")
+        companies: List[CompanyT] = [resolved[name] for name in tool_names if name in resolved]
 
-        return state.model_copy(update={"companies": companies})
+        return {"companies": companies}
 
     # ------------------------------------------------------------------ #
     # Step 5: extract_knowledge – global entities/pros/cons/risks/timeline
     # ------------------------------------------------------------------ #
-    def _extract_knowledge_step(self, state: StateT) -> StateT:
-        # Prefer aggregated_markdown from articles; extend with company info where helpful.
+    def _extract_knowledge_step(self, state: StateT) -> Dict[str, Any]:
+        # Runs in parallel with extract_tools + research_tools, so it only sees the
+        # article corpus; per-tool strengths/limitations reach compare_and_recommend
+        # directly through state.companies.
         aggregated = (state.aggregated_markdown or "").strip()
         fast = self._is_fast(state)
 
-        if state.companies:
-            parts: List[str] = []
-            for c in state.companies:
-                parts.append(f"# {c.name}\n{c.description}\n")
-                if c.strengths:
-                    parts.append("## Strengths\n" + "\n".join(f"- {s}" for s in c.strengths))
-                if c.limitations:
-                    parts.append("## Limitations\n" + "\n".join(f"- {l}" for l in c.limitations))
-            company_block = "\n\n".join(parts).strip()
-            if company_block:
-                aggregated = (aggregated + "\n\n---\n\n" + company_block) if aggregated else company_block
-
         if not aggregated:
             self._log("No aggregated content available; skipping knowledge extraction.")
-            return state
+            return {}
 
         result = self._extract_knowledge_from_markdown(
             aggregated_markdown=aggregated,
@@ -406,9 +665,9 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             fast=fast,
         )
         if result is None:
-            return state
+            return {}
 
-        return state.model_copy(update={"knowledge": result})
+        return {"knowledge": result}
 
     # ------------------------------------------------------------------ #
     # Step 6: compare_and_recommend – structured ToolComparisonRecommendation
@@ -418,12 +677,7 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
             self._log("No companies found; skipping structured recommendation.")
             return state.model_copy(update={"recommendation": None})
 
-        payload = {
-            "query": state.query,
-            "companies": [c.model_dump() for c in state.companies],
-            "knowledge": state.knowledge.model_dump() if state.knowledge else None,
-        }
-        serialized = json.dumps(payload, ensure_ascii=False)
+        serialized = encode_research_payload(state.companies, state.knowledge)
 
         structured_llm = self.llm.with_structured_output(ToolComparisonRecommendation)
 
@@ -669,7 +923,7 @@ class BaseCSWorkflow(RootWorkflow, Generic[StateT, CompanyT, AnalysisT]):
         Returns a StateT (BaseResearchState subclass) – same as before.
         """
         initial_state = self.state_model(query=query, fast_mode=fast_mode)
-        final_state = self.workflow.invoke(initial_state)
+        final_state = self._invoke_graph(initial_state)
 
         # Handle both dict and model returns safely
         if isinstance(final_state, self.state_model):
@@ -1,11 +1,13 @@
 # src/api/app.py
 import sys
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
-from src.advanced_agent.api.routes import downloads, suggestions, topics, chat, history
+from src.advanced_agent.api.routes import downloads, suggestions, topics, chat, history, cache, metrics, research
+from src.advanced_agent.api.deps import prewarm
 from src.weather.api.routes.weather import router as weather_router
 from src.news_app.api.routes.news import router as news_router
 
@@ -22,8 +24,15 @@ STATIC_DIR = BASE_DIR / "static"
 STATIC_BUILD_DIR = BASE_DIR / "static_build"
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background thread; startup does not wait for it.
+    prewarm()
+    yield
+
+
 def create_app() -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
 
     app.add_middleware(
         CORSMiddleware,
@@ -46,6 +55,9 @@ def create_app() -> FastAPI:
     app.include_router(chat.router, prefix="")
     app.include_router(downloads.router, prefix="")
     app.include_router(history.router, prefix="")
+    app.include_router(cache.router, prefix="")
+    app.include_router(metrics.router, prefix="")
+    app.include_router(research.router, prefix="")
     app.include_router(weather_router, prefix="")
     app.include_router(news_router, prefix="")
 
@@ -13,3 +13,20 @@ def fake_env_keys(monkeypatch):
     # This ensures they stay set even if some test mutates them
     monkeypatch.setenv("OPENAI_API_KEY", "test-key")
     monkeypatch.setenv("FIRECRAWL_API_KEY", "test-key")
+
+
+@pytest.fixture(autouse=True)
+def isolated_translation_memory(monkeypatch, tmp_path):
+    # Remembered translations must not leak between tests (or into saved_docs/).
+    from src.advanced_agent.api import translate
+    from src.advanced_agent.api.translation_memory import TranslationMemory
+
+    monkeypatch.setattr(translate, "TRANSLATION_MEMORY", TranslationMemory(tmp_path / "translation_memory.json"))
+
+
+@pytest.fixture(autouse=True)
+def isolated_history(monkeypatch, tmp_path):
+    # Runs recorded by chat tests must not land in saved_docs/history.json.
+    from src.advanced_agent.history import store
+
+    monkeypatch.setattr(store, "HISTORY_DB_PATH", tmp_path / "history.json")
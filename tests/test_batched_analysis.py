@@ -0,0 +1,52 @@
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+
+def _tokens(text):
+    # rough chars/4 estimate, good enough to compare prompt shapes
+    return len(text) // 4
+
+
+def test_batched_prompt_is_cheaper_than_per_tool_prompts():
+    wf = DeveloperToolsWorkflow()
+    items = [(f"Tool{i}", f"Tool{i} is a code editor. " * 40) for i in range(4)]
+
+    system = wf.prompts.TOOL_ANALYSIS_SYSTEM
+    single = sum(
+        _tokens(system) + _tokens(wf.prompts.tool_analysis_user(name, content))
+        for name, content in items
+    )
+    batched = _tokens(system) + _tokens(wf.prompts.tool_analysis_batch_user(items))
+
+    assert batched < single
+    prompt = wf.prompts.tool_analysis_batch_user(items)
+    for idx, (name, _) in enumerate(items, start=1):
+        assert f"=== Tool {idx}: {name} ===" in prompt
+
+
+class _PartialBatchLLM:
+    """Structured LLM that only returns the first company of a batch."""
+
+    def __init__(self, schema):
+        self.schema = schema
+
+    def invoke(self, messages):
+        fields = self.schema.model_fields
+        if "analyses" in fields:
+            named = fields["analyses"].annotation.__args__[0]
+            return self.schema(analyses=[named(company_name="alpha", description="from batch")])
+        return self.schema(description="from single")
+
+
+class _FakeLLM:
+    def with_structured_output(self, schema):
+        return _PartialBatchLLM(schema)
+
+
+def test_batch_falls_back_per_company_for_missing_entries():
+    wf = DeveloperToolsWorkflow()
+    wf.llm = _FakeLLM()
+
+    results = wf._analyze_companies_batch([("Alpha", "a"), ("Beta", "b")])
+
+    assert results["Alpha"].description == "from batch"
+    assert results["Beta"].description == "from single"
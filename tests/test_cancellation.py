@@ -0,0 +1,99 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from src.advanced_agent.api.sse import SSEChannel
+from src.advanced_agent.cancellation import CancelToken, RunCancelled
+from tests.test_chat import make_test_app
+from tests.test_workflow_graph import TimedToolsWorkflow
+
+
+class CancellingToolsWorkflow(TimedToolsWorkflow):
+    """The client leaves while tools are being extracted."""
+
+    def _extract_tools_step(self, state):
+        self._cancel_token.cancel("client disconnected")
+        return super()._extract_tools_step(state)
+
+    def _compare_and_recommend_step(self, state):
+        raise AssertionError("graph kept running after cancellation")
+
+
+def test_workflow_stops_between_graph_steps():
+    wf = CancellingToolsWorkflow()
+    wf.set_cancel_token(CancelToken())
+    with pytest.raises(RunCancelled, match="client disconnected"):
+        wf.run("python ide", fast_mode=False)
+
+
+def test_workflow_without_token_runs_normally():
+    result = TimedToolsWorkflow().run("python ide", fast_mode=False)
+    assert [c.name for c in result.companies] == ["VS Code"]
+
+
+def test_channel_reports_early_disconnect_only():
+    async def main():
+        calls = []
+
+        finished = SSEChannel(asyncio.get_running_loop())
+        finished.on_disconnect = lambda: calls.append("finished")
+        finished.put_nowait({"type": "final"})
+        threading.Timer(0.05, finished.close).start()
+        assert len([e async for e in finished.events()]) == 1
+
+        abandoned = SSEChannel(asyncio.get_running_loop())
+        abandoned.on_disconnect = lambda: calls.append("abandoned")
+        abandoned.put_nowait({"type": "topic"})
+        stream = abandoned.events()
+        await stream.__anext__()
+        await stream.aclose()
+
+        assert calls == ["abandoned"]
+
+    asyncio.run(main())
+
+
+def test_cancelled_run_skips_files_and_history(monkeypatch):
+    import src.advanced_agent.api.routes.chat as chat
+    from src.advanced_agent.api.research_jobs import ResearchJobRun
+    from src.advanced_agent.api.scheduler import RESEARCH_SCHEDULER
+
+    make_test_app(monkeypatch)
+    token = CancelToken()
+    written = []
+    monkeypatch.setattr(chat, "add_history_entry", written.append, raising=True)
+    monkeypatch.setattr(
+        chat, "generate_document_and_slides", lambda **kwargs: written.append("layout"), raising=True
+    )
+
+    workflow = chat.TOPIC_WORKFLOWS["fake_topic"]
+    original_run = workflow.run
+
+    def run_then_disconnect(query):
+        result = original_run(query)
+        token.cancel("client disconnected")
+        return result
+
+    workflow.run = run_then_disconnect
+
+    cancelled_before = RESEARCH_SCHEDULER.metrics()["cancelled"]
+    job = ResearchJobRun()
+    chat.start_chat_run(
+        job,
+        user_query="cancel me",
+        selected_model="gpt-4.1-mini",
+        selected_temperature=0.1,
+        speed_mode="fast",
+        bypass_cache=True,
+        cancel_token=token,
+    )
+
+    deadline = time.monotonic() + 5
+    while RESEARCH_SCHEDULER.metrics()["cancelled"] == cancelled_before:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+    assert job.done and job.final is None
+    assert written == []
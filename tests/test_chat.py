@@ -42,7 +42,7 @@ def make_test_app(monkeypatch) -> FastAPI:
     # Always classify into our dummy topic
     monkeypatch.setattr(
         chat,
-        "classify_topic_with_llm",
+        "classify_topic",
         lambda q: ("fake_topic", "Fake Topic", "fake_domain"),
         raising=True,
     )
@@ -80,7 +80,7 @@ def make_test_app(monkeypatch) -> FastAPI:
 
     # This replaces generate_all_files_for_layout(layout, base_folder, base_filename)
     # IMPORTANT: keys must match chat.py expectations: "pdf", "docx", "txt", "pptx"
-    def fake_generate_all_files_for_layout(layout, base_folder: str, base_filename: str):
+    def fake_generate_all_files_for_layout(layout, base_folder: str, base_filename: str, cancel_token=None):
         base = f"{base_folder}/{base_filename}"
         return {
             "pdf": f"{base}.pdf",
@@ -179,6 +179,52 @@ def test_chat_stream_sends_topic_log_and_final(monkeypatch):
     assert final_event["topic_used"] == "Fake Topic"
 
 
+def test_chat_stream_replays_cached_run(monkeypatch, tmp_path):
+    import src.advanced_agent.api.routes.chat as chat
+    from src.advanced_agent.api.result_cache import RUN_CACHE
+
+    app = make_test_app(monkeypatch)
+    RUN_CACHE.invalidate()
+
+    runs = {"count": 0}
+    workflow = chat.TOPIC_WORKFLOWS["fake_topic"]
+    original_run = workflow.run
+
+    def counting_run(query, **kwargs):
+        runs["count"] += 1
+        return original_run(query)
+
+    workflow.run = counting_run
+
+    # Cached entries are only replayed while their files still exist.
+    def fake_generate_all_files_for_layout(layout, base_folder: str, base_filename: str, cancel_token=None):
+        paths = {}
+        for ext in ("pdf", "docx", "txt", "pptx"):
+            path = tmp_path / f"{base_filename}.{ext}"
+            path.write_text("x")
+            paths[ext] = str(path)
+        return paths
+
+    monkeypatch.setattr(
+        chat, "generate_all_files_for_layout", fake_generate_all_files_for_layout
+    )
+    client = TestClient(app)
+
+    def ask(url):
+        with client.stream("GET", url) as response:
+            return _collect_sse_events(response)
+
+    first = ask("/chat_stream?message=Best+Python+IDEs")
+    second = ask("/chat_stream?message=best+python+ides%3F")
+    assert runs["count"] == 1
+    assert second[0]["type"] == "topic"
+    assert second[-1] == first[-1]
+
+    ask("/chat_stream?message=Best+Python+IDEs&fresh=1")
+    assert runs["count"] == 2
+    RUN_CACHE.invalidate()
+
+
 # ---- Integration-style test with the real app factory ----
 
 from src.api.app import create_app
@@ -210,6 +256,11 @@ def test_chat_stream_handles_chinese_branch(monkeypatch):
         fake_translate,
         raising=True,
     )
+    monkeypatch.setattr(
+        "src.advanced_agent.api.routes.chat.translate_batch",
+        lambda texts, target_lang: [fake_translate(t, target_lang) for t in texts],
+        raising=True,
+    )
 
     # 3) Avoid real workflows / LLMs in this test
     class DummyResult:
@@ -240,7 +291,7 @@ def test_chat_stream_handles_chinese_branch(monkeypatch):
         return "developer_tools", "Developer Tools", "tools"
 
     monkeypatch.setattr(
-        "src.advanced_agent.api.routes.chat.classify_topic_with_llm",
+        "src.advanced_agent.api.routes.chat.classify_topic",
         fake_classify,
         raising=True,
     )
@@ -266,7 +317,7 @@ def test_chat_stream_handles_chinese_branch(monkeypatch):
             slides = []
 
         return DummyLayout()
-    def fake_generate_all_files_for_layout(layout, base_folder: str, base_filename: str):
+    def fake_generate_all_files_for_layout(layout, base_folder: str, base_filename: str, cancel_token=None):
         base = f"{base_folder}/{base_filename}"
         return {
             "pdf": f"{base}.pdf",
@@ -306,3 +357,56 @@ def test_chat_stream_handles_chinese_branch(monkeypatch):
     assert '"type": "topic"' in body
     assert '"type": "log"' in body
     assert '"type": "final"' in body
+    # Log lines are translated, and still arrive before the final answer.
+    assert body.index("[Chinese] dummy log") < body.index('"type": "final"')
+
+
+def test_chat_stream_admission_does_not_wait_for_classification(monkeypatch):
+    import asyncio
+    import time
+
+    import src.advanced_agent.api.routes.chat as chat
+
+    make_test_app(monkeypatch)
+
+    def slow_classify(query: str):
+        time.sleep(0.5)
+        return "fake_topic", "Fake Topic", "fake_domain"
+
+    monkeypatch.setattr(chat, "classify_topic", slow_classify, raising=True)
+
+    async def main():
+        start = time.perf_counter()
+        responses = await asyncio.gather(
+            *(chat.chat_stream(message=f"q{i}", model=None, temperature=None, mode="fast", fresh="1")
+              for i in range(3))
+        )
+        admitted = time.perf_counter() - start
+
+        first_events = [await r.body_iterator.__anext__() for r in responses]
+        for r in responses:
+            async for _ in r.body_iterator:
+                pass
+        return admitted, first_events
+
+    admitted, first_events = asyncio.run(main())
+
+    # All three streams are open before any classification finished.
+    assert admitted < 0.2
+    assert all('"type": "topic"' in e for e in first_events)
+
+
+def test_chat_stream_returns_429_when_research_queue_is_full(monkeypatch):
+    import src.advanced_agent.api.routes.chat as chat
+
+    app = make_test_app(monkeypatch)
+
+    class FullScheduler:
+        def is_full(self):
+            return True
+
+    monkeypatch.setattr(chat, "RESEARCH_SCHEDULER", FullScheduler(), raising=True)
+
+    response = TestClient(app).get("/chat_stream?message=Hello")
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "30"
@@ -0,0 +1,76 @@
+import json
+import re
+
+from src.advanced_agent.topics.compact_encoding import encode_records, encode_research_payload
+from src.advanced_agent.topics.knowledge_extraction import (
+    Entity,
+    KnowledgeExtractionResult,
+    ProConItem,
+)
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+
+def count_tokens(text):
+    try:
+        import tiktoken
+
+        return len(tiktoken.get_encoding("o200k_base").encode(text))
+    except Exception:
+        # Offline: word/punctuation split tracks BPE counts closely for JSON-ish text.
+        return len(re.findall(r"\w+|[^\w\s]", text))
+
+
+def _companies():
+    model = DeveloperToolsWorkflow.company_model
+    return [
+        model(
+            name=name,
+            description=f"{name} is a code editor with debugging and extensions.",
+            website=f"https://www.{name.lower()}.dev/",
+            pricing_model=pricing,
+            is_open_source=pricing == "Free",
+            api_available=True,
+            language_support=["Python", "JavaScript"],
+            strengths=["Fast startup", "Large extension ecosystem"],
+            limitations=["Heavy on memory"],
+            logo_url=f"https://www.{name.lower()}.dev/favicon.ico",
+            primary_color="#123456",
+            brand_colors={"primary": "#123456", "accent": "#abcdef"},
+        )
+        for name, pricing in [("Zed", "Free"), ("PyCharm", "Freemium"), ("Cursor", "Paid")]
+    ]
+
+
+def _knowledge():
+    return KnowledgeExtractionResult(
+        entities=[Entity(name="Zed", type="product")],
+        pros=[ProConItem(entity="Cursor", aspect="AI", text="Strong AI pair programming")],
+    )
+
+
+def test_encoding_drops_visual_and_empty_fields():
+    text = encode_records(_companies())
+
+    header = text.splitlines()[0].split("|")
+    assert header[:2] == ["name", "description"]
+    assert "pricing_model" in header
+    assert "Zed|" in text and "zed.dev" in text and "https://" not in text
+    assert "favicon" not in text and "#123456" not in text
+    assert "pricing_details" not in text and "competitors" not in text
+    assert "strengths: Fast startup; Large extension ecosystem" in text
+
+
+def test_compact_payload_uses_fewer_tokens_than_json():
+    companies, knowledge = _companies(), _knowledge()
+    old = json.dumps(
+        {
+            "companies": [c.model_dump() for c in companies],
+            "knowledge": knowledge.model_dump(),
+        },
+        ensure_ascii=False,
+    )
+    new = encode_research_payload(companies, knowledge)
+
+    old_tokens, new_tokens = count_tokens(old), count_tokens(new)
+    assert new_tokens < old_tokens * 0.5
+    assert "Strong AI pair programming" in new
@@ -0,0 +1,36 @@
+from src.advanced_agent.profiles.entities import resolve_entities, same_entity
+from src.advanced_agent.profiles.websites import WebsiteIndex
+
+
+def test_aliases_merge_into_first_spelling():
+    result = resolve_entities(
+        ["VS Code", "PyCharm", "Visual Studio Code", "VSCode", "Microsoft VS Code", "pycharm"]
+    )
+
+    assert result.names == ["VS Code", "PyCharm"]
+    assert result.merged["VS Code"] == ["Visual Studio Code", "VSCode", "Microsoft VS Code"]
+    assert result.avoided == 4
+
+
+def test_distinct_products_stay_separate():
+    assert not same_entity("AWS", "AWS Lambda")
+    assert not same_entity("Notion", "Motion")
+    assert not same_entity("Postman", "Postmark")
+    assert same_entity("GitHub Actions", "Github Action")
+
+
+def test_versions_and_generic_names_stay_separate():
+    assert not same_entity("PostgreSQL 15", "PostgreSQL 16")
+    assert not same_entity("Claude 3.5 Sonnet", "Claude 3.7 Sonnet")
+    assert not same_entity("Elasticsearch", "Elasticsearch 8")
+    assert not same_entity("Go", "Google Go")
+    assert not same_entity("Copilot", "GitHub Copilot")
+    assert same_entity("PostgreSQL 16", "Postgresql 16")
+
+
+def test_same_known_site_merges(tmp_path):
+    websites = WebsiteIndex(path=tmp_path / "sites.json")
+    websites.remember("Firebase", "https://firebase.google.com/")
+    websites.remember("Google Firebase Platform", "https://www.firebase.google.com")
+
+    assert resolve_entities(["Firebase", "Google Firebase Platform"], websites).names == ["Firebase"]
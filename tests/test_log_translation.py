@@ -0,0 +1,122 @@
+import threading
+import time
+
+from src.advanced_agent.api.log_translation import TranslatedLogChannel
+
+
+class RecordingChannel:
+    def __init__(self):
+        self.events = []
+        self.closed = False
+        self.disconnected = False
+
+    def put(self, payload, timeout=None):
+        self.events.append(payload)
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+def test_logs_are_batched_and_order_is_kept():
+    calls = []
+
+    def translate(texts, target_lang):
+        calls.append(list(texts))
+        return [f"zh:{t}" for t in texts]
+
+    inner = RecordingChannel()
+    out = TranslatedLogChannel(inner, "Chinese", translate=translate, interval_s=0.05)
+    out.put({"type": "topic"})
+    for i in range(3):
+        out.put_log(f"log {i}")
+    out.put({"type": "queue", "position": 1})
+    out.put_log("log 3")
+    out.put({"type": "final"})
+    out.close()
+
+    assert calls == [["log 0", "log 1", "log 2"], ["log 3"]]
+    assert inner.events == [
+        {"type": "topic"},
+        {"type": "log", "message": "zh:log 0"},
+        {"type": "log", "message": "zh:log 1"},
+        {"type": "log", "message": "zh:log 2"},
+        {"type": "queue", "position": 1},
+        {"type": "log", "message": "zh:log 3"},
+        {"type": "final"},
+    ]
+    assert inner.closed
+
+
+def test_put_log_does_not_wait_for_translation():
+    release = threading.Event()
+
+    def slow_translate(texts, target_lang):
+        release.wait(5)
+        return texts
+
+    inner = RecordingChannel()
+    out = TranslatedLogChannel(inner, "Chinese", translate=slow_translate, interval_s=0)
+
+    start = time.perf_counter()
+    for i in range(50):
+        out.put_log(f"log {i}")
+    assert time.perf_counter() - start < 0.1
+
+    release.set()
+    out.close()
+    assert [e["message"] for e in inner.events] == [f"log {i}" for i in range(50)]
+
+
+def test_failed_translation_sends_originals():
+    def broken(texts, target_lang):
+        raise RuntimeError("translator down")
+
+    inner = RecordingChannel()
+    out = TranslatedLogChannel(inner, "Chinese", translate=broken, interval_s=0)
+    out.put_log("hello")
+    out.close()
+    assert inner.events == [{"type": "log", "message": "hello"}]
+
+
+def test_english_passes_straight_through():
+    inner = RecordingChannel()
+    out = TranslatedLogChannel(inner, None, translate=None)
+    out.put_log("hello")
+    assert inner.events == [{"type": "log", "message": "hello"}]
+    out.close()
+    assert inner.closed
+
+
+def test_close_gives_up_on_a_hung_translator():
+    release = threading.Event()
+
+    def hung_translate(texts, target_lang):
+        release.wait(5)
+        return [f"zh:{t}" for t in texts]
+
+    inner = RecordingChannel()
+    out = TranslatedLogChannel(
+        inner, "Chinese", translate=hung_translate, interval_s=0, close_timeout_s=0.1
+    )
+    out.put_log("log 0")
+    time.sleep(0.05)  # the drain thread is now inside the translator
+    out.put_log("log 1")
+    out.put({"type": "final"})
+
+    start = time.perf_counter()
+    out.close()
+    assert time.perf_counter() - start < 1
+
+    expected = [
+        {"type": "log", "message": "log 0"},
+        {"type": "log", "message": "log 1"},
+        {"type": "final"},
+    ]
+    assert inner.events == expected
+    assert inner.closed
+
+    # A translation finishing late is dropped, not sent twice.
+    release.set()
+    out._thread.join(timeout=5)
+    assert inner.events == expected
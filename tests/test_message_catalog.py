@@ -0,0 +1,55 @@
+from src.advanced_agent.api.data.messages_zh import MESSAGES_ZH
+from src.advanced_agent.api.message_catalog import (
+    MessageCatalog,
+    _placeholders,
+    build_table,
+    catalog_sources,
+)
+
+
+def test_table_covers_every_log_template_and_topic_label():
+    table, missing = build_table(MESSAGES_ZH, catalog_sources())
+    assert missing == [], "run `python -m src.advanced_agent.api.message_catalog --write`"
+    for source, target in table.items():
+        assert _placeholders(source) == _placeholders(target), source
+
+
+def test_lookup_fills_templates_and_translates_known_values():
+    catalog = MessageCatalog({"Chinese": MESSAGES_ZH})
+
+    assert catalog.lookup("🔬 Researching: Cursor", "Chinese") == "🔬 正在研究：Cursor"
+    assert catalog.lookup("Collected 12 sources for tools research.", "Chinese") == "已为工具研究收集 12 个来源。"
+    assert (
+        catalog.lookup("Developer Tools 🔬 Researching specific tools/products: VS Code, Zed", "Chinese")
+        == "开发者工具 🔬 正在研究具体工具/产品：VS Code, Zed"
+    )
+    assert (
+        catalog.lookup("♻️ Served cached result from 5 min ago (add fresh=1 to recompute). ↪ 最好的 CI 工具", "Chinese")
+        == "♻️ 已使用 5 分钟前的缓存结果（添加 fresh=1 可重新研究）。 ↪ 最好的 CI 工具"
+    )
+    assert catalog.lookup("Cloud & Infrastructure", "Chinese") == "云与基础设施"
+    assert catalog.lookup("something the agent made up", "Chinese") is None
+    assert catalog.lookup("🔬 Researching: Cursor", "French") is None
+
+
+def test_only_free_form_lines_reach_the_translator():
+    catalog = MessageCatalog({"Chinese": MESSAGES_ZH})
+    sent = []
+
+    def llm(texts, target_lang):
+        sent.append(list(texts))
+        return [f"zh:{t}" for t in texts]
+
+    lines = ["Checking: Zed", "a free-form note", "Running knowledge extraction...", "another note"]
+    assert catalog.translate_batch(lines, "Chinese", llm) == [
+        "正在检查：Zed",
+        "zh:a free-form note",
+        "正在进行知识提取...",
+        "zh:another note",
+    ]
+    assert sent == [["a free-form note", "another note"]]
+    assert catalog.translate_batch(["Done checking: Zed"], "Chinese", llm) == ["检查完成：Zed"]
+    assert len(sent) == 1
+
+    metrics = catalog.metrics()
+    assert metrics["hits"] == 3 and metrics["misses"] == 2
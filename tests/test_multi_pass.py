@@ -0,0 +1,61 @@
+from src.advanced_agent.topics.multi_pass_search import AdaptivePassController
+from src.advanced_agent.topics.root_workflow import RootWorkflow
+
+
+def _meta(*urls):
+    return [{"title": u, "url": u} for u in urls]
+
+
+def test_controller_stops_when_targets_met():
+    ctrl = AdaptivePassController(target_domains=3, target_chars=100, base_results=3)
+    assert not ctrl.satisfied()
+
+    ctrl.record("q1", _meta("https://a.com/x", "https://www.b.com/y", "https://c.com"), "x" * 150)
+
+    assert ctrl.satisfied()
+    assert ctrl.curve[0].new_domains == 3
+    assert ctrl.num_results == 3  # good yield: no widening
+
+
+def test_controller_widens_on_duplicate_heavy_pass():
+    ctrl = AdaptivePassController(target_domains=10, target_chars=10, base_results=3, max_results=5)
+    ctrl.record("q1", _meta("https://a.com/1", "https://b.com/1", "https://c.com/1"), "abc")
+    ctrl.record("q2", _meta("https://a.com/2", "https://b.com/2", "https://c.com/2"), "abc")
+
+    assert ctrl.curve[1].new_domains == 0
+    assert ctrl.num_results == 5  # widened, capped by max_results
+    assert "p2 n=3 3d/6c" in ctrl.format_curve()
+
+
+class FakeFirecrawl:
+    def __init__(self, pages_per_query):
+        self.pages_per_query = pages_per_query
+        self.calls = []
+
+    def search_companies(self, query, num_results=5):
+        self.calls.append((query, num_results))
+        return [
+            {"markdown": "m" * 2000, "title": url, "url": url}
+            for url in self.pages_per_query.get(query, [])[:num_results]
+        ]
+
+
+def test_multi_pass_articles_skips_remaining_passes(monkeypatch):
+    wf = RootWorkflow()
+    wf.firecrawl = FakeFirecrawl(
+        {
+            "p1 q": [f"https://site{i}.com" for i in range(3)],
+            "p2 q": [f"https://other{i}.com" for i in range(3)],
+            "p3 q": ["https://never.com"],
+        }
+    )
+    logs = []
+    wf.set_log_callback(logs.append)
+
+    content, meta = wf._multi_pass_articles(
+        "q", num_results=3, query_variants=["p1 {query}", "p2 {query}", "p3 {query}"]
+    )
+
+    assert [c[0] for c in wf.firecrawl.calls] == ["p1 q", "p2 q"]
+    assert len(meta) == 6
+    assert any("yield curve" in line for line in logs)
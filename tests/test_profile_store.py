@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+
+from src.advanced_agent.profiles.store import CompanyProfileStore, canonical_product_name
+from src.advanced_agent.profiles.websites import WebsiteIndex
+from src.advanced_agent.topics.tools.base_models import BaseResearchState
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+
+def test_canonical_product_name():
+    assert canonical_product_name("VS Code") == canonical_product_name("vs-code")
+    assert canonical_product_name("VS Code (Microsoft)") == "vs code"
+    assert canonical_product_name("Stripe, Inc.") == "stripe"
+
+
+def test_store_round_trip_and_ttl(tmp_path):
+    path = tmp_path / "profiles.json"
+    store = CompanyProfileStore(path=path, ttl_seconds=60)
+    store.put("tools", "Stripe", {"name": "Stripe", "pricing_model": "Paid"}, "page v1")
+
+    reloaded = CompanyProfileStore(path=path, ttl_seconds=60)
+    assert reloaded.get_fresh("tools", "stripe").data["pricing_model"] == "Paid"
+    assert reloaded.get_fresh("career", "stripe") is None
+
+    expired = CompanyProfileStore(path=path, ttl_seconds=0)
+    assert expired.get_fresh("tools", "Stripe") is None
+    assert expired.get("tools", "Stripe") is not None
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.searches = 0
+        self.scrapes = 0
+        self.branding_fetches = 0
+
+    def search_companies(self, query, num_results=5):
+        self.searches += 1
+        return [SimpleNamespace(url="https://stripe.com", markdown="payments api", metadata=None)]
+
+    def scrape_company_pages(self, url):
+        self.scrapes += 1
+        return {"markdown": "Stripe official page"}
+
+    def scrape_branding(self, url):
+        self.branding_fetches += 1
+        return {"branding": {"colors": {"primary": "#635bff"}}}
+
+
+class CountingLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def with_structured_output(self, schema):
+        llm = self
+
+        class _Structured:
+            def invoke(self, messages):
+                llm.calls += 1
+                return schema(pricing_model="Paid", description="Payments platform")
+
+        return _Structured()
+
+
+def _research(store, websites=None):
+    wf = DeveloperToolsWorkflow()
+    wf.firecrawl = FakeFirecrawl()
+    wf.llm = CountingLLM()
+    wf.profile_store = store
+    wf.website_index = websites
+    state = BaseResearchState(query="payments", extracted_tools=["Stripe"])
+    companies = wf._research_tools_step(state)["companies"]
+    return wf, companies
+
+
+def test_known_tool_is_a_lookup(tmp_path):
+    store = CompanyProfileStore(path=tmp_path / "profiles.json")
+
+    first, companies = _research(store)
+    assert first.llm.calls == 1 and first.firecrawl.searches == 1
+    assert companies[0].pricing_model == "Paid"
+
+    second, companies = _research(store)
+    assert second.llm.calls == 0
+    assert second.firecrawl.searches == 0
+    assert second.firecrawl.scrapes == 0 and second.firecrawl.branding_fetches == 0
+    assert companies[0].description == "Payments platform"
+
+
+def test_stale_profile_with_unchanged_source_skips_llm(tmp_path):
+    store = CompanyProfileStore(path=tmp_path / "profiles.json", ttl_seconds=0)
+    _research(store)
+
+    wf, companies = _research(store)
+    assert wf.firecrawl.searches == 1  # stale: re-fetched
+    assert wf.llm.calls == 0  # same source hash: no re-analysis
+    assert companies[0].pricing_model == "Paid"
+
+
+def test_known_website_skips_official_site_search(tmp_path):
+    websites = WebsiteIndex(path=tmp_path / "sites.json")
+    websites.remember("VS Code", "https://code.visualstudio.com")
+
+    assert websites.resolve("vscode") == "https://code.visualstudio.com"
+    assert websites.resolve("Visual Studio Code") == "https://code.visualstudio.com"
+    assert WebsiteIndex(path=tmp_path / "sites.json").resolve("vs-code") is not None
+
+    websites.remember("Stripe", "https://stripe.com")
+    wf, companies = _research(CompanyProfileStore(path=tmp_path / "p.json"), websites)
+    assert wf.firecrawl.searches == 0 and wf.firecrawl.scrapes == 1
+    assert companies[0].website.startswith("https://")
+
+
+def test_stored_profile_seeds_website_index(tmp_path):
+    store = CompanyProfileStore(path=tmp_path / "p.json", ttl_seconds=0)
+    store.put("tools", "Stripe", {"name": "Stripe", "website": "https://stripe.com"}, "x")
+    websites = WebsiteIndex(path=tmp_path / "sites.json")
+
+    wf, _ = _research(store, websites)
+
+    assert wf.firecrawl.searches == 0
+    assert websites.resolve("stripe") == "https://stripe.com"
+
+
+def test_website_index_only_records_matching_hosts(tmp_path):
+    websites = WebsiteIndex(path=tmp_path / "sites.json")
+
+    assert not websites.remember("Stripe", "https://www.g2.com/products/stripe/reviews")
+    assert websites.resolve("Stripe") is None
+    assert websites.remember("Amazon Web Services", "https://aws.amazon.com/")
+    assert websites.remember("Firebase", "https://firebase.google.com/")
+
+
+def test_website_index_entries_expire(tmp_path):
+    WebsiteIndex(path=tmp_path / "sites.json").remember("Stripe", "https://stripe.com")
+
+    assert WebsiteIndex(path=tmp_path / "sites.json").resolve("Stripe") == "https://stripe.com"
+    assert WebsiteIndex(path=tmp_path / "sites.json", ttl_seconds=-1).resolve("Stripe") is None
+
+
+def test_known_website_returns_stored_description(tmp_path):
+    websites = WebsiteIndex(path=tmp_path / "sites.json")
+    websites.remember("Stripe", "https://stripe.com", "Payments infrastructure for the internet")
+
+    wf = DeveloperToolsWorkflow()
+    wf.firecrawl = FakeFirecrawl()
+    wf.website_index = WebsiteIndex(path=tmp_path / "sites.json")
+    url, desc, _, _ = wf._resolve_and_scrape("Stripe", "Stripe official site")
+
+    assert wf.firecrawl.searches == 0
+    assert (url, desc) == ("https://stripe.com", "Payments infrastructure for the internet")
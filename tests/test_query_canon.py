@@ -0,0 +1,51 @@
+from src.advanced_agent.query_canon import (
+    QuerySimilarityIndex,
+    canonicalize_query,
+)
+
+
+def test_trivial_variations_share_canonical_form():
+    variants = ["best python ide", "Best Python IDEs?", "top python IDEs", "python ide"]
+    assert {canonicalize_query(v) for v in variants} == {"ide python"}
+
+
+def test_token_order_does_not_matter():
+    assert canonicalize_query("Stripe vs Braintree") == canonicalize_query("braintree or stripe")
+
+
+def test_similarity_index_threshold_and_numbers():
+    index = QuerySimilarityIndex(threshold=0.7)
+    index.add(canonicalize_query("python ide data science"), "a")
+    index.add(canonicalize_query("python 3.11 features"), "b")
+
+    matched, value, score = index.lookup(canonicalize_query("python IDEs for data science work"))
+    assert value == "a" and 0.7 <= score < 1.0
+
+    # Different version numbers never merge.
+    assert index.lookup(canonicalize_query("python 3.12 features")) is None
+
+    index.remove(canonicalize_query("python ide data science"))
+    assert index.lookup(canonicalize_query("python ide data science")) is None
+
+
+class FakeApp:
+    def __init__(self):
+        self.calls = 0
+
+    def search(self, query, limit, scrape_options=None):
+        self.calls += 1
+        return {"web": [{"url": "https://example.com", "markdown": query}]}
+
+
+def test_firecrawl_search_cache_serves_near_identical_queries():
+    from src.advanced_agent.firecrawl import FirecrawlService
+
+    service = FirecrawlService()
+    service.app = FakeApp()
+
+    first = service.search_companies("best python ide", num_results=3)
+    second = service.search_companies("Top Python IDEs?", num_results=3)
+    service.search_companies("best python ide", num_results=5)
+
+    assert second is first
+    assert service.app.calls == 2
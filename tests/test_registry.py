@@ -0,0 +1,73 @@
+import threading
+import time
+
+from src.advanced_agent.topics.registry import LazyWorkflowRegistry, build_workflows, TOPIC_CONFIGS
+
+
+class CountingFactory:
+    def __init__(self, delay: float = 0.0):
+        self.calls = 0
+        self.delay = delay
+
+    def __call__(self):
+        self.calls += 1
+        time.sleep(self.delay)
+        return object()
+
+
+def test_builds_on_first_access_only():
+    factory = CountingFactory()
+    registry = LazyWorkflowRegistry({"a": factory, "b": CountingFactory()})
+
+    assert registry.built_keys() == []
+    assert "a" in registry and len(registry) == 2
+
+    first = registry["a"]
+    assert registry.get("a") is first
+    assert factory.calls == 1
+    assert registry.built_keys() == ["a"]
+    assert registry.get("missing") is None
+
+
+def test_concurrent_first_access_builds_once():
+    factory = CountingFactory(delay=0.05)
+    registry = LazyWorkflowRegistry({"a": factory})
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(registry["a"])) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert factory.calls == 1
+    assert len({id(r) for r in results}) == 1
+
+
+def test_assignment_overrides_and_clear_builds_nothing():
+    factory = CountingFactory()
+    registry = LazyWorkflowRegistry({"a": factory})
+    replacement = object()
+
+    registry["a"] = replacement
+    assert registry["a"] is replacement
+
+    registry.clear()
+    assert len(registry) == 0
+    assert factory.calls == 0
+
+
+def test_prewarm_builds_known_keys():
+    registry = LazyWorkflowRegistry({"a": CountingFactory(), "b": CountingFactory()})
+
+    thread = registry.prewarm(["b", "unknown"])
+    thread.join()
+
+    assert registry.built_keys() == ["b"]
+
+
+def test_build_workflows_is_lazy():
+    registry = build_workflows()
+
+    assert set(registry) == set(TOPIC_CONFIGS)
+    assert registry.built_keys() == []
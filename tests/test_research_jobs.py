@@ -0,0 +1,90 @@
+import asyncio
+import json
+import threading
+
+from fastapi.testclient import TestClient
+
+from src.advanced_agent.api.research_jobs import ResearchJobRun, ResearchJobStore
+from tests.test_chat import make_test_app
+
+
+def _parse(raw_events):
+    parsed = []
+    for raw in raw_events:
+        if raw.startswith(":"):
+            continue
+        id_line, data_line = raw.strip().split("\n")
+        parsed.append((int(id_line[len("id: "):]), json.loads(data_line[len("data: "):])))
+    return parsed
+
+
+def test_job_replays_after_last_event_id_then_follows_live():
+    async def main():
+        job = ResearchJobRun()
+        for i in range(3):
+            job.put({"type": "log", "message": str(i)})
+
+        def finish():
+            job.put({"type": "final", "reply": "done"})
+            job.close()
+
+        threading.Timer(0.1, finish).start()
+        events = _parse([e async for e in job.events(last_event_id=2, heartbeat_s=1)])
+        assert events == [(3, {"type": "log", "message": "2"}), (4, {"type": "final", "reply": "done"})]
+
+        # A later reconnect with nothing missed gets nothing but still ends.
+        assert [e async for e in job.events(last_event_id=4)] == []
+        assert job.status == "completed" and job.final == {"type": "final", "reply": "done"}
+
+    asyncio.run(main())
+
+
+def test_job_buffer_is_bounded():
+    job = ResearchJobRun(buffer_max=2)
+    for i in range(5):
+        job.put({"type": "log", "message": str(i)})
+    assert [i for i, _ in job.events_after(0)] == [4, 5]
+
+
+def test_store_joins_identical_running_job():
+    store = ResearchJobStore()
+    first, created = store.get_or_create(("q", "fast", "m"))
+    again, created_again = store.get_or_create(("q", "fast", "m"))
+    assert created and not created_again and again is first
+
+    first.close()
+    third, created_third = store.get_or_create(("q", "fast", "m"))
+    assert created_third and third is not first
+    assert store.get(first.id) is first
+
+
+def test_research_job_api_resumes_stream(monkeypatch):
+    from src.advanced_agent.api.result_cache import RUN_CACHE
+    from src.advanced_agent.api.routes import research
+
+    RUN_CACHE.invalidate()
+    app = make_test_app(monkeypatch)
+    app.include_router(research.router)
+    client = TestClient(app)
+
+    created = client.post("/research", json={"message": "Hello jobs", "fresh": True}).json()
+    assert created["events_url"] == f"/research/{created['job_id']}/events"
+
+    response = client.get(created["events_url"])
+    assert response.status_code == 200
+    full = _parse(response.text.split("\n\n")[:-1])
+    types = [payload["type"] for _, payload in full]
+    assert types[0] == "topic" and types[-1] == "final"
+
+    # Reconnect from the middle: only the missed tail comes back.
+    resume_from = full[1][0]
+    response = client.get(created["events_url"], headers={"Last-Event-ID": str(resume_from)})
+    resumed = _parse(response.text.split("\n\n")[:-1])
+    assert resumed == full[2:]
+
+    result = client.get(created["result_url"]).json()
+    assert result["status"] == "completed"
+    assert result["final"]["reply"] == "formatted result text"
+    assert result["topic"]["topic_key"] == "fake_topic"
+
+    assert client.get("/research/nope").status_code == 404
@@ -0,0 +1,69 @@
+from src.advanced_agent.api.result_cache import (
+    CachedRun,
+    RunResultCache,
+    make_run_key,
+)
+
+
+def _entry(key, tmp_path, created_at=None):
+    f = tmp_path / "report.pdf"
+    f.write_text("pdf")
+    entry = CachedRun(
+        key=key,
+        state=None,
+        layout=None,
+        file_paths={"pdf": str(f)},
+        final_payload={"type": "final", "reply": "cached"},
+    )
+    if created_at is not None:
+        entry.created_at = created_at
+    return entry
+
+
+def test_run_key_uses_canonical_query():
+    assert make_run_key("developer_tools", "  Best   Python IDEs? ", "Fast", "m") == (
+        "developer_tools",
+        "ide python",
+        "fast",
+        "m",
+    )
+
+
+def test_similar_query_hits_same_topic_only(tmp_path):
+    cache = RunResultCache(similarity_threshold=0.6)
+    key = make_run_key("developer_tools", "python ide for data science", "fast", "m")
+    cache.put(_entry(key, tmp_path))
+
+    near = make_run_key("developer_tools", "python IDEs for data scientists", "fast", "m")
+    assert cache.get(near) is not None
+    assert cache.get(make_run_key("ai_ml", "python ide for data science", "fast", "m")) is None
+    assert cache.get(make_run_key("developer_tools", "rust web framework", "fast", "m")) is None
+
+
+def test_get_respects_ttl(tmp_path):
+    cache = RunResultCache(ttl_seconds=60)
+    key = make_run_key("api", "stripe vs braintree", "fast", "m")
+    cache.put(_entry(key, tmp_path, created_at=0))
+    assert cache.get(key) is None
+
+    cache.put(_entry(key, tmp_path))
+    assert cache.get(key).final_payload["reply"] == "cached"
+
+
+def test_missing_files_invalidate_entry(tmp_path):
+    cache = RunResultCache()
+    key = make_run_key("api", "q", "fast", "m")
+    entry = _entry(key, tmp_path)
+    cache.put(entry)
+    (tmp_path / "report.pdf").unlink()
+    assert cache.get(key) is None
+
+
+def test_invalidate_by_topic(tmp_path):
+    cache = RunResultCache()
+    cache.put(_entry(make_run_key("api", "a", "fast", "m"), tmp_path))
+    cache.put(_entry(make_run_key("cloud", "b", "fast", "m"), tmp_path))
+
+    assert cache.invalidate(topic_key="api") == 1
+    assert len(cache) == 1
+    assert cache.invalidate() == 1
@@ -0,0 +1,100 @@
+import threading
+import time
+
+import pytest
+
+from src.advanced_agent.api.scheduler import QueueFull, ResearchScheduler
+
+
+def _blocker(scheduler):
+    """Occupy the single worker until the returned event is set."""
+    release = threading.Event()
+    started = threading.Event()
+
+    def job():
+        started.set()
+        release.wait(5)
+
+    scheduler.submit(job)
+    assert started.wait(2)
+    return release
+
+
+def _wait_until(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_concurrency_is_bounded_by_workers():
+    scheduler = ResearchScheduler(workers=2, queue_max=10)
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0, "done": 0}
+
+    def job():
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+        time.sleep(0.1)
+        with lock:
+            state["running"] -= 1
+            state["done"] += 1
+
+    for _ in range(5):
+        scheduler.submit(job)
+    _wait_until(lambda: state["done"] == 5)
+
+    assert state["peak"] == 2
+    metrics = scheduler.metrics()
+    assert metrics["completed"] == 5 and metrics["queue_depth"] == {"fast": 0, "deep": 0}
+    assert metrics["wait"]["fast"]["max_s"] > 0.05
+
+
+def test_fast_lane_goes_first_and_deep_ages_in():
+    for deep_max_wait_s, expected in ((60.0, ["fast", "deep"]), (0.0, ["deep", "fast"])):
+        scheduler = ResearchScheduler(workers=1, queue_max=10, deep_max_wait_s=deep_max_wait_s)
+        release = _blocker(scheduler)
+        order = []
+        scheduler.submit(lambda: order.append("deep"), lane="deep")
+        scheduler.submit(lambda: order.append("fast"), lane="fast")
+        release.set()
+        _wait_until(lambda: len(order) == 2)
+        assert order == expected
+
+
+def test_full_queue_rejects():
+    scheduler = ResearchScheduler(workers=1, queue_max=1)
+    release = _blocker(scheduler)
+
+    scheduler.submit(lambda: None)
+    assert scheduler.is_full()
+    with pytest.raises(QueueFull):
+        scheduler.submit(lambda: None)
+    assert scheduler.metrics()["rejected"] == 1
+    release.set()
+
+
+def test_waiting_jobs_hear_their_position():
+    scheduler = ResearchScheduler(workers=1, queue_max=10)
+    release = _blocker(scheduler)
+    positions = {"a": [], "b": []}
+
+    scheduler.submit(lambda: None, on_position=positions["a"].append)
+    scheduler.submit(lambda: None, on_position=positions["b"].append)
+    assert positions == {"a": [1], "b": [2]}
+
+    release.set()
+    _wait_until(lambda: positions["b"][-1:] == [0])
+    assert positions["a"] == [1, 0]
+    assert positions["b"] == [2, 1, 0]
+
+
+def test_idle_workers_do_not_report_a_queue():
+    scheduler = ResearchScheduler(workers=2, queue_max=10)
+    positions = []
+    done = threading.Event()
+
+    scheduler.submit(done.set, on_position=positions.append)
+    assert done.wait(2)
+    assert positions == [0]
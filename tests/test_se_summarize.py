@@ -0,0 +1,57 @@
+import time
+from types import SimpleNamespace
+
+from src.advanced_agent.topics.software_engineering.base_models import (
+    BaseSoftwareEngResourceSummary,
+    BaseSoftwareEngState,
+)
+from src.advanced_agent.topics.software_engineering.base_workflow import BaseSoftwareEngWorkflow
+
+CALL_SECONDS = 0.2
+
+
+class SlowLLM:
+    def __init__(self):
+        self.calls = 0
+
+    def invoke(self, messages):
+        self.calls += 1
+        time.sleep(CALL_SECONDS)
+        content = messages[-1]["content"]
+        snippet_id = content.split("about ")[1].split()[0]
+        return SimpleNamespace(content=f"- Contract tests\n- Point {snippet_id}")
+
+
+def _state(n):
+    urls = [f"https://site{i}.dev/post" for i in range(n)]
+    return BaseSoftwareEngState(
+        query="api testing",
+        aggregated_markdown="corpus",
+        resources=[BaseSoftwareEngResourceSummary(title=f"Post {i}", url=u) for i, u in enumerate(urls)],
+        resource_snippets={u: f"about r{i} testing" for i, u in enumerate(urls)},
+    )
+
+
+def test_each_resource_gets_its_own_key_points_in_parallel():
+    wf = BaseSoftwareEngWorkflow()
+    wf.llm = SlowLLM()
+
+    start = time.perf_counter()
+    result = wf.step_3_summarize(_state(4))
+    elapsed = time.perf_counter() - start
+
+    assert [r.key_points[1] for r in result.resources] == ["Point r0", "Point r1", "Point r2", "Point r3"]
+    # shared point ranks first in the reduced keywords
+    assert result.extracted_keywords[0] == "Contract tests"
+    assert len(result.extracted_keywords) == 5
+    assert elapsed < 2 * CALL_SECONDS
+
+
+def test_resource_summaries_are_cached():
+    wf = BaseSoftwareEngWorkflow()
+    wf.llm = SlowLLM()
+
+    wf.step_3_summarize(_state(3))
+    wf.step_3_summarize(_state(3))
+
+    assert wf.llm.calls == 3
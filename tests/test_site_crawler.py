@@ -0,0 +1,79 @@
+from src.advanced_agent.site_crawler import TargetedCrawler, _site_root, classify_url, relevant_sections
+
+LANDING = """
+# Acme
+[Pricing](/pricing) [Docs](https://docs.acme.dev/start) [Blog](/blog/planning)
+[Features](https://www.acme.dev/features/) [Other](https://elsewhere.com/pricing)
+"""
+
+PRICING_PAGE = """
+# Plans
+Our story is long and irrelevant.
+Free tier for hobby projects
+Pro: $20 per user / month
+Enterprise: contact sales
+"""
+
+
+class FakeFirecrawl:
+    def __init__(self):
+        self.fetched = []
+        self.mapped = []
+
+    def scrape_markdown(self, url):
+        self.fetched.append(url)
+        return {"markdown": PRICING_PAGE if "pricing" in url else "# Docs\nInstall the SDK\nmisc"}
+
+    def map_site(self, url, search=None, limit=30):
+        self.mapped.append(url)
+        return ["https://acme.dev/pricing"]
+
+
+def test_classify_url():
+    assert classify_url("https://acme.dev/pricing") == "pricing"
+    assert classify_url("https://docs.acme.dev/") == "docs"
+    assert classify_url("https://acme.dev/blog/planning") is None
+
+
+def test_site_root_respects_public_suffixes():
+    assert _site_root("docs.acme.dev") == "acme.dev"
+    assert _site_root("www.acme.co.uk") == "acme.co.uk"
+    assert _site_root("shop.acme.com.au:443") == "acme.com.au"
+    assert _site_root("acme.github.io") == "acme.github.io"
+    assert _site_root("acme.co") == "acme.co"
+
+
+def test_crawl_stays_on_cctld_site():
+    fc = FakeFirecrawl()
+    landing = "[Pricing](https://other.co.uk/pricing) [Docs](https://docs.acme.co.uk/)"
+
+    pages = TargetedCrawler(fc, max_pages=3).crawl("https://www.acme.co.uk", landing)
+
+    assert fc.fetched == ["https://docs.acme.co.uk/"]
+    assert [p.kind for p in pages] == ["docs"]
+
+
+def test_relevant_sections_keeps_price_lines_within_budget():
+    section = relevant_sections("pricing", PRICING_PAGE, max_chars=70)
+
+    assert "$20 per user" in section
+    assert "irrelevant" not in section
+    assert len(section) <= 70
+
+
+def test_crawl_respects_page_budget_and_site():
+    fc = FakeFirecrawl()
+    pages = TargetedCrawler(fc, max_pages=2, max_chars=400).crawl("https://acme.dev", LANDING)
+
+    assert [p.kind for p in pages] == ["pricing", "features"]
+    assert sorted(fc.fetched) == ["https://acme.dev/pricing", "https://www.acme.dev/features/"]
+    assert fc.mapped == []  # links came from the landing page
+    assert "$20" in pages[0].content
+
+
+def test_crawl_falls_back_to_site_map():
+    fc = FakeFirecrawl()
+    pages = TargetedCrawler(fc, max_pages=3).crawl("https://acme.dev", "no links here")
+
+    assert fc.mapped == ["https://acme.dev"]
+    assert [p.url for p in pages] == ["https://acme.dev/pricing"]
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+import time
+
+from src.advanced_agent.api.sse import SSEChannel
+
+
+async def _collect(channel):
+    return [event async for event in channel.events()]
+
+
+def test_worker_blocks_when_queue_is_full_then_resumes():
+    async def main():
+        channel = SSEChannel(asyncio.get_running_loop(), maxsize=2)
+        produced = []
+
+        def worker():
+            for i in range(5):
+                channel.put({"type": "log", "message": str(i)})
+                produced.append(i)
+            channel.close()
+
+        threading.Thread(target=worker, daemon=True).start()
+        await asyncio.sleep(0.2)
+        # Backpressure: only what fits in the queue (plus one in flight) was produced.
+        assert len(produced) <= 3
+
+        events = await _collect(channel)
+        assert [e for e in events if e.startswith("data:")] == [
+            f'data: {{"type": "log", "message": "{i}"}}\n\n' for i in range(5)
+        ]
+
+    asyncio.run(main())
+
+
+def test_heartbeat_while_idle():
+    async def main():
+        channel = SSEChannel(asyncio.get_running_loop(), heartbeat_s=0.05)
+        threading.Timer(0.2, channel.close).start()
+        events = await _collect(channel)
+        assert events and all(e == ": heartbeat\n\n" for e in events)
+
+    asyncio.run(main())
+
+
+def test_disconnect_unblocks_producer():
+    async def main():
+        channel = SSEChannel(asyncio.get_running_loop(), maxsize=1)
+        results = []
+
+        def worker():
+            for _ in range(3):
+                results.append(channel.put({"type": "log", "message": "x"}, timeout=5))
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        stream = channel.events()
+        await stream.__anext__()
+        await stream.aclose()  # what Starlette does when the client goes away
+
+        await asyncio.to_thread(thread.join, 2)
+        assert not thread.is_alive()
+        assert results[-1] is False
+
+    asyncio.run(main())
+
+
+def test_one_loop_holds_hundreds_of_streams():
+    async def main():
+        loop = asyncio.get_running_loop()
+        channels = [SSEChannel(loop) for _ in range(300)]
+
+        def worker(channel):
+            time.sleep(0.3)
+            channel.put({"type": "final"}, timeout=None)
+            channel.close()
+
+        for channel in channels:
+            threading.Thread(target=worker, args=(channel,), daemon=True).start()
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(_collect(c) for c in channels))
+        assert time.perf_counter() - start < 2.0
+        assert all(r == ['data: {"type": "final"}\n\n'] for r in results)
+
+    asyncio.run(main())
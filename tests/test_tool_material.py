@@ -0,0 +1,128 @@
+from types import SimpleNamespace
+
+from src.advanced_agent.firecrawl import FirecrawlService
+from src.advanced_agent.topics.career.base_workflow import CareerBaseWorkflow
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+
+class FakeApp:
+    def __init__(self):
+        self.scrapes = []
+
+    def scrape(self, url, formats):
+        self.scrapes.append(tuple(formats))
+        return {"markdown": "page", "branding": {"colors": {"primary": "#000"}}}
+
+
+def test_branding_fetch_reuses_cached_full_scrape():
+    service = FirecrawlService()
+    service.app = FakeApp()
+
+    service.scrape_branding("https://a.com")
+    service.scrape_company_pages("https://b.com")
+    service.scrape_branding("https://b.com")
+
+    assert service.app.scrapes == [("branding",), ("markdown", "branding", "images")]
+
+
+class FakeFirecrawl:
+    def __init__(self, search_markdown):
+        self.search_markdown = search_markdown
+        self.calls = []
+
+    def search_companies(self, query, num_results=5):
+        self.calls.append("search")
+        return [SimpleNamespace(url="https://tool.dev", markdown=self.search_markdown, metadata=None)]
+
+    def scrape_company_pages(self, url):
+        self.calls.append("full")
+        return {"markdown": "scraped page", "branding": {"colors": {"primary": "#111"}}}
+
+    def scrape_branding(self, url):
+        self.calls.append("branding")
+        return {"branding": {"colors": {"primary": "#222"}}}
+
+
+def _workflow(cls, search_markdown):
+    wf = cls()
+    wf.firecrawl = FakeFirecrawl(search_markdown)
+    wf.profile_store = None
+    wf.website_index = None
+    return wf
+
+
+def test_search_markdown_is_reused_with_branding_only_fetch():
+    wf = _workflow(DeveloperToolsWorkflow, "search page markdown")
+
+    company, content = wf._collect_tool_material("Tool")
+
+    assert wf.firecrawl.calls == ["search", "branding"]
+    assert content == "search page markdown"
+    assert company.primary_color == "#222"
+
+
+def test_full_scrape_when_search_has_no_markdown():
+    wf = _workflow(DeveloperToolsWorkflow, None)
+
+    _, content = wf._collect_tool_material("Tool")
+
+    assert wf.firecrawl.calls == ["search", "full"]
+    assert content == "scraped page"
+
+
+def test_career_research_uses_branding_only_fetch():
+    wf = _workflow(CareerBaseWorkflow, "search page markdown")
+    wf._analyze_company_content = lambda name, content: wf.analysis_cls(description=content)
+
+    company = wf._research_single_tool("Tool")
+
+    assert wf.firecrawl.calls == ["search", "branding"]
+    assert company.description == "search page markdown"
+
+
+class ScoringLLM:
+    def __init__(self, scores):
+        self.scores = scores
+        self.prompts = []
+
+    def with_structured_output(self, schema):
+        llm = self
+
+        class _Structured:
+            def invoke(self, messages):
+                llm.prompts.append(messages[-1].content)
+                return schema(scores=[{"name": n, "relevance": r} for n, r in llm.scores.items()])
+
+        return _Structured()
+
+
+def test_triage_picks_top_k_by_snippet_score():
+    wf = _workflow(DeveloperToolsWorkflow, None)
+    wf.deep_research_top_k = 2
+    wf.triage_llm = ScoringLLM({"A": 3, "B": 9, "C": 0, "D": 7})
+    corpus = "Articles say B is the leading IDE for Python. D is popular too."
+
+    picked = wf._select_tools_for_deep_research("python ide", ["A", "B", "C", "D", "B"], corpus)
+
+    assert picked == ["B", "D"]
+    assert "B is the leading IDE" in wf.triage_llm.prompts[0]
+
+
+def test_triage_is_skipped_when_few_candidates():
+    wf = _workflow(DeveloperToolsWorkflow, None)
+    wf.triage_llm = None  # would raise if used
+
+    assert wf._select_tools_for_deep_research("q", ["A", "B"], "") == ["A", "B"]
+
+
+def test_triage_llm_follows_selected_provider():
+    wf = _workflow(DeveloperToolsWorkflow, None)
+    other = DeveloperToolsWorkflow()
+    # One shared client for the small OpenAI triage model.
+    assert wf.triage_llm is other.triage_llm
+
+    wf.set_llm("claude-sonnet-4-5", 0.1)
+    assert wf.triage_llm is wf.llm
+
+    wf.set_llm("gpt-4o-mini", 0.1)
+    assert wf.triage_llm is other.triage_llm
@@ -0,0 +1,150 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from src.advanced_agent.api import deps
+from src.advanced_agent.api.topic_classifier import (
+    LocalTopicClassifier,
+    TopicPrediction,
+    description_examples,
+)
+
+TOPICS = {
+    "database": SimpleNamespace(
+        label="Databases",
+        description=(
+            "Relational and NoSQL databases, data warehouses and query engines. "
+            "Typical questions: 'Postgres vs MySQL?', 'Best database for time series?'. "
+            "Do NOT use this for hosting or cloud provider questions, route to Cloud instead."
+        ),
+    ),
+    "cloud": SimpleNamespace(
+        label="Cloud Platforms",
+        description=(
+            "Cloud providers and hosting platforms for deploying applications. "
+            "Typical questions: 'AWS vs GCP?', 'Where to host a Docker container?'."
+        ),
+    ),
+}
+
+
+def test_description_examples_skip_redirecting_sentences():
+    examples = description_examples(TOPICS["database"].label, TOPICS["database"].description)
+
+    assert "Postgres vs MySQL?" in examples
+    assert "Best database for time series?" in examples
+    assert not any("hosting" in e for e in examples)
+
+
+def test_predicts_from_descriptions(tmp_path):
+    clf = LocalTopicClassifier(TOPICS, log_path=tmp_path / "routes.json")
+
+    prediction = clf.predict("which database is best for time series data")
+
+    assert prediction.key == "database"
+    assert prediction.runner_up == "cloud"
+    assert prediction.confidence > prediction.runner_up_confidence
+
+
+def test_recorded_routes_are_learned_on_refit(tmp_path):
+    clf = LocalTopicClassifier(TOPICS, log_path=tmp_path / "routes.json", refit_every=1)
+    query = "kubernetes autoscaling for a bursty workload"
+    assert clf.predict(query).confidence < 0.9
+
+    refit = clf.record(query, "cloud")
+    refit.join(timeout=30)
+
+    assert clf.predict(query).key == "cloud"
+    assert clf.predict(query).confidence >= 0.9
+    # Persisted for the next process
+    assert "kubernetes" in (tmp_path / "routes.json").read_text(encoding="utf-8")
+
+
+def test_refit_runs_in_background_one_at_a_time(tmp_path, monkeypatch):
+    clf = LocalTopicClassifier(TOPICS, log_path=tmp_path / "routes.json", refit_every=1)
+    clf.predict("warm up")
+    release = threading.Event()
+    fits = []
+
+    def slow_fit():
+        fits.append(1)
+        release.wait(timeout=5)
+
+    monkeypatch.setattr(clf, "fit", slow_fit)
+
+    first = clf.record("aws vs gcp", "cloud")
+    # Returns while the fit is still running, and a second trigger does not
+    # start another one.
+    assert first is not None and first.is_alive()
+    assert clf.record("where to host docker", "cloud") is None
+
+    release.set()
+    first.join(timeout=5)
+    assert fits == [1]
+
+
+def test_training_uses_only_the_most_recent_routes(tmp_path):
+    clf = LocalTopicClassifier(TOPICS, log_path=tmp_path / "routes.json", max_training_routes=2)
+    for i in range(5):
+        clf.record(f"query {i}", "cloud")
+
+    routes = [text for text, _ in clf.training_examples() if text.startswith("query")]
+
+    assert routes == ["query 3", "query 4"]
+
+
+def test_classify_topic_only_asks_llm_when_unsure(monkeypatch, tmp_path):
+    clf = LocalTopicClassifier(deps.TOPIC_CONFIGS, log_path=tmp_path / "routes.json")
+    monkeypatch.setattr(deps, "TOPIC_CLASSIFIER", clf)
+    llm_queries = []
+
+    def fake_llm(query):
+        llm_queries.append(query)
+        return "agile"
+
+    monkeypatch.setattr(deps, "_llm_topic_key", fake_llm)
+    clf.fit()
+
+    clf.confidence_threshold = 0.0
+    key, label, domain = deps.classify_topic("Best resources to prepare for system design interviews?")
+    assert (key, domain) == ("system_design", "career")
+    assert llm_queries == []
+
+    clf.confidence_threshold = 1.01
+    assert deps.classify_topic("some vague question")[0] == "agile"
+    assert llm_queries == ["some vague question"]
+    assert "some vague question" in (tmp_path / "routes.json").read_text(encoding="utf-8")
+
+
+def test_local_route_keeps_architecture_safety_net(monkeypatch, tmp_path):
+    clf = LocalTopicClassifier(deps.TOPIC_CONFIGS, log_path=tmp_path / "routes.json")
+    clf.confidence_threshold = 0.0
+    monkeypatch.setattr(deps, "TOPIC_CLASSIFIER", clf)
+    monkeypatch.setattr(clf, "predict_if_ready", lambda q: TopicPrediction("system_design", 0.9, "agile", 0.05))
+
+    assert deps.classify_topic("system design for 10k rps with kafka")[0] == "architecture_design"
+
+
+def test_cold_classifier_escalates_to_llm_and_fits_in_background(monkeypatch, tmp_path):
+    clf = LocalTopicClassifier(deps.TOPIC_CONFIGS, log_path=tmp_path / "routes.json")
+    monkeypatch.setattr(deps, "TOPIC_CLASSIFIER", clf)
+    monkeypatch.setattr(deps, "_llm_topic_key", lambda query: "agile")
+    release = threading.Event()
+    real_fit = clf.fit
+
+    def slow_fit():
+        release.wait(timeout=5)
+        real_fit()
+
+    monkeypatch.setattr(clf, "fit", slow_fit)
+
+    # Answered by the LLM while the first fit is still waiting.
+    assert deps.classify_topic("how do we run sprint retrospectives")[0] == "agile"
+    assert clf.predict_if_ready("anything") is None
+
+    release.set()
+    for _ in range(100):
+        if clf.predict_if_ready("anything") is not None:
+            break
+        time.sleep(0.05)
+    assert clf.predict_if_ready("which database for time series") is not None
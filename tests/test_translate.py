@@ -29,3 +29,69 @@ def test_translate_text(monkeypatch):
 
     result = translate_text("hello world", "Chinese")
     assert result == "翻译后的文字"
+
+
+def test_translate_batch_uses_one_call(monkeypatch):
+    from src.advanced_agent.api import translate as translate_module
+
+    calls = []
+
+    class BatchLLM:
+        def invoke(self, messages):
+            calls.append(messages)
+
+            class R:
+                content = '```json\n["你好", "世界"]\n```'
+            return R()
+
+    monkeypatch.setattr(translate_module, "translator_llm", BatchLLM())
+    assert translate_module.translate_batch(["hello", "world"], "Chinese") == ["你好", "世界"]
+    assert len(calls) == 1
+
+
+def test_translate_batch_falls_back_per_line(monkeypatch):
+    from src.advanced_agent.api import translate as translate_module
+
+    monkeypatch.setattr(translate_module, "translator_llm", FakeLLM("not json"))
+    assert translate_module.translate_batch(["a", "b"], "Chinese") == ["not json", "not json"]
+
+
+def test_translate_text_reuses_remembered_paragraphs(monkeypatch):
+    from src.advanced_agent.api import translate as translate_module
+
+    calls = []
+
+    class EchoLLM:
+        def invoke(self, messages):
+            calls.append(messages[-1].content)
+
+            class R:
+                content = "译文"
+            return R()
+
+    monkeypatch.setattr(translate_module, "translator_llm", EchoLLM())
+    assert translate_text("hello world", "Chinese") == "译文"
+    assert translate_text("  hello   world ", "Chinese") == "译文"
+    assert calls == ["hello world"]
+
+
+def test_translate_text_mismatched_batch_costs_one_more_call(monkeypatch):
+    from src.advanced_agent.api import translate as translate_module
+
+    calls = []
+
+    class MergingLLM:
+        def invoke(self, messages):
+            calls.append(messages[-1].content)
+
+            class R:
+                # First the JSON batch (merged into one item), then the joined document.
+                content = '["第一段 第二段"]' if len(calls) == 1 else "第一段\n\n第二段\n\n第三段"
+            return R()
+
+    monkeypatch.setattr(translate_module, "translator_llm", MergingLLM())
+    report = "First paragraph.\n\nSecond paragraph.\n\nThird paragraph."
+
+    assert translate_text(report, "Chinese") == "第一段\n\n第二段\n\n第三段"
+    assert len(calls) == 2
+    assert calls[-1] == report
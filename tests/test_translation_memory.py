@@ -0,0 +1,141 @@
+import pytest
+
+from src.advanced_agent.api.translation_memory import SegmentMismatch, TranslationMemory, split_segments
+
+REPORT = """# Best Python IDEs
+
+PyCharm is a full IDE.
+
+```python
+print("a")
+
+print("b")
+```
+
+---
+
+VS Code is a lightweight editor."""
+
+
+class CountingTranslator:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, texts, target_lang):
+        self.calls.append(list(texts))
+        return [f"<{target_lang}>{t}" for t in texts]
+
+
+def test_split_segments_round_trips_and_keeps_code_blocks_whole():
+    segments = split_segments(REPORT)
+    assert "".join(segments) == REPORT
+    assert '```python\nprint("a")\n\nprint("b")\n```' in segments
+
+
+def test_only_unseen_paragraphs_are_translated(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.json")
+    translator = CountingTranslator()
+
+    first = memory.translate(REPORT, "Chinese", translator)
+    assert first.startswith("<Chinese># Best Python IDEs\n\n<Chinese>PyCharm is a full IDE.")
+    assert "\n\n---\n\n" in first
+    assert len(translator.calls) == 1
+
+    edited = REPORT.replace("lightweight editor", "free editor")
+    second = memory.translate(edited, "Chinese", translator)
+    assert translator.calls[-1] == ["VS Code is a free editor."]
+    assert second.endswith("<Chinese>VS Code is a free editor.")
+
+    # Another language is its own memory.
+    memory.translate("PyCharm is a full IDE.", "Japanese", translator)
+    assert translator.calls[-1] == ["PyCharm is a full IDE."]
+
+    metrics = memory.metrics()
+    assert metrics["hits"] == 3 and metrics["misses"] == 6
+
+
+def test_memory_persists_across_instances(tmp_path):
+    path = tmp_path / "tm.json"
+    translator = CountingTranslator()
+    memory = TranslationMemory(path)
+    memory.translate_many(["Developer Tools"], "Chinese", translator)
+    memory.flush()
+
+    reloaded = TranslationMemory(path)
+    assert reloaded.translate_many(["Developer  Tools "], "Chinese", translator) == ["<Chinese>Developer Tools"]
+    assert len(translator.calls) == 1
+
+
+def test_least_recently_used_entries_are_evicted_by_size(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.json", max_bytes=40)
+    translator = CountingTranslator()
+
+    memory.translate_many(["alpha"], "Chinese", translator)
+    memory.translate_many(["beta"], "Chinese", translator)
+    memory.translate_many(["alpha"], "Chinese", translator)  # alpha is now most recent
+    memory.translate_many(["gamma"], "Chinese", translator)  # over budget: beta goes
+
+    assert memory.metrics()["evictions"] == 1
+    assert memory.metrics()["bytes"] <= 40
+    memory.translate_many(["alpha", "beta"], "Chinese", translator)
+    assert translator.calls[-1] == ["beta"]
+
+
+def test_writes_are_debounced_off_the_translating_thread(tmp_path):
+    path = tmp_path / "tm.json"
+    memory = TranslationMemory(path, save_interval_s=60)
+    translator = CountingTranslator()
+
+    memory.translate_many(["alpha"], "Chinese", translator)
+    memory.translate_many(["beta"], "Chinese", translator)
+    assert not path.exists()
+
+    memory.flush()
+    assert "<Chinese>beta" in path.read_text(encoding="utf-8")
+
+
+class MergingTranslator:
+    """Batch replies never line up; documents are translated as a whole."""
+
+    def __init__(self, merge_documents=False):
+        self.merge_documents = merge_documents
+        self.batches = 0
+        self.documents = []
+
+    def batch(self, texts, target_lang):
+        self.batches += 1
+        raise SegmentMismatch("merged paragraphs")
+
+    def document(self, text, target_lang):
+        self.documents.append(text)
+        if self.merge_documents:
+            return f"<{target_lang}>" + " ".join(text.split())
+        return "\n\n".join(f"<{target_lang}>{p}" for p in text.split("\n\n"))
+
+
+def test_mismatched_batch_translates_unseen_paragraphs_as_one_document(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.json")
+    translator = MergingTranslator()
+    text = "One.\n\nTwo.\n\nThree."
+
+    assert memory.translate(text, "Chinese", translator.batch, translator.document) == (
+        "<Chinese>One.\n\n<Chinese>Two.\n\n<Chinese>Three."
+    )
+    assert translator.documents == ["One.\n\nTwo.\n\nThree."]
+
+    # Split back per paragraph, so the paragraphs are remembered.
+    memory.translate("Two.\n\nFour.", "Chinese", translator.batch, translator.document)
+    assert translator.documents[-1] == "Four."
+
+
+def test_unsplittable_reply_falls_back_to_whole_document(tmp_path):
+    memory = TranslationMemory(tmp_path / "tm.json")
+    translator = MergingTranslator(merge_documents=True)
+
+    result = memory.translate("One.\n\nTwo.", "Chinese", translator.batch, translator.document)
+
+    assert result == "<Chinese>One. Two."
+    assert len(translator.documents) == 2
+    assert len(memory) == 0
+    with pytest.raises(SegmentMismatch):
+        memory.translate("One.\n\nTwo.", "Chinese", translator.batch)
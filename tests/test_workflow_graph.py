@@ -0,0 +1,90 @@
+import time
+
+from src.advanced_agent.topics.career.job_search.workflow import JobSearchWorkflow
+from src.advanced_agent.topics.knowledge_extraction import KnowledgeExtractionResult
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+# Research is the long step; knowledge extraction has to overlap it, not
+# just the short tool extraction before it.
+EXTRACT_TOOLS_SECONDS = 0.1
+RESEARCH_SECONDS = 0.6
+KNOWLEDGE_SECONDS = 0.5
+# extract + research; a fan-out that only overlaps extraction takes 1.1s.
+OVERLAPPED_SECONDS = EXTRACT_TOOLS_SECONDS + RESEARCH_SECONDS
+
+
+class TimedToolsWorkflow(DeveloperToolsWorkflow):
+    """
+    Replaces every network/LLM-bound step with a fixed sleep so only the graph
+    topology decides the wall time.
+    """
+
+    def _collect_articles_step(self, state):
+        return {"aggregated_markdown": "articles", "sources": []}
+
+    def _extract_tools_step(self, state):
+        time.sleep(EXTRACT_TOOLS_SECONDS)
+        return {"extracted_tools": ["VS Code"]}
+
+    def _research_tools_step(self, state):
+        assert state.extracted_tools == ["VS Code"]
+        time.sleep(RESEARCH_SECONDS)
+        return {"companies": [self.company_model(name="VS Code", description="", website="")]}
+
+    def _extract_knowledge_step(self, state):
+        time.sleep(KNOWLEDGE_SECONDS)
+        return {"knowledge": KnowledgeExtractionResult()}
+
+    def _compare_and_recommend_step(self, state):
+        # The join must see both branches.
+        assert state.companies and state.knowledge is not None
+        return {}
+
+
+def test_knowledge_extraction_runs_alongside_tool_research():
+    wf = TimedToolsWorkflow()
+
+    start = time.perf_counter()
+    result = wf.run("python ide", fast_mode=False)
+    elapsed = time.perf_counter() - start
+
+    assert [c.name for c in result.companies] == ["VS Code"]
+    assert result.extracted_tools == ["VS Code"]
+    assert result.knowledge is not None
+    # The knowledge step is hidden entirely behind extract + research.
+    assert elapsed < OVERLAPPED_SECONDS + 0.25
+
+
+class TimedCareerWorkflow(JobSearchWorkflow):
+    def _collect_articles_step(self, state):
+        return {"aggregated_markdown": "articles", "sources": []}
+
+    def _extract_tools_step(self, state):
+        time.sleep(EXTRACT_TOOLS_SECONDS)
+        return {"extracted_tools": ["LinkedIn"]}
+
+    def _research_step(self, state):
+        assert state.extracted_tools == ["LinkedIn"]
+        time.sleep(RESEARCH_SECONDS)
+        return {"companies": [self.info_cls(name="LinkedIn", description="", website="")]}
+
+    def _extract_knowledge_step(self, state):
+        time.sleep(KNOWLEDGE_SECONDS)
+        return {"knowledge": KnowledgeExtractionResult()}
+
+    def _analyze_step(self, state):
+        assert state.companies and state.knowledge is not None
+        return {}
+
+
+def test_career_knowledge_extraction_runs_alongside_research():
+    wf = TimedCareerWorkflow()
+
+    start = time.perf_counter()
+    result = wf.run("remote job boards", fast_mode=False)
+    elapsed = time.perf_counter() - start
+
+    assert [c.name for c in result.companies] == ["LinkedIn"]
+    assert result.extracted_tools == ["LinkedIn"]
+    assert result.knowledge is not None
+    assert elapsed < OVERLAPPED_SECONDS + 0.25
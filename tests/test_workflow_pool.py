@@ -0,0 +1,105 @@
+import threading
+import time
+
+import pytest
+
+from src.advanced_agent.api.workflow_pool import PoolTimeout, TopicWorkflowPools, WorkflowPool
+from src.advanced_agent.topics.software_engineering.agile import AgileWorkflow
+from src.advanced_agent.topics.tools.developer_tools.workflow import DeveloperToolsWorkflow
+
+
+class Spawnable:
+    spawned = 0
+
+    def spawn(self):
+        Spawnable.spawned += 1
+        return Spawnable()
+
+
+def test_pool_grows_to_max_size_then_waits():
+    pool = WorkflowPool(Spawnable(), max_size=2)
+
+    a = pool.acquire()
+    b = pool.acquire()
+    assert a is not b and pool.size == 2 and pool.in_use == 2
+    assert pool.would_wait()
+
+    threading.Timer(0.2, pool.release, args=(a,)).start()
+    c = pool.acquire(timeout=2)
+
+    assert c is a
+    metrics = pool.metrics()
+    assert metrics["size"] == 2 and metrics["peak_in_use"] == 2
+    assert metrics["checkouts"] == 3 and metrics["waits"] == 1
+    assert metrics["wait_histogram"]["<=0.5s"] == 1
+    assert 0.0 < metrics["mean_wait_s"]
+
+
+def test_pool_timeout():
+    pool = WorkflowPool(Spawnable(), max_size=1)
+    with pool.checkout():
+        with pytest.raises(PoolTimeout):
+            pool.acquire(timeout=0.05)
+    assert pool.metrics()["timeouts"] == 1
+    assert pool.in_use == 0
+
+
+def test_objects_without_spawn_are_not_duplicated():
+    pool = WorkflowPool(object(), max_size=4)
+    assert pool.max_size == 1
+
+
+def test_topic_pools_reset_when_prototype_changes():
+    pools = TopicWorkflowPools(max_size=3)
+    first = Spawnable()
+
+    assert pools.pool("ai_ml", first) is pools.pool("ai_ml", first)
+    assert pools.pool("ai_ml", Spawnable()).prototype is not first
+    assert set(pools.metrics()) == {"ai_ml"}
+
+
+def test_spawned_workflows_share_clients_but_not_run_state():
+    for wf in (DeveloperToolsWorkflow(), AgileWorkflow()):
+        clone = wf.spawn()
+        wf.set_log_callback(lambda msg: None)
+
+        assert clone.firecrawl is wf.firecrawl
+        assert clone.prompts is wf.prompts
+        assert clone.workflow is not wf.workflow
+        assert clone._log_callback is None
+
+        clone.set_llm("gpt-4.1-mini", 0.3)
+        assert clone.llm is not wf.llm
+
+
+class SlowToolsWorkflow(DeveloperToolsWorkflow):
+    def _collect_articles_step(self, state):
+        time.sleep(0.3)
+        return {"aggregated_markdown": "", "sources": []}
+
+    def _extract_tools_step(self, state):
+        return {"extracted_tools": []}
+
+    def _research_tools_step(self, state):
+        return {"companies": []}
+
+    def _compare_and_recommend_step(self, state):
+        return {}
+
+
+def test_hot_topic_serves_concurrent_runs():
+    pool = WorkflowPool(SlowToolsWorkflow(), max_size=3)
+
+    def run():
+        with pool.checkout() as wf:
+            wf.run("python ide", fast_mode=True)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=run) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert time.perf_counter() - start < 0.8
+    assert pool.metrics()["peak_in_use"] == 3